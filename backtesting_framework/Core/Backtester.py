@@ -1,9 +1,21 @@
+import itertools
+import os
+import numpy as np
 import pandas as pd
 from tqdm import tqdm
 from backtesting_framework.Core.Strategy import Strategy
 from backtesting_framework.Core.Result import Result
 from backtesting_framework.Core.Calendar import Calendar
-from backtesting_framework.Utils.Tools import load_data
+from backtesting_framework.Core.DataCleaner import DataCleaner
+from backtesting_framework.Core.CostModel import CostModel
+from backtesting_framework.Core.Profiler import Profiler
+from backtesting_framework.Core.ResultCache import ResultCache
+from backtesting_framework.Core.RunStats import RunStats
+from backtesting_framework.Core.SparseWeights import SparseWeights
+from backtesting_framework.Core.WeightScheme import get_weight_scheme
+from backtesting_framework.Utils.Tools import (append_pickle, data_fingerprint, from_record_batch, iter_pickle,
+                                              load_data, load_pickle, object_fingerprint, read_arrow, save_pickle,
+                                              to_record_batch, truncate_pickle, write_arrow)
 
 
 class Backtester:
@@ -21,60 +33,139 @@ class Backtester:
             slippage=0.0,
             risk_free_rate=0.0,
             rebalancing_frequency='monthly',
-            plot_library="matplotlib"
+            plot_library="matplotlib",
+            data_cleaner: DataCleaner = None,
+            cost_model: CostModel = None,
+            accounting: str = "target",
+            sparse_weights: bool = False,
+            result_cache=None,
+            verbose: bool = True,
+            hooks=None
     ):
         """
         Initialise l'objet Backtester.
 
         :param data_source: Fichier CSV ou DataFrame Pandas contenant les données à backtester.
-        :param weight_scheme: Schéma de pondération à utiliser ('EqualWeight' ou 'MarketCapWeight'). Par défaut 'EqualWeight'.
+        :param weight_scheme: Schéma de pondération à utiliser : nom ('EqualWeight', 'MarketCapWeight',
+                              'CappedMarketCapWeight', 'InverseVolatilityWeight', 'EqualRiskContribution')
+                              ou instance de WeightScheme. Par défaut 'EqualWeight'.
         :param market_cap_source: Chemin vers le fichier CSV des capitalisations boursières.
-                                  Requis si weight_scheme='MarketCapWeight'.
+                                  Requis si le schéma de pondération utilise les capitalisations boursières.
         :param special_start: Indice à partir duquel le backtest commence (pour ignorer un certain historique initial).
         :param transaction_cost: Montant des coûts de transaction par rebalancement (par défaut : 0.0).
         :param slippage: Montant des coûts de slippage (exécution différente de l'ordre) par rebalancement (par défaut : 0.0).
         :param risk_free_rate: Taux sans risque du marché (annualisé, par défaut : 0.0).
         :param rebalancing_frequency: Fréquence de rebalancement ('monthly', 'weekly', etc.).
         :param plot_library: Bibliothèque d'affichage à utiliser (par défaut : "matplotlib").
+        :param data_cleaner: Instance de DataCleaner appliquée une seule fois aux données de marché (optionnel).
+        :param cost_model: Modèle de coûts (spread, impact de marché, etc.) appliqué à la variation des pondérations,
+                           en plus de transaction_cost et slippage (optionnel).
+        :param accounting: Comptabilité du portefeuille : 'target' (pondérations ramenées à la cible chaque jour,
+                           par défaut) ou 'drift' (positions qui dérivent avec les prix entre deux rebalancements).
+        :param sparse_weights: Si True, la composition et la matrice des pondérations sont construites et stockées
+                               sous forme d'événements de rebalancement (SparseWeights) au lieu de DataFrames
+                               denses, et les rendements sont calculés par segment entre deux événements
+                               (par défaut : False).
+        :param result_cache: Instance de ResultCache ou répertoire du cache disque dans lequel les résultats de run
+                             sont mémorisés par configuration (optionnel).
+        :param verbose: Si False, le Backtester n'affiche ni messages ni barres de progression (par défaut : True).
+        :param hooks: Liste de fonctions d'écoute hook(event, name, value) abonnées à l'instrumentation
+                      des backtests (voir RunStats, optionnel).
+        :raises ValueError: Si accounting n'est pas 'target' ou 'drift'.
         """
-        print("Initialisation du Backtester...")
-        self.data = load_data(data_source)
+        self.verbose = verbose
+        # Instrumentation : durées du chargement des données et du calendrier, reprises par chaque backtest
+        self.run_stats = RunStats(hooks)
+        self.log("Initialisation du Backtester...")
+        with self.run_stats.stage("data_load"):
+            self.data = load_data(data_source)
         if self.data.empty:
             raise ValueError("Le DataFrame fourni est vide ou invalide.")
-        print("Données de marché chargées.")
+        self.log("Données de marché chargées.")
+
+        # Nettoyage unique des données et masque de validité partagé avec les stratégies
+        self.data_cleaner = data_cleaner
+        self.raw_tail = None
+        if data_cleaner is not None:
+            with self.run_stats.stage("data_cleaning"):
+                self.raw_tail = self.data.iloc[-self.cleaner_history():]
+                self.data, self.valid_mask = data_cleaner.clean(self.data)
+            self.log("Données de marché nettoyées.")
+        else:
+            self.valid_mask = self.data.notna()
         self.weight_scheme = weight_scheme
+        self.weighting = get_weight_scheme(weight_scheme)
         self.market_cap_source = market_cap_source
         self.special_start = special_start
         self.transaction_cost = transaction_cost
         self.slippage = slippage
+        self.cost_model = cost_model
+        if accounting not in ("target", "drift"):
+            raise ValueError("accounting doit valoir 'target' ou 'drift'.")
+        self.accounting = accounting
+        self.sparse_weights = sparse_weights
+        self.result_cache = ResultCache(result_cache) if isinstance(result_cache, str) else result_cache
         self.rfr = risk_free_rate
 
         # Charger et aligner les données de capitalisation boursière si nécessaire
-        if self.weight_scheme == 'MarketCapWeight':
-            print("Chargement des données de capitalisation boursière...")
+        if self.weighting.requires_market_caps:
+            self.log("Chargement des données de capitalisation boursière...")
             self.market_caps = None
-            self.load_market_caps()
-            print("Données de capitalisation boursière chargées.")
+            with self.run_stats.stage("market_caps_load"):
+                self.load_market_caps()
+            self.log("Données de capitalisation boursière chargées.")
 
         # Détermination des bornes pour le calendrier
         self.start_date = self.data.index[0].strftime('%Y-%m-%d')
         self.end_date = self.data.index[-1].strftime('%Y-%m-%d')
 
-        self.calendar = Calendar(
-            frequency=rebalancing_frequency,
-            start_date=self.start_date,
-            end_date=self.end_date
-        )
+        self.rebalancing_frequency = rebalancing_frequency
+        with self.run_stats.stage("calendar"):
+            self.calendar = Calendar(
+                frequency=rebalancing_frequency,
+                start_date=self.start_date,
+                end_date=self.end_date
+            )
+        self.init_timings = dict(self.run_stats.timings)
 
-        # Initialisation de la matrice de poids
+        # Initialisation de la matrice de poids et du cache des rendements des actifs
         self.weight_matrix = None
+        self._asset_returns = None
+
+        # État du dernier backtest, utilisé par update pour n'avancer que sur les nouvelles dates
+        self.state = None
+        self.raw_portfolio_returns = None
+        self.trade_state = None
+        self.trade_ledger = None
+        # Fichiers (.prof, .json) du dernier backtest profilé
+        self.profile_paths = None
         self.plot_library = plot_library
 
+    def log(self, message: str):
+        """
+        Affiche un message de progression, sauf en mode silencieux (verbose=False).
+
+        :param message: Message à afficher.
+        """
+        if self.verbose:
+            print(message)
+
+    def new_run_stats(self) -> RunStats:
+        """
+        Démarre l'instrumentation d'un nouveau backtest : les fonctions d'écoute et les durées de chargement
+        des données et du calendrier sont reprises.
+
+        :return: Instance de RunStats, également affectée à run_stats.
+        """
+        self.run_stats = RunStats(self.run_stats.hooks)
+        self.run_stats.timings.update(self.init_timings)
+        return self.run_stats
+
     def load_market_caps(self):
         """
         Charge les données de capitalisation boursière et les aligne avec les données de marché.
 
-        :raises ValueError: Si market_cap_source n'est pas fourni alors que weight_scheme='MarketCapWeight'.
+        :raises ValueError: Si market_cap_source n'est pas fourni alors que le schéma utilise les capitalisations.
         :raises ValueError: S'il n'y a aucune colonne commune entre les données de marché et les capitalisations boursières.
         """
         if self.market_cap_source is None:
@@ -94,33 +185,547 @@ class Backtester:
             )
         self.market_caps = self.market_caps[common_columns]
 
-    def run(self, strategy: Strategy, is_VT=False, target_vol=None):
+    @property
+    def asset_returns(self) -> pd.DataFrame:
+        """
+        Rendements quotidiens des actifs, calculés une seule fois puis partagés entre les schémas de pondération
+        et le calcul des rendements du portefeuille.
+
+        :return: DataFrame des rendements (dates x actifs), 0 pour la première date et les données manquantes.
+        """
+        if self._asset_returns is None:
+            self._asset_returns = self.data.pct_change().fillna(0)
+        return self._asset_returns
+
+    def run(self, strategy: Strategy, is_VT=False, target_vol=None, checkpoint_path: str = None,
+            checkpoint_every: int = 100, profile=None):
         """
         Exécute la stratégie donnée sur les données de marché.
 
         :param strategy: Instance de la classe Strategy définissant les signaux d'achat/vente.
         :param is_VT: Booléen indiquant si on souhaite activer le Vol Targeting (par défaut False).
         :param target_vol: Volatilité cible (annualisée). Optionnel si is_VT=True.
-        :return: Instance de la classe Result contenant les résultats du backtest.
-        """
-        print("Démarrage du backtest...")
-        composition_matrix = self.calculate_composition_matrix(strategy)
-        print("Matrice de composition calculée.")
-        self.weight_matrix = self.calculate_weight_matrix(composition_matrix)
-        print("Matrice des pondérations calculée.")
-        asset_contributions, portfolio_returns, cumulative_asset_returns, cumulative_returns, result_trade = \
-            self.calculate_returns(is_VT, target_vol)
-        print("Rendements calculés.")
-        result = Result(
-            portfolio_returns=portfolio_returns,
-            cumulative_returns=cumulative_returns,
-            risk_free_rate=self.rfr,
-            trade_stats=result_trade,
-            plot_library=self.plot_library
-        )
-        print("Backtest terminé.")
+        :param checkpoint_path: Fichier de reprise du calcul date par date de la composition (optionnel).
+                                S'il existe, le calcul reprend au dernier point de sauvegarde ; il est supprimé
+                                une fois la composition calculée.
+        :param checkpoint_every: Nombre de dates entre deux sauvegardes (par défaut : 100).
+        :param profile: Profilage du backtest (cProfile et pic de mémoire par étape) : True (répertoire 'profiles'),
+                        répertoire de sortie ou False. Par défaut, activé par la variable d'environnement
+                        BACKTEST_PROFILE ('1' ou répertoire). Les fichiers écrits sont listés dans profile_paths.
+        :return: Instance de la classe Result contenant les résultats du backtest (durées des étapes
+                 et compteurs dans result.run_stats).
+        """
+        profiler = Profiler.from_setting(profile)
+        if profiler is not None:
+            return self.profiled_run(profiler, strategy, is_VT, target_vol, checkpoint_path, checkpoint_every)
+
+        self.log("Démarrage du backtest...")
+        stats = self.new_run_stats()
+        cache_key = None
+        if self.result_cache is not None:
+            with stats.stage("cache"):
+                cache_key = self.result_cache.key(self, strategy, is_VT, target_vol)
+                cached = self.result_cache.get(cache_key)
+            if cached is not None:
+                self.log("Résultats lus dans le cache.")
+                return self.restore_cached_run(cached, strategy, is_VT, target_vol)
+
+        with stats.stage("composition"):
+            composition_matrix = self.calculate_composition_matrix(strategy, checkpoint_path=checkpoint_path,
+                                                                   checkpoint_every=checkpoint_every,
+                                                                   sparse=self.sparse_weights)
+        self.log("Matrice de composition calculée.")
+        with stats.stage("weights"):
+            self.weight_matrix = self.calculate_weight_matrix(composition_matrix)
+        self.log("Matrice des pondérations calculée.")
+        with stats.stage("returns"):
+            asset_contributions, portfolio_returns, cumulative_asset_returns, cumulative_returns, result_trade = \
+                self.calculate_returns(is_VT, target_vol)
+        self.log("Rendements calculés.")
+        self.state = {
+            "strategy": strategy,
+            "is_VT": is_VT,
+            "target_vol": target_vol,
+            "composition_matrix": composition_matrix,
+            "portfolio_returns": portfolio_returns,
+            "cumulative_returns": cumulative_returns,
+            "trade_stats": result_trade,
+            "last_prices": self.data.ffill().iloc[-1],
+            "trade_ledger": self.trade_ledger,
+        }
+        if cache_key is not None:
+            with stats.stage("cache"):
+                self.result_cache.put(cache_key, portfolio_returns, cumulative_returns, self.raw_portfolio_returns,
+                                      self.weight_matrix, composition_matrix, result_trade, self.trade_state,
+                                      self.trade_ledger)
+        with stats.stage("metrics"):
+            result = Result(
+                portfolio_returns=portfolio_returns,
+                cumulative_returns=cumulative_returns,
+                risk_free_rate=self.rfr,
+                trade_stats=result_trade,
+                plot_library=self.plot_library,
+                trade_ledger=self.trade_ledger,
+                run_stats=stats
+            )
+        self.log("Backtest terminé.")
         return result
 
+    def profiled_run(self, profiler: Profiler, strategy: Strategy, is_VT=False, target_vol=None,
+                     checkpoint_path: str = None, checkpoint_every: int = 100) -> Result:
+        """
+        Exécute run sous le profileur, puis écrit le profil et son résumé (nommés d'après la stratégie).
+
+        :param profiler: Instance de Profiler.
+        :return: Instance de la classe Result.
+        """
+        self.run_stats.add_hook(profiler.hook)
+        try:
+            with profiler:
+                result = self.run(strategy, is_VT, target_vol, checkpoint_path, checkpoint_every, profile=False)
+        finally:
+            self.run_stats.hooks.remove(profiler.hook)
+        self.profile_paths = profiler.save(type(strategy).__name__, result.run_stats)
+        self.log(f"Profil du backtest écrit dans {profiler.output_dir}.")
+        return result
+
+    def restore_cached_run(self, cached: dict, strategy: Strategy, is_VT=False, target_vol=None) -> Result:
+        """
+        Restaure un backtest lu dans le cache : pondérations, état du dernier backtest (pour update) et résultats.
+
+        :param cached: Entrée du cache (voir ResultCache.get).
+        :param strategy: Instance de la classe Strategy du backtest.
+        :param is_VT: Booléen indiquant si le Vol Targeting est activé.
+        :param target_vol: Volatilité cible (annualisée).
+        :return: Instance de la classe Result.
+        """
+        weight_matrix = cached["weight_matrix"]
+        weight_matrix.index = self.data.index
+        self.weight_matrix = weight_matrix if self.sparse_weights else weight_matrix.to_dense()
+        composition_matrix = cached["composition_matrix"]
+        composition_matrix.index = self.data.index
+        if not self.sparse_weights:
+            composition_matrix = composition_matrix.to_dense()
+        strategy.set_valid_mask(self.valid_mask)
+
+        self.raw_portfolio_returns = cached["raw_portfolio_returns"]
+        self.trade_state = cached["trade_state"]
+        self.trade_ledger = cached["trade_ledger"]
+        self.state = {
+            "strategy": strategy,
+            "is_VT": is_VT,
+            "target_vol": target_vol,
+            "composition_matrix": composition_matrix,
+            "portfolio_returns": cached["portfolio_returns"],
+            "cumulative_returns": cached["cumulative_returns"],
+            "trade_stats": cached["trade_stats"],
+            "last_prices": self.data.ffill().iloc[-1],
+            "trade_ledger": self.trade_ledger,
+        }
+        with self.run_stats.stage("metrics"):
+            return Result(
+                portfolio_returns=cached["portfolio_returns"],
+                cumulative_returns=cached["cumulative_returns"],
+                risk_free_rate=self.rfr,
+                trade_stats=cached["trade_stats"],
+                plot_library=self.plot_library,
+                trade_ledger=self.trade_ledger,
+                run_stats=self.run_stats
+            )
+
+    def run_sweep(self, strategy_class, param_grid: dict, is_VT=False, target_vol=None,
+                  checkpoint_path: str = None, checkpoint_every: int = 100) -> dict:
+        """
+        Exécute la stratégie pour chaque combinaison de paramètres d'une grille.
+
+        Avec checkpoint_path, chaque point de grille terminé est ajouté à un journal (sans réécrire les points
+        précédents) et ignoré lors d'une reprise ; le point en cours reprend lui-même au dernier point de sauvegarde
+        de sa composition (un fichier de reprise par point de grille, identifié par l'empreinte de ses paramètres).
+
+        :param strategy_class: Classe de la stratégie (instanciée avec chaque combinaison de paramètres).
+        :param param_grid: Dictionnaire {nom du paramètre: liste de valeurs}.
+        :param is_VT: Booléen indiquant si on souhaite activer le Vol Targeting (par défaut False).
+        :param target_vol: Volatilité cible (annualisée). Optionnel si is_VT=True.
+        :param checkpoint_path: Journal de reprise de la grille (optionnel), supprimé une fois la grille terminée.
+        :param checkpoint_every: Nombre de dates entre deux sauvegardes de la composition (par défaut : 100).
+        :return: Dictionnaire {tuple des valeurs des paramètres (dans l'ordre de param_grid): Result}.
+        :raises ValueError: Si le fichier de reprise provient d'une autre grille ou d'autres données.
+        """
+        names = list(param_grid)
+        key = (data_fingerprint(self.data), strategy_class.__name__, object_fingerprint(param_grid), is_VT, target_vol)
+        results = {}
+        if checkpoint_path is not None:
+            # Journal : identifiant de la grille, puis un enregistrement (valeurs des paramètres, Result) par point
+            if truncate_pickle(checkpoint_path) == 0:
+                append_pickle(key, checkpoint_path)
+            else:
+                records = list(iter_pickle(checkpoint_path))
+                if records[0] != key:
+                    raise ValueError("Le fichier de reprise ne correspond pas à cette grille (données ou paramètres).")
+                results = dict(records[1:])
+
+        for values in itertools.product(*param_grid.values()):
+            if values in results:
+                continue
+            params = dict(zip(names, values))
+            run_checkpoint_path = None
+            if checkpoint_path is not None:
+                run_checkpoint_path = f"{checkpoint_path}.{object_fingerprint(params)}.run"
+            strategy = strategy_class(**params)
+            results[values] = self.run(strategy, is_VT, target_vol, checkpoint_path=run_checkpoint_path,
+                                       checkpoint_every=checkpoint_every)
+            if checkpoint_path is not None:
+                append_pickle((values, results[values]), checkpoint_path)
+
+        if checkpoint_path is not None and os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
+        return results
+
+    def update(self, new_rows, new_market_caps=None, lookback: int = None) -> Result:
+        """
+        Avance le dernier backtest sur de nouvelles dates sans le réexécuter depuis le début : les positions
+        des nouvelles dates sont calculées par le même chemin que run (voir update_composition), et pondérations,
+        rendements et statistiques de trades ne sont recalculés que depuis l'avant-dernier rebalancement,
+        à partir de l'état conservé par run (dernières positions, stratégie, rendement cumulé, état des trades).
+
+        Le coût d'un update n'est pas proportionnel aux seules nouvelles dates : les signaux vectorisés sont
+        recalculés sur tout l'historique conservé, les séries stockées (données, masque, rendements, pondérations,
+        composition) sont prolongées par concaténation et les métriques du Result portent sur tout l'historique
+        conservé. Ces étapes restent proportionnelles à la longueur de l'historique, que trim_history permet de borner.
+
+        Les données déjà intégrées ne sont jamais réécrites. Les stratégies factorielles doivent être réajustées
+        (fit) sur des métriques couvrant les nouvelles dates avant l'appel.
+
+        :param new_rows: DataFrame (ou fichier CSV/Parquet) des prix des nouvelles dates.
+        :param new_market_caps: Capitalisations boursières des nouvelles dates, si le schéma de pondération les utilise
+                                (à défaut, la dernière capitalisation connue est prolongée).
+        :param lookback: Nombre de dates d'historique transmises à la stratégie (par défaut : tout l'historique).
+        :return: Instance de la classe Result sur l'ensemble de la période.
+        :raises ValueError: Si aucun backtest n'a été exécuté, si new_rows est vide ou si les nouvelles dates
+                            ne sont pas postérieures à la dernière date du backtest.
+        """
+        if self.state is None:
+            raise ValueError("Aucun backtest à mettre à jour : exécuter run au préalable.")
+        new_rows = load_data(new_rows).reindex(columns=self.data.columns)
+        if new_rows.empty:
+            raise ValueError("Le DataFrame fourni est vide ou invalide.")
+        if new_rows.index[0] <= self.data.index[-1]:
+            raise ValueError("Les nouvelles dates doivent être postérieures à la dernière date du backtest.")
+
+        state = self.state
+        first_new = len(self.data)
+        stats = self.new_run_stats()
+        with stats.stage("data_load"):
+            self.append_market_data(new_rows, new_market_caps)
+
+        # 1) Composition des nouvelles dates, puis pondérations depuis l'avant-dernier rebalancement
+        with stats.stage("composition"):
+            composition_matrix = self.update_composition(first_new, lookback)
+        with stats.stage("weights"):
+            start = self.update_start(first_new)
+            if isinstance(composition_matrix, SparseWeights):
+                composition_tail = composition_matrix.slice(start).to_dense()
+            else:
+                composition_tail = composition_matrix.iloc[start:]
+            new_weights = self.calculate_weight_matrix(composition_tail).iloc[first_new - start:]
+            if isinstance(self.weight_matrix, SparseWeights):
+                last_weights = self.weight_matrix.slice(first_new - 1).to_dense().iloc[0]
+                self.weight_matrix = self.weight_matrix.append(self.stitch_weights(last_weights, new_weights))
+                weight_tail = self.weight_matrix.slice(start).to_dense()
+            else:
+                new_weights = self.stitch_weights(self.weight_matrix.iloc[-1], new_weights)
+                self.weight_matrix = pd.concat([self.weight_matrix, new_weights])
+                weight_tail = self.weight_matrix.iloc[start:]
+
+        # 2) Rendements des nouvelles dates
+        with stats.stage("returns"):
+            shifted_weights, _, raw_returns = self.calculate_portfolio_returns(weight_tail)
+        new_raw_returns = raw_returns.iloc[first_new - start:].astype("float64")
+        self.raw_portfolio_returns = pd.concat([self.raw_portfolio_returns, new_raw_returns])
+        new_returns = new_raw_returns
+        if state["is_VT"] and (state["target_vol"] is not None):
+            tail = self.raw_portfolio_returns.iloc[-(len(new_raw_returns) + 20):]
+            new_returns = self.apply_vol_targeting(tail, state["target_vol"]).iloc[-len(new_raw_returns):]
+
+        # 3) Rendements cumulés prolongés depuis la dernière valeur connue
+        last_cumulative = state["cumulative_returns"].iloc[-1]
+        new_cumulative = (1 + last_cumulative) * (1 + new_returns).cumprod() - 1
+
+        # 4) Statistiques de trades reprises de l'état de chaque actif
+        trade_count, win_trade_count = self.evaluate_trade(shifted_weights.iloc[first_new - start:], self.trade_state)
+
+        state["portfolio_returns"] = pd.concat([state["portfolio_returns"], new_returns])
+        state["cumulative_returns"] = pd.concat([state["cumulative_returns"], new_cumulative])
+        state["trade_stats"] = (state["trade_stats"][0] + trade_count, state["trade_stats"][1] + win_trade_count)
+        state["trade_ledger"] = pd.concat([state["trade_ledger"], self.trade_ledger], ignore_index=True)
+
+        with stats.stage("metrics"):
+            return Result(
+                portfolio_returns=state["portfolio_returns"],
+                cumulative_returns=state["cumulative_returns"],
+                risk_free_rate=self.rfr,
+                trade_stats=state["trade_stats"],
+                plot_library=self.plot_library,
+                trade_ledger=state["trade_ledger"],
+                run_stats=stats
+            )
+
+    def append_market_data(self, new_rows: pd.DataFrame, new_market_caps=None):
+        """
+        Ajoute de nouvelles dates aux données de marché : nettoyage à partir de l'historique brut nécessaire,
+        masque de validité, rendements des actifs mis en cache, capitalisations boursières et calendrier.
+
+        :param new_rows: DataFrame des prix des nouvelles dates (mêmes colonnes que data).
+        :param new_market_caps: Capitalisations boursières des nouvelles dates (optionnel).
+        """
+        if self.data_cleaner is not None:
+            raw = pd.concat([self.raw_tail, new_rows])
+            cleaned, valid_mask = self.data_cleaner.clean(raw)
+            new_rows, new_mask = cleaned.iloc[-len(new_rows):], valid_mask.iloc[-len(new_rows):]
+            self.raw_tail = raw.iloc[-self.cleaner_history(len(raw)):]
+        else:
+            new_mask = new_rows.notna()
+
+        extension = Calendar(
+            frequency=self.rebalancing_frequency,
+            start_date=(self.calendar.end_date + pd.Timedelta(days=1)).strftime('%Y-%m-%d'),
+            end_date=new_rows.index[-1].strftime('%Y-%m-%d')
+        )
+        self.calendar.rebalancing_dates |= extension.rebalancing_dates
+        self.calendar.all_dates += extension.all_dates
+        self.calendar.holidays |= extension.holidays
+        self.calendar.end_date = extension.end_date
+        self.end_date = new_rows.index[-1].strftime('%Y-%m-%d')
+
+        # Rendements des nouvelles dates à partir du dernier prix connu de chaque actif
+        prices = pd.concat([self.state["last_prices"].to_frame().T, new_rows])
+        if self._asset_returns is not None:
+            self._asset_returns = pd.concat([self._asset_returns, prices.pct_change().fillna(0).iloc[1:]])
+        self.state["last_prices"] = prices.ffill().iloc[-1]
+
+        if self.weighting.requires_market_caps:
+            new_caps = load_data(new_market_caps) if new_market_caps is not None else pd.DataFrame()
+            new_caps = new_caps.reindex(index=new_rows.index, columns=self.market_caps.columns)
+            new_caps = pd.concat([self.market_caps.iloc[-1:], new_caps]).ffill().iloc[1:]
+            self.market_caps = pd.concat([self.market_caps, new_caps])
+
+        self.data = pd.concat([self.data, new_rows])
+        self.valid_mask = pd.concat([self.valid_mask, new_mask])
+
+    def update_composition(self, first_new: int, lookback: int = None) -> pd.DataFrame:
+        """
+        Prolonge la matrice de composition du dernier backtest sur les dates à partir de first_new, par le même
+        chemin que run : les signaux vectorisés (get_signals) de la stratégie sont calculés sur l'historique conservé
+        et retenus aux nouvelles dates de rebalancement. Si la stratégie n'en propose pas, ou si lookback est
+        renseigné, get_position est appelée uniquement aux nouvelles dates de rebalancement.
+
+        :param first_new: Position de la première nouvelle date dans data.
+        :param lookback: Nombre de dates d'historique transmises à get_position (par défaut : tout l'historique).
+        :return: Matrice de composition complète (DataFrame, ou SparseWeights si sparse_weights).
+        """
+        strategy = self.state["strategy"]
+        strategy.extend_valid_mask(self.valid_mask.iloc[first_new:])
+        previous = self.state["composition_matrix"]
+        if isinstance(previous, SparseWeights):
+            last_positions = previous.slice(len(previous.index) - 1).to_dense().iloc[-1]
+        else:
+            last_positions = previous.iloc[-1]
+        rebalancing_dates = self.calendar.rebalancing_dates
+        composition = pd.DataFrame(index=self.data.index[first_new:], columns=self.data.columns, dtype="float64")
+        name = type(strategy).__name__
+        get_position = self.run_stats.timed(f"{name}.get_position", strategy.get_position)
+
+        signals = None
+        if lookback is None:
+            signals = self.run_stats.timed(f"{name}.get_signals", strategy.get_signals)(self.data)
+        if signals is not None:
+            # Signaux retenus aux nouvelles dates de rebalancement, puis maintenus depuis les dernières positions
+            signals = signals.reindex(index=composition.index, columns=composition.columns).astype("float64")
+            is_rebalancing = pd.Series(composition.index.isin(list(rebalancing_dates)), index=composition.index)
+            composition = pd.concat([last_positions.to_frame().T, signals.where(is_rebalancing, axis=0)])
+            composition = composition.ffill().fillna(0.0).iloc[1:]
+        elif strategy.multi_asset:
+            current_position = last_positions.tolist()
+            for date_index in range(first_new, len(self.data)):
+                current_date = self.data.index[date_index]
+                if current_date in rebalancing_dates:
+                    start = 0 if lookback is None else max(date_index + 1 - lookback, 0)
+                    current_position = get_position(self.data.iloc[start:date_index + 1], current_position)
+                composition.loc[current_date] = current_position
+        else:
+            for asset in self.data.columns:
+                current_position = last_positions[asset]
+                for date_index in range(first_new, len(self.data)):
+                    current_date = self.data.index[date_index]
+                    if current_date in rebalancing_dates:
+                        start = 0 if lookback is None else max(date_index + 1 - lookback, 0)
+                        current_df = self.data[asset].iloc[start:date_index + 1]
+                        current_position = get_position(current_df, current_position)
+                    composition.at[current_date, asset] = current_position
+
+        if isinstance(previous, SparseWeights):
+            self.state["composition_matrix"] = previous.append(composition)
+        else:
+            self.state["composition_matrix"] = pd.concat([previous, composition])
+        return self.state["composition_matrix"]
+
+    def update_start(self, first_new: int) -> int:
+        """
+        Première date à recalculer lors d'un update : l'avant-dernier rebalancement, afin que les pondérations
+        figées et la dérive des positions repartent d'un début de segment.
+
+        :param first_new: Position de la première nouvelle date dans data.
+        :return: Position de la première date recalculée.
+        """
+        is_rebalancing = self.data.index[:first_new].isin(list(self.calendar.rebalancing_dates))
+        rebalancing_rows = np.flatnonzero(is_rebalancing)
+        start = rebalancing_rows[-2] if len(rebalancing_rows) >= 2 else 0
+        return int(max(min(start, first_new - 2), 0))
+
+    @staticmethod
+    def stitch_weights(last_weights: pd.Series, new_weights: pd.DataFrame, atol: float = 1e-12) -> pd.DataFrame:
+        """
+        Raccorde les pondérations recalculées sur la fin de l'historique aux pondérations déjà stockées :
+        une date dont les pondérations ne diffèrent de la date précédente que par le bruit numérique
+        (recalcul sur une fenêtre tronquée, solveur démarré d'un autre point) reprend exactement la date précédente,
+        afin de ne pas créer de faux trades ni de faux débuts de segment.
+
+        :param last_weights: Pondérations de la dernière date déjà stockée.
+        :param new_weights: DataFrame des pondérations des nouvelles dates.
+        :param atol: Écart absolu maximal considéré comme du bruit numérique (par défaut : 1e-12).
+        :return: DataFrame des pondérations raccordées.
+        """
+        values = np.nan_to_num(new_weights.to_numpy(dtype="float64"))
+        last = np.nan_to_num(last_weights.reindex(new_weights.columns).to_numpy(dtype="float64"))
+        previous = np.vstack([last, values[:-1]])
+        held = np.isclose(values, previous, rtol=0.0, atol=atol).all(axis=1)
+
+        stitched = pd.DataFrame(values, index=new_weights.index, columns=new_weights.columns)
+        stitched = stitched.where(pd.Series(~held, index=stitched.index), axis=0)
+        last = pd.DataFrame([last], index=[last_weights.name], columns=stitched.columns)
+        return pd.concat([last, stitched]).ffill().iloc[1:]
+
+    def trim_history(self, max_history: int):
+        """
+        Ne conserve en mémoire que les max_history dernières dates (données, masque, rendements des actifs,
+        pondérations, composition, rendements du portefeuille et calendrier) : la mémoire et le coût d'un backtest
+        avancé par update restent bornés quelle que soit la longueur de l'historique. Le nombre de trades et l'état
+        des trades ouverts sont conservés dans l'état ; les métriques du Result ne portent que sur les dates conservées.
+
+        max_history doit couvrir l'historique utilisé par la stratégie et le schéma de pondération,
+        ainsi qu'au moins deux dates de rebalancement.
+
+        :param max_history: Nombre de dates conservées.
+        """
+        cut = len(self.data) - max_history
+        if cut <= 0:
+            return
+        first_date = self.data.index[cut]
+
+        self.data = self.data.iloc[cut:]
+        self.valid_mask = self.valid_mask.iloc[cut:]
+        if self._asset_returns is not None:
+            self._asset_returns = self._asset_returns.iloc[cut:]
+        if self.weighting.requires_market_caps:
+            self.market_caps = self.market_caps.loc[first_date:]
+        if isinstance(self.weight_matrix, SparseWeights):
+            self.weight_matrix = self.weight_matrix.slice(cut)
+        elif self.weight_matrix is not None:
+            self.weight_matrix = self.weight_matrix.iloc[cut:]
+
+        self.calendar.all_dates = [date for date in self.calendar.all_dates if date >= first_date]
+        self.calendar.rebalancing_dates = {date for date in self.calendar.rebalancing_dates if date >= first_date}
+
+        if self.state is not None:
+            strategy = self.state["strategy"]
+            if strategy.valid_counts is not None:
+                strategy.valid_mask = strategy.valid_mask.loc[first_date:]
+                strategy.valid_counts = strategy.valid_counts.loc[first_date:]
+            if isinstance(self.state["composition_matrix"], SparseWeights):
+                self.state["composition_matrix"] = self.state["composition_matrix"].slice(cut)
+            else:
+                self.state["composition_matrix"] = self.state["composition_matrix"].loc[first_date:]
+            for key in ("portfolio_returns", "cumulative_returns"):
+                self.state[key] = self.state[key].loc[first_date:]
+            ledger = self.state["trade_ledger"]
+            self.state["trade_ledger"] = ledger[ledger["date"] >= first_date].reset_index(drop=True)
+        if self.raw_portfolio_returns is not None:
+            self.raw_portfolio_returns = self.raw_portfolio_returns.loc[first_date:]
+
+    def cleaner_history(self, length: int = None) -> int:
+        """
+        Nombre de dates brutes à conserver pour nettoyer de nouvelles données comme l'historique complet.
+
+        :param length: Nombre de dates disponibles (par défaut : len(data)).
+        :return: Nombre de dates.
+        """
+        length = len(self.data) if length is None else length
+        if self.data_cleaner.ffill_limit is None:
+            return length
+        return max(self.data_cleaner.ffill_limit, self.data_cleaner.stale_limit or 0) + 1
+
+    def save_state(self, path: str):
+        """
+        Sauvegarde le Backtester et l'état du dernier backtest (pickle), pour un update ultérieur.
+
+        :param path: Chemin du fichier de sauvegarde.
+        """
+        save_pickle(self, path)
+
+    @staticmethod
+    def load_state(path: str) -> "Backtester":
+        """
+        Recharge un Backtester sauvegardé avec save_state.
+
+        :param path: Chemin du fichier de sauvegarde.
+        :return: Instance de Backtester.
+        """
+        return load_pickle(path)
+
+    def weights_to_arrow(self, path: str = None):
+        """
+        Exporte la matrice des pondérations du dernier backtest en Arrow, sans copie des pondérations.
+        Une matrice dense est exportée au format large (date, une colonne par actif), une matrice creuse
+        (sparse_weights=True) au format long (date, asset, weight), une ligne par pondération non nulle
+        aux dates d'événement.
+
+        :param path: Fichier IPC Arrow dans lequel écrire les pondérations (optionnel).
+        :return: pyarrow.RecordBatch.
+        :raises ValueError: Si aucun backtest n'a été exécuté.
+        """
+        if self.weight_matrix is None:
+            raise ValueError("Aucun backtest n'a été exécuté : lancez run avant d'exporter les pondérations.")
+        if isinstance(self.weight_matrix, SparseWeights):
+            batch = self.weight_matrix.to_arrow()
+        else:
+            batch = to_record_batch(self.weight_matrix)
+        if path is not None:
+            write_arrow(batch, path)
+        return batch
+
+    def weights_from_arrow(self, source):
+        """
+        Importe une matrice de pondérations Arrow (produite par weights_to_arrow ou par un autre processus)
+        sur les dates et les actifs du Backtester. Le format long (date, asset, weight) donne une matrice creuse,
+        le format large une matrice dense dont les colonnes sont reprises sans copie.
+
+        :param source: pyarrow.RecordBatch, pyarrow.Table ou chemin d'un fichier IPC Arrow.
+        :return: Matrice des pondérations (DataFrame ou SparseWeights), également affectée à weight_matrix.
+        :raises KeyError: Si une date ou un actif est absent des données.
+        """
+        batch = read_arrow(source) if isinstance(source, str) else source
+        if batch.schema.names == ["date", "asset", "weight"]:
+            frame = from_record_batch(batch, index_name=None)
+            self.weight_matrix = SparseWeights.from_events(frame["date"], frame["asset"].astype(str),
+                                                           frame["weight"], self.data.index, self.data.columns)
+        else:
+            frame = from_record_batch(batch)
+            frame.index = pd.DatetimeIndex(frame.index, copy=False, name=self.data.index.name)
+            if not frame.index.isin(self.data.index).all() or not frame.columns.isin(self.data.columns).all():
+                raise KeyError("Dates ou actifs absents de l'index ou des colonnes.")
+            self.weight_matrix = frame
+        return self.weight_matrix
+
     def apply_vol_targeting(
             self,
             portfolio_returns: pd.Series,
@@ -132,7 +737,7 @@ class Backtester:
         Ajuste les rendements du portefeuille pour atteindre une volatilité cible (target_vol),
         tout en bornant le levier entre 0% et 150%.
 
-        :param portfolio_returns: Série Pandas des rendements quotidiens du portefeuille.
+        :param portfolio_returns: Série Pandas des rendements quotidiens du portefeuille (ou DataFrame, une colonne par portefeuille).
         :param target_vol: Volatilité cible annualisée.
         :param rolling_window: Nombre de jours pour le calcul de la volatilité glissante (par défaut : 20).
         :param leverage_cap: Borne maximum du levier (par défaut : 1.5, soit 150%).
@@ -153,43 +758,198 @@ class Backtester:
 
         return portfolio_returns_vt
 
-    def calculate_composition_matrix(self, strategy: Strategy) -> pd.DataFrame:
+    def calculate_composition_matrix(self, strategy: Strategy, vectorized: bool = True, checkpoint_path: str = None,
+                                     checkpoint_every: int = 100, sparse: bool = False) -> pd.DataFrame:
         """
         Calcule la matrice des positions du portefeuille au cours du temps pour chaque actif.
 
         :param strategy: Instance de la classe Strategy définissant les règles d'achat/vente.
-        :return: DataFrame Pandas représentant les positions (nombre d'unités) du portefeuille dans chaque actif.
+        :param vectorized: Si True, utilise le calcul vectorisé de la stratégie (get_signals) lorsqu'il existe,
+                           sinon appelle get_position date par date.
+        :param checkpoint_path: Fichier de reprise du calcul date par date (optionnel) : la position courante et
+                                l'état de la stratégie y sont sauvegardés toutes les checkpoint_every dates,
+                                et le calcul reprend au dernier point de sauvegarde. Les positions calculées depuis
+                                la sauvegarde précédente sont ajoutées au journal {checkpoint_path}.blocks,
+                                de sorte que chaque position n'est écrite qu'une fois.
+        :param checkpoint_every: Nombre de dates entre deux sauvegardes (par défaut : 100).
+        :param sparse: Si True, la composition est retournée sous forme d'événements (SparseWeights) ; avec les
+                       signaux vectorisés, elle est construite à partir des seules dates de rebalancement.
+        :return: DataFrame Pandas représentant les positions (nombre d'unités) du portefeuille dans chaque actif
+                 (SparseWeights si sparse).
+        :raises ValueError: Si le fichier de reprise provient d'un autre backtest (données, stratégie ou paramètres
+                            différents).
         """
         assets = self.data.columns
         trading_dates = self.data.index
         rebalancing_dates = self.calendar.rebalancing_dates
-        composition_matrix = pd.DataFrame(index=trading_dates, columns=assets, dtype="float64")
+        strategy.set_valid_mask(self.valid_mask)
+
+        name = type(strategy).__name__
+        if vectorized:
+            signals = self.run_stats.timed(f"{name}.get_signals", strategy.get_signals)(self.data)
+            if signals is not None:
+                return self.calculate_composition_from_signals(signals, sparse)
 
+        values = np.full((len(trading_dates), len(assets)), np.nan)
+        # Point de reprise : (actif, date) à partir duquel reprendre et position courante à cette date
+        resume_asset, resume_date, resume_position = 0, self.special_start, 0
+        if checkpoint_path is not None:
+            # Empreinte de la stratégie avant tout appel : ses paramètres, et non son état en cours de calcul
+            key = self.checkpoint_key(strategy)
+            blocks_path = f"{checkpoint_path}.blocks"
+            if os.path.exists(checkpoint_path):
+                checkpoint = self.load_checkpoint(checkpoint_path, key)
+                # Mêmes paramètres : l'état interne de la stratégie à la date sauvegardée est restauré
+                strategy.__dict__.update(checkpoint["strategy"].__dict__)
+                resume_asset, resume_date, resume_position = checkpoint["progress"]
+                # Un bloc tronqué par l'interruption est supprimé avant les ajouts de la reprise
+                truncate_pickle(blocks_path)
+                self.restore_blocks(blocks_path, values, resume_asset, resume_date, strategy.multi_asset)
+                self.log("Reprise du calcul de la composition depuis le dernier point de sauvegarde.")
+            elif os.path.exists(blocks_path):
+                os.remove(blocks_path)
+
+        # Début du bloc de positions non encore ajouté au journal
+        block_start = resume_date
+
+        def save(asset_index, date_index, position, force=False):
+            nonlocal block_start
+            if checkpoint_path is None:
+                return
+            if force or (date_index + 1 - self.special_start) % checkpoint_every == 0:
+                block = values[block_start:date_index + 1]
+                block = block.copy() if strategy.multi_asset else block[:, asset_index].copy()
+                append_pickle((asset_index, block_start, date_index + 1, block), blocks_path)
+                block_start = date_index + 1
+                if not force:
+                    self.save_checkpoint(checkpoint_path, key, strategy, (asset_index, date_index + 1, position))
+
+        # Nombre d'appels et latence de get_position, par stratégie
+        get_position = self.run_stats.timed(f"{name}.get_position", strategy.get_position)
         if strategy.multi_asset:
-            current_position = 0
-            for date_index in tqdm(range(self.special_start, len(trading_dates)), desc="Multi-Asset Composition"):
+            current_position = resume_position
+            for date_index in tqdm(range(resume_date, len(trading_dates)), desc="Multi-Asset Composition",
+                                   disable=not self.verbose):
                 current_date = trading_dates[date_index]
                 current_df = self.data.loc[:current_date]
                 # Mise à jour des positions aux dates de rebalancement
                 if current_date in rebalancing_dates:
-                    current_position = strategy.get_position(current_df, current_position)
+                    current_position = get_position(current_df, current_position)
 
-                composition_matrix.loc[current_date] = current_position
+                # Positions alignées sur les colonnes du panel lorsqu'elles sont étiquetées
+                values[date_index] = (current_position.reindex(assets).to_numpy(dtype="float64")
+                                      if isinstance(current_position, pd.Series) else current_position)
+                save(0, date_index, current_position)
 
         else:
             # Initialisation des positions pour chaque actif (mono-actif)
-            for asset in tqdm(assets, desc="Mono-Asset Composition"):
-                current_position = 0
-                for date_index in range(self.special_start, len(trading_dates)):
+            for asset_index in tqdm(range(resume_asset, len(assets)), desc="Mono-Asset Composition",
+                                    disable=not self.verbose):
+                asset = assets[asset_index]
+                resumed = asset_index == resume_asset
+                current_position = resume_position if resumed else 0
+                block_start = resume_date if resumed else self.special_start
+                for date_index in range(block_start, len(trading_dates)):
                     current_date = trading_dates[date_index]
                     current_df = self.data.loc[:current_date, asset]
 
                     # Mise à jour des positions aux dates de rebalancement
                     if current_date in rebalancing_dates:
-                        current_position = strategy.get_position(current_df, current_position)
+                        current_position = get_position(current_df, current_position)
+
+                    values[date_index, asset_index] = current_position
+                    save(asset_index, date_index, current_position)
+                # Fin de la colonne ajoutée au journal : elle n'est plus réécrite lors des sauvegardes suivantes
+                if block_start < len(trading_dates):
+                    save(asset_index, len(trading_dates) - 1, current_position, force=True)
+
+        if checkpoint_path is not None:
+            for path in (checkpoint_path, blocks_path):
+                if os.path.exists(path):
+                    os.remove(path)
+        if sparse:
+            return SparseWeights.from_rows(values, np.arange(len(values)), trading_dates, assets)
+        return pd.DataFrame(values, index=trading_dates, columns=assets)
+
+    def checkpoint_key(self, strategy: Strategy) -> tuple:
+        """
+        Identifiant d'un backtest dans un fichier de reprise : empreinte des données, type et empreinte
+        de la stratégie (paramètres et état), fréquence de rebalancement et date de départ.
+
+        :param strategy: Instance de la classe Strategy, avant le calcul de la composition.
+        :return: Tuple identifiant le backtest.
+        """
+        return (data_fingerprint(self.data), type(strategy).__name__,
+                object_fingerprint(strategy, exclude=("valid_mask", "valid_counts")),
+                self.rebalancing_frequency, self.special_start)
+
+    def save_checkpoint(self, path: str, key: tuple, strategy: Strategy, progress: tuple):
+        """
+        Sauvegarde atomique de l'avancement du calcul de la composition (les positions sont dans le journal).
+
+        :param path: Chemin du fichier de reprise.
+        :param key: Identifiant du backtest (checkpoint_key, calculé avant le calcul de la composition).
+        :param strategy: Stratégie (et son état interne) à la date sauvegardée.
+        :param progress: Tuple (indice de l'actif, indice de la prochaine date, position courante).
+        """
+        save_pickle({"key": key, "strategy": strategy, "progress": progress}, path)
+
+    def load_checkpoint(self, path: str, key: tuple) -> dict:
+        """
+        Charge un fichier de reprise et vérifie qu'il correspond au backtest en cours.
+
+        :param path: Chemin du fichier de reprise.
+        :param key: Identifiant du backtest en cours (checkpoint_key).
+        :return: Dictionnaire (key, strategy, progress).
+        :raises ValueError: Si le fichier de reprise provient d'un autre backtest (données, stratégie ou paramètres).
+        """
+        checkpoint = load_pickle(path)
+        if checkpoint["key"] != key:
+            raise ValueError("Le fichier de reprise ne correspond pas à ce backtest (données, stratégie ou paramètres).")
+        return checkpoint
+
+    @staticmethod
+    def restore_blocks(path: str, values: np.ndarray, resume_asset: int, resume_date: int, multi_asset: bool):
+        """
+        Recopie dans la composition les blocs de positions du journal antérieurs au point de reprise
+        (les blocs écrits après la dernière sauvegarde sont recalculés).
+
+        :param path: Chemin du journal des blocs.
+        :param values: Tableau de la composition (dates x actifs), complété en place.
+        :param resume_asset: Indice de l'actif du point de reprise.
+        :param resume_date: Indice de la date du point de reprise.
+        :param multi_asset: True si les blocs contiennent toutes les colonnes (stratégie multi-actifs).
+        """
+        for asset_index, start, end, block in iter_pickle(path):
+            if asset_index < resume_asset or (asset_index == resume_asset and end <= resume_date):
+                if multi_asset:
+                    values[start:end] = block
+                else:
+                    values[start:end, asset_index] = block
+
+    def calculate_composition_from_signals(self, signals: pd.DataFrame, sparse: bool = False) -> pd.DataFrame:
+        """
+        Construit la matrice des positions à partir des signaux calculés sur l'ensemble du panel :
+        les signaux ne sont retenus qu'aux dates de rebalancement, puis maintenus jusqu'au rebalancement suivant.
+
+        :param signals: DataFrame des positions souhaitées à chaque date (NaN = maintien de la position courante).
+        :param sparse: Si True, la composition est construite sous forme d'événements (SparseWeights)
+                       à partir des seules lignes des dates de rebalancement.
+        :return: DataFrame Pandas représentant les positions du portefeuille dans chaque actif
+                 (SparseWeights si sparse).
+        """
+        is_rebalancing = self.data.index.isin(list(self.calendar.rebalancing_dates))
+        is_rebalancing[:self.special_start] = False
+        if sparse:
+            rows = np.flatnonzero(is_rebalancing)
+            positions = signals.reindex(index=self.data.index[rows], columns=self.data.columns).astype("float64")
+            positions = positions.ffill().fillna(0.0)
+            return SparseWeights.from_rows(positions.to_numpy(), rows, self.data.index, self.data.columns)
 
-                    composition_matrix.at[current_date, asset] = current_position
+        signals = signals.reindex(index=self.data.index, columns=self.data.columns).astype("float64")
 
+        composition_matrix = signals.where(pd.Series(is_rebalancing, index=signals.index), axis=0)
+        composition_matrix.iloc[self.special_start:] = composition_matrix.iloc[self.special_start:].ffill().fillna(0.0)
         return composition_matrix
 
     def calculate_weight_matrix(self, composition_matrix: pd.DataFrame) -> pd.DataFrame:
@@ -197,27 +957,36 @@ class Backtester:
         Calcule la matrice des pondérations du portefeuille au cours du temps
         en fonction du schéma de pondération spécifié.
 
-        :param composition_matrix: DataFrame des positions du portefeuille.
-        :return: DataFrame Pandas représentant les pondérations du portefeuille (entre -1 et +1, ou autre).
-        :raises ValueError: Si le schéma de pondération n'est pas reconnu.
+        Avec une composition stockée par événements, les pondérations d'un schéma constant par morceaux ne sont
+        calculées qu'aux dates de rebalancement et aux événements de la composition (ainsi qu'aux première
+        et dernière dates, qui bornent les données lues par le schéma comme dans le calcul dense).
+
+        :param composition_matrix: DataFrame (ou SparseWeights) des positions du portefeuille.
+        :return: DataFrame Pandas représentant les pondérations du portefeuille (entre -1 et +1, ou autre),
+                 SparseWeights si la composition est stockée par événements.
         """
         pd.set_option('future.no_silent_downcasting', True)
-        if self.weight_scheme == 'EqualWeight':
-            # Comptage du nombre d'actifs en position pour chaque date
-            selected_counts = composition_matrix.abs().sum(axis=1).replace(0, pd.NA)
-            # Normalisation des poids
-            weight_matrix = composition_matrix.divide(selected_counts, axis=0).fillna(0)
-
-        elif self.weight_scheme == 'MarketCapWeight':
-            # Pondération par la capitalisation boursière
-            weighted_market_caps = composition_matrix * self.market_caps
-            sum_market_caps = weighted_market_caps.abs().sum(axis=1).replace(0, pd.NA)
-            weight_matrix = weighted_market_caps.divide(sum_market_caps, axis=0).fillna(0)
+        if not isinstance(composition_matrix, SparseWeights):
+            return self.weighting.compute_weights(composition_matrix, self)
+        index, columns = composition_matrix.index, composition_matrix.columns
+        if not self.weighting.piecewise_constant:
+            return SparseWeights.from_dense(self.weighting.compute_weights(composition_matrix.to_dense(), self))
 
-        else:
-            raise ValueError(f"Schéma de pondération inconnu : {self.weight_scheme}")
+        is_rebalancing = index.isin(list(self.calendar.rebalancing_dates))
+        rows = np.union1d(np.flatnonzero(is_rebalancing), composition_matrix.event_rows)
+        if len(index):
+            rows = np.union1d([0, len(index) - 1], rows)
+        weights = self.weighting.compute_weights(composition_matrix.rows_frame(rows), self)
+        return SparseWeights.from_rows(weights.to_numpy(dtype="float64"), rows, index, columns)
+
+    def calculate_turnover(self, shifted_positions: pd.DataFrame) -> pd.Series:
+        """
+        Calcule la rotation du portefeuille (somme des variations absolues de pondération) à chaque période.
 
-        return weight_matrix
+        :param shifted_positions: DataFrame des positions décalées pour calculer la variation de position.
+        :return: Série Pandas représentant la rotation par période.
+        """
+        return shifted_positions.diff().abs().sum(axis=1)
 
     def calculate_transaction_costs(self, shifted_positions: pd.DataFrame) -> pd.Series:
         """
@@ -226,7 +995,7 @@ class Backtester:
         :param shifted_positions: DataFrame des positions décalées pour calculer la variation de position.
         :return: Série Pandas représentant les coûts de transaction par période.
         """
-        return (shifted_positions.diff().abs().sum(axis=1)) * self.transaction_cost
+        return self.calculate_turnover(shifted_positions) * self.transaction_cost
 
     def calculate_slippage_costs(self, shifted_positions: pd.DataFrame) -> pd.Series:
         """
@@ -235,39 +1004,168 @@ class Backtester:
         :param shifted_positions: DataFrame des positions décalées pour calculer la variation de position.
         :return: Série Pandas représentant les coûts de slippage par période.
         """
-        return (shifted_positions.diff().abs().sum(axis=1)) * self.slippage
+        return self.calculate_turnover(shifted_positions) * self.slippage
+
+    def calculate_model_costs(self, weight_changes: pd.DataFrame):
+        """
+        Calcule les coûts du modèle de coûts en fonction des changements de positions.
 
-    def evaluate_trade(self, shifted_positions: pd.DataFrame) -> tuple:
+        :param weight_changes: DataFrame des variations de pondérations (voir calculate_holdings).
+        :return: Série Pandas représentant les coûts par période, ou None en l'absence de modèle de coûts.
         """
-        Évalue le nombre de trades et le nombre de trades gagnants sur la période.
+        if self.cost_model is None:
+            return None
+        return self.cost_model.compute_costs(weight_changes, self)
+
+    def calculate_holdings(self, shifted_weights: pd.DataFrame) -> tuple:
+        """
+        Calcule les pondérations détenues au début de chaque période et les variations de pondérations échangées.
+
+        En comptabilité 'target', les pondérations sont ramenées à la cible chaque jour. En comptabilité 'drift',
+        les positions dérivent avec les prix entre deux rebalancements : chaque segment entre deux rebalancements
+        est valorisé par produit cumulé des rendements, sans boucle par date, et la rotation d'un rebalancement
+        est l'écart entre la cible et les pondérations dérivées de la veille.
+
+        :param shifted_weights: DataFrame des pondérations cibles décalées (positions en t décidées en t-1).
+        :return: Tuple (holding_weights, weight_changes) de DataFrames dates x actifs.
+        """
+        if self.accounting == "target":
+            return shifted_weights, shifted_weights.diff()
+
+        targets = shifted_weights.astype("float64")
+        returns = self.asset_returns.reindex(index=targets.index, columns=targets.columns).fillna(0)
+
+        # Un segment commence le lendemain d'un rebalancement ou lorsque la cible change
+        is_rebalancing = pd.Series(targets.index.isin(list(self.calendar.rebalancing_dates)), index=targets.index)
+        starts = is_rebalancing.shift(1, fill_value=False) | targets.ne(targets.shift()).any(axis=1)
+        starts.iloc[0] = True
+        segments = starts.cumsum()
+
+        # Croissance de chaque actif depuis le début du segment, jusqu'à la veille puis jusqu'au jour même
+        growth = (1 + returns).groupby(segments).cumprod()
+        previous_growth = growth.groupby(segments).shift(1).fillna(1.0)
+
+        # Valeur du portefeuille rapportée au début du segment (la part non investie reste en cash)
+        cash = 1 - targets.sum(axis=1)
+        previous_value = (targets * previous_growth).sum(axis=1) + cash
+        value = (targets * growth).sum(axis=1) + cash
+
+        holding_weights = (targets * previous_growth).divide(previous_value, axis=0)
+        drifted_weights = (targets * growth).divide(value, axis=0)
+
+        # Rotation : uniquement au début de chaque segment, par rapport aux pondérations dérivées de la veille
+        weight_changes = (targets - drifted_weights.shift(1).fillna(0.0)).where(starts, 0.0, axis=0)
+        return holding_weights, weight_changes
+
+    def reprice_costs(self, transaction_costs, slippages, weight_matrix: pd.DataFrame = None,
+                      is_VT: bool = False, target_vol: float = None) -> pd.DataFrame:
+        """
+        Recalcule les rendements du portefeuille pour une grille d'hypothèses de coûts, sans réexécuter la stratégie.
+        Le rendement brut, la rotation et les coûts du modèle de coûts sont calculés une seule fois,
+        puis diffusés sur toute la grille.
+
+        :param transaction_costs: Liste des coûts de transaction à tester.
+        :param slippages: Liste des coûts de slippage à tester (grille croisée avec transaction_costs).
+        :param weight_matrix: Matrice des pondérations (par défaut : celle du dernier run).
+        :param is_VT: Booléen indiquant si on souhaite activer le Vol Targeting (par défaut : False).
+        :param target_vol: Volatilité cible annualisée (utile si is_VT=True).
+        :return: DataFrame des rendements quotidiens, une colonne par couple (transaction_cost, slippage).
+        :raises ValueError: Si aucune matrice des pondérations n'est disponible.
+        """
+        weight_matrix = self.weight_matrix if weight_matrix is None else weight_matrix
+        if weight_matrix is None:
+            raise ValueError("Aucune matrice des pondérations : exécuter run ou fournir weight_matrix.")
+        if isinstance(weight_matrix, SparseWeights):
+            weight_matrix = weight_matrix.to_dense()
+
+        grid = pd.MultiIndex.from_product([transaction_costs, slippages], names=["transaction_cost", "slippage"])
+        transaction_cost = grid.get_level_values(0).to_numpy(dtype="float64")
+        slippage = grid.get_level_values(1).to_numpy(dtype="float64")
+
+        shifted_weights = weight_matrix.shift(1).fillna(0)
+        holding_weights, weight_changes = self.calculate_holdings(shifted_weights)
+        gross_returns = holding_weights.multiply(self.asset_returns, axis=0).sum(axis=1)
+        gross_returns = gross_returns.to_numpy(dtype="float64")[:, None]
+        turnover = weight_changes.abs().sum(axis=1).to_numpy(dtype="float64")[:, None]
+
+        # Même ordre d'opérations que calculate_returns pour des résultats identiques
+        returns = gross_returns - turnover * transaction_cost - turnover * slippage
+        model_costs = self.calculate_model_costs(weight_changes)
+        if model_costs is not None:
+            returns = returns - model_costs.to_numpy(dtype="float64")[:, None]
+        portfolio_returns = pd.DataFrame(returns, index=weight_matrix.index, columns=grid)
+
+        if is_VT and (target_vol is not None):
+            portfolio_returns = self.apply_vol_targeting(portfolio_returns, target_vol)
+
+        if self.special_start != 1:
+            portfolio_returns = portfolio_returns.iloc[self.special_start + 1:]
+
+        return portfolio_returns
+
+    def calculate_trade_ledger(self, shifted_positions: pd.DataFrame, trade_state: dict = None) -> pd.DataFrame:
+        """
+        Construit le registre des trades : un trade est enregistré à chaque changement de position d'un actif,
+        et il est gagnant si la position quittée était longue (resp. courte) et que le prix a monté (resp. baissé)
+        depuis le trade précédent sur cet actif. Le calcul est vectorisé sur l'ensemble des actifs et des dates.
 
         :param shifted_positions: DataFrame des positions décalées dans le temps.
-        :return: Tuple (trade_count, win_trade_count).
+        :param trade_state: Dictionnaire {actif: (dernière position, prix du dernier trade)} optionnel :
+                            s'il contient l'actif, le registre reprend de cet état, puis il est mis à jour.
+        :return: DataFrame (date, asset, previous_position, position, previous_price, price, winning),
+                 trié par date puis par actif.
         """
-        trade_count = 0
-        win_trade_count = 0
+        assets = shifted_positions.columns
+        positions = shifted_positions.to_numpy(dtype="float64")
+        prices = self.data.reindex(index=shifted_positions.index, columns=assets).to_numpy(dtype="float64")
 
-        for asset in shifted_positions.columns:
-            last_position = shifted_positions.iloc[0][asset]  # Position initiale pour l'actif
-            last_trade_value = self.data.iloc[0][asset]  # Prix initial de l'actif
+        # Position et prix de référence avant la première date : état repris ou première date et premier prix
+        initial_positions = positions[0].copy() if len(positions) else np.zeros(len(assets))
+        initial_prices = self.data.iloc[0].reindex(assets).to_numpy(dtype="float64")
+        if trade_state:
+            for column, asset in enumerate(assets):
+                if asset in trade_state:
+                    initial_positions[column], initial_prices[column] = trade_state[asset]
 
-            for date in shifted_positions.index:
-                current_position = shifted_positions.at[date, asset]
-                # Détecter un trade quand la position change
-                if last_position != current_position:
-                    trade_count += 1
-                    current_value = self.data.at[date, asset]
+        previous_positions = np.vstack([initial_positions, positions[:-1]])
+        # Parcours actif par actif (ordre des colonnes puis des dates) pour chaîner les prix des trades successifs
+        columns, rows = np.nonzero((positions != previous_positions).T)
+        trade_prices = prices[rows, columns]
+        first_trade = np.r_[True, columns[1:] != columns[:-1]] if len(columns) else np.zeros(0, dtype=bool)
+        previous_prices = np.where(first_trade, initial_prices[columns], np.roll(trade_prices, 1))
+        previous_trade_positions = previous_positions[rows, columns]
+        winning = ((previous_trade_positions > 0) & (trade_prices > previous_prices)) | \
+                  ((previous_trade_positions < 0) & (trade_prices < previous_prices))
 
-                    # Vérifier si le trade est gagnant
-                    if ((last_position > 0 and current_value > last_trade_value) or
-                            (last_position < 0 and current_value < last_trade_value)):
-                        win_trade_count += 1
+        if trade_state is not None:
+            last_positions, last_prices = initial_positions.copy(), initial_prices.copy()
+            last_positions[columns], last_prices[columns] = positions[rows, columns], trade_prices
+            trade_state.update(zip(assets, zip(last_positions.tolist(), last_prices.tolist())))
 
-                    # Mise à jour des valeurs de référence
-                    last_trade_value = current_value
-                    last_position = current_position
+        order = np.lexsort((columns, rows))
+        return pd.DataFrame({
+            "date": shifted_positions.index[rows[order]],
+            "asset": assets[columns[order]],
+            "previous_position": previous_trade_positions[order],
+            "position": positions[rows, columns][order],
+            "previous_price": previous_prices[order],
+            "price": trade_prices[order],
+            "winning": winning[order],
+        })
 
-        return trade_count, win_trade_count
+    def evaluate_trade(self, shifted_positions: pd.DataFrame, trade_state: dict = None) -> tuple:
+        """
+        Évalue le nombre de trades et le nombre de trades gagnants sur la période, à partir du registre des trades
+        (conservé dans self.trade_ledger).
+
+        :param shifted_positions: DataFrame des positions décalées dans le temps.
+        :param trade_state: Dictionnaire {actif: (dernière position, prix du dernier trade)} optionnel :
+                            s'il contient l'actif, l'évaluation reprend de cet état, puis il est mis à jour.
+        :return: Tuple (trade_count, win_trade_count).
+        """
+        with self.run_stats.stage("trade_evaluation"):
+            self.trade_ledger = self.calculate_trade_ledger(shifted_positions, trade_state)
+        return len(self.trade_ledger), int(self.trade_ledger["winning"].sum())
 
     def calculate_returns(self, is_VT: bool = False, target_vol: float = None):
         """
@@ -283,21 +1181,16 @@ class Backtester:
             - cumulative_returns (pd.Series) : rendements cumulés du portefeuille
             - result_trade (tuple) : (nombre total de trades, nombre de trades gagnants)
         """
-        # 1) Calcul des rendements des actifs
-        asset_returns = self.data.pct_change().fillna(0)
+        weight_matrix = self.weight_matrix
+        if isinstance(weight_matrix, SparseWeights):
+            if self.accounting == "target" and self.cost_model is None:
+                return self.calculate_sparse_returns(is_VT, target_vol)
+            # La dérive des positions et les modèles de coûts travaillent sur la matrice dense
+            weight_matrix = weight_matrix.to_dense()
 
-        # 2) Shift des positions pour éviter le biais (positions en t décidées en t-1)
-        shifted_weights = self.weight_matrix.shift(1).fillna(0)
-
-        # 3) Calcul des coûts de transaction et de slippage
-        transaction_costs = self.calculate_transaction_costs(shifted_weights)
-        slippage_costs = self.calculate_slippage_costs(shifted_weights)
-
-        # 4) Contribution de chaque actif
-        asset_contributions = shifted_weights.multiply(asset_returns, axis=0)
-
-        # 5) Rendement brut du portefeuille
-        portfolio_returns = asset_contributions.sum(axis=1) - transaction_costs - slippage_costs
+        # 1) à 5) Pondérations décalées, contributions des actifs et rendements nets de coûts
+        shifted_weights, asset_contributions, portfolio_returns = self.calculate_portfolio_returns(weight_matrix)
+        self.raw_portfolio_returns = portfolio_returns
 
         # 6) Application du Vol Target (si demandé)
         if is_VT and (target_vol is not None):
@@ -316,6 +1209,77 @@ class Backtester:
             cumulative_returns = cumulative_returns.iloc[self.special_start + 1:]
 
         # 9) Évaluation des statistiques de trades
-        result_trade = self.evaluate_trade(shifted_weights)
+        self.trade_state = {}
+        result_trade = self.evaluate_trade(shifted_weights, self.trade_state)
 
         return asset_contributions, portfolio_returns, cumulative_asset_returns, cumulative_returns, result_trade
+
+    def calculate_portfolio_returns(self, weight_matrix: pd.DataFrame) -> tuple:
+        """
+        Calcule les rendements quotidiens du portefeuille, nets de coûts et avant Vol Targeting.
+
+        :param weight_matrix: DataFrame des pondérations cibles (dates x actifs).
+        :return: Tuple (shifted_weights, asset_contributions, portfolio_returns).
+        """
+        # 1) Rendements des actifs (mis en cache), restreints aux dates des pondérations
+        asset_returns = self.asset_returns.loc[weight_matrix.index[0]:weight_matrix.index[-1]]
+
+        # 2) Shift des positions pour éviter le biais (positions en t décidées en t-1)
+        shifted_weights = weight_matrix.shift(1).fillna(0)
+
+        # 3) Pondérations détenues et calcul des coûts de transaction et de slippage (rotation calculée une seule fois)
+        holding_weights, weight_changes = self.calculate_holdings(shifted_weights)
+        turnover = weight_changes.abs().sum(axis=1)
+        transaction_costs = turnover * self.transaction_cost
+        slippage_costs = turnover * self.slippage
+        model_costs = self.calculate_model_costs(weight_changes)
+
+        # 4) Contribution de chaque actif
+        asset_contributions = holding_weights.multiply(asset_returns, axis=0)
+
+        # 5) Rendement brut du portefeuille
+        portfolio_returns = asset_contributions.sum(axis=1) - transaction_costs - slippage_costs
+        if model_costs is not None:
+            portfolio_returns = portfolio_returns - model_costs
+
+        return shifted_weights, asset_contributions, portfolio_returns
+
+    def calculate_sparse_returns(self, is_VT: bool = False, target_vol: float = None):
+        """
+        Calcule les rendements du portefeuille à partir de la matrice des pondérations stockée par événements,
+        sans la reconstruire en dense : les rendements sont calculés segment par segment entre deux événements,
+        sur les seules positions non nulles, et la rotation n'est calculée qu'aux événements.
+
+        :param is_VT: Booléen indiquant si on souhaite activer le Vol Targeting (par défaut : False).
+        :param target_vol: Volatilité cible annualisée (utile si is_VT=True).
+        :return:
+            - asset_contributions (pd.DataFrame) : contributions quotidiennes, au format creux (SparseDtype)
+            - portfolio_returns (pd.Series) : rendement quotidien du portefeuille
+            - cumulative_asset_returns (None) : non calculés en stockage creux
+            - cumulative_returns (pd.Series) : rendements cumulés du portefeuille
+            - result_trade (tuple) : (nombre total de trades, nombre de trades gagnants)
+        """
+        shifted_weights = self.weight_matrix.shift(1)
+        turnover = shifted_weights.turnover()
+
+        asset_contributions = shifted_weights.contributions(self.asset_returns)
+        portfolio_returns = shifted_weights.portfolio_returns(self.asset_returns) \
+            - turnover * self.transaction_cost - turnover * self.slippage
+        self.raw_portfolio_returns = portfolio_returns
+
+        if is_VT and (target_vol is not None):
+            portfolio_returns = self.apply_vol_targeting(portfolio_returns, target_vol)
+
+        cumulative_returns = (1 + portfolio_returns).cumprod() - 1
+
+        if self.special_start != 1:
+            shifted_weights = shifted_weights.slice(self.special_start + 1)
+            asset_contributions = asset_contributions.iloc[self.special_start + 1:]
+            portfolio_returns = portfolio_returns.iloc[self.special_start + 1:]
+            cumulative_returns = cumulative_returns.iloc[self.special_start + 1:]
+
+        # Les positions ne changent qu'aux événements : la première date et les rebalancements suffisent
+        self.trade_state = {}
+        result_trade = self.evaluate_trade(shifted_weights.event_frame(), self.trade_state)
+
+        return asset_contributions, portfolio_returns, None, cumulative_returns, result_trade
@@ -1,7 +1,6 @@
 from datetime import datetime, timedelta
 import pandas as pd
 from typing import List
-from workalendar.usa import UnitedStates
 
 class Calendar:
     """
@@ -18,7 +17,8 @@ class Calendar:
         'yearly': 'A',
     }
 
-    CALENDAR = UnitedStates()
+    # Calendrier des jours fériés (workalendar), importé et construit au premier usage
+    CALENDAR = None
 
     def __init__(self, frequency: str, start_date: str, end_date: str):
         """
@@ -59,6 +59,18 @@ class Calendar:
         """
         return date.weekday() < 5 and date.date() not in self.holidays
 
+    @classmethod
+    def holiday_calendar(cls):
+        """
+        Calendrier des jours fériés fédéraux aux États-Unis, construit au premier appel.
+
+        :return: Instance de workalendar.usa.UnitedStates.
+        """
+        if cls.CALENDAR is None:
+            from workalendar.usa import UnitedStates
+            Calendar.CALENDAR = UnitedStates()
+        return cls.CALENDAR
+
     @classmethod
     def get_holidays_in_range(cls, start_date: datetime, end_date: datetime) -> List[datetime.date]:
         """
@@ -73,7 +85,7 @@ class Calendar:
         end_year = end_date.year
 
         for year in range(start_year, end_year + 1):
-            yearly_holidays = cls.CALENDAR.holidays(year)
+            yearly_holidays = cls.holiday_calendar().holidays(year)
             for date, _ in yearly_holidays:
                 if start_date.date() <= date <= end_date.date():
                     holidays.append(date)
@@ -0,0 +1,181 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from backtesting_framework.Core.Backtester import Backtester
+from backtesting_framework.Core.Result import Result
+from backtesting_framework.Core.Strategy import Strategy
+from backtesting_framework.Utils.Tools import NA_VALUES
+
+
+class ChunkedBacktester:
+    """
+    Exécution d'un backtest par blocs de dates, pour des panels qui ne tiennent pas en mémoire
+    (barres intraday, larges univers). Le panel est lu bloc par bloc depuis un fichier Parquet ou CSV,
+    un tableau mémoire-mappé (.npy) ou tout itérable de DataFrames.
+
+    Le premier bloc est backtesté par Backtester.run, les suivants par Backtester.update : l'état de la stratégie,
+    les positions, les statistiques de trades et le rendement cumulé sont reportés d'un bloc à l'autre.
+    Après chaque bloc, seules les max_history dernières dates sont conservées en mémoire, et les rendements
+    du portefeuille et les trades sont écrits au fur et à mesure dans output_path et ledger_path : la mémoire
+    est bornée par la taille des blocs et non par la longueur de l'historique.
+    """
+
+    def __init__(self, data_source, chunk_size: int = 10000, max_history: int = None, output_path: str = None,
+                 ledger_path: str = None, index=None, columns=None, **backtester_kwargs):
+        """
+        :param data_source: Fichier Parquet, CSV ou .npy (mémoire-mappé), tableau NumPy, DataFrame
+                            ou itérable de DataFrames de prix (dates croissantes).
+        :param chunk_size: Nombre de dates par bloc (par défaut : 10000).
+        :param max_history: Nombre de dates conservées en mémoire entre deux blocs (par défaut : chunk_size).
+                            Doit couvrir l'historique utilisé par la stratégie et le schéma de pondération,
+                            ainsi qu'au moins deux dates de rebalancement.
+        :param output_path: Fichier CSV dans lequel les rendements du portefeuille sont écrits bloc par bloc
+                            (optionnel ; à défaut, les rendements sont conservés en mémoire).
+        :param ledger_path: Fichier CSV dans lequel le registre des trades est écrit bloc par bloc
+                            (optionnel ; à défaut, le registre est conservé en mémoire).
+        :param index: Dates des lignes d'un tableau NumPy ou d'un fichier .npy.
+        :param columns: Noms des actifs d'un tableau NumPy ou d'un fichier .npy.
+        :param backtester_kwargs: Paramètres transmis au Backtester (weight_scheme, transaction_cost, etc.).
+        :raises ValueError: Si chunk_size ou max_history n'est pas strictement positif.
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size doit être strictement positif.")
+        if max_history is not None and max_history <= 0:
+            raise ValueError("max_history doit être strictement positif.")
+        self.data_source = data_source
+        self.chunk_size = chunk_size
+        self.max_history = chunk_size if max_history is None else max_history
+        self.output_path = output_path
+        self.ledger_path = ledger_path
+        self.index = index
+        self.columns = columns
+        self.backtester_kwargs = backtester_kwargs
+        self.backtester = None
+
+    def iter_chunks(self):
+        """
+        Lit le panel de prix bloc par bloc, sans le charger entièrement.
+
+        :return: Générateur de DataFrames (dates x actifs) d'au plus chunk_size dates.
+        :raises ValueError: Si la source n'est pas supportée ou si index et columns manquent pour un tableau.
+        """
+        source = self.data_source
+        if isinstance(source, str) and source.endswith(".parquet"):
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            parquet_file = pq.ParquetFile(source)
+            metadata = parquet_file.schema_arrow.metadata
+            for batch in parquet_file.iter_batches(batch_size=self.chunk_size):
+                # Les métadonnées pandas du fichier restaurent l'index des dates de chaque bloc
+                yield pa.Table.from_batches([batch]).replace_schema_metadata(metadata).to_pandas()
+        elif isinstance(source, str) and source.endswith(".csv"):
+            yield from pd.read_csv(source, index_col=0, parse_dates=True, na_values=NA_VALUES,
+                                   chunksize=self.chunk_size)
+        elif isinstance(source, str) and source.endswith(".npy") or isinstance(source, np.ndarray):
+            if self.index is None or self.columns is None:
+                raise ValueError("index et columns sont requis pour un tableau NumPy.")
+            values = np.load(source, mmap_mode="r") if isinstance(source, str) else source
+            index = pd.Index(self.index)
+            for start in range(0, len(values), self.chunk_size):
+                stop = start + self.chunk_size
+                yield pd.DataFrame(np.array(values[start:stop], dtype="float64"), index=index[start:stop],
+                                   columns=self.columns)
+        elif isinstance(source, pd.DataFrame):
+            for start in range(0, len(source), self.chunk_size):
+                yield source.iloc[start:start + self.chunk_size]
+        elif not isinstance(source, str) and hasattr(source, "__iter__"):
+            yield from source
+        else:
+            raise ValueError("Le format de données n'est pas supporté. Veuillez fournir un fichier "
+                             "Parquet/CSV/.npy, un tableau NumPy, un DataFrame ou un itérable de DataFrames.")
+
+    def run(self, strategy: Strategy, is_VT=False, target_vol=None, lookback: int = None) -> Result:
+        """
+        Exécute le backtest bloc par bloc.
+
+        :param strategy: Instance de la classe Strategy définissant les signaux d'achat/vente.
+        :param is_VT: Booléen indiquant si on souhaite activer le Vol Targeting (par défaut False).
+        :param target_vol: Volatilité cible (annualisée). Optionnel si is_VT=True.
+        :param lookback: Nombre de dates d'historique transmises à la stratégie après le premier bloc
+                         (par défaut : tout l'historique conservé en mémoire).
+        :return: Instance de la classe Result sur l'ensemble de la période, avec le registre des trades
+                 et l'instrumentation cumulée de tous les blocs.
+        :raises ValueError: Si la source ne contient aucune donnée.
+        """
+        for path in (self.output_path, self.ledger_path):
+            if path is not None and os.path.exists(path):
+                os.remove(path)
+        returns_chunks = []
+        ledger_chunks = []
+        run_stats = None
+        last_date = None
+
+        for chunk in self.iter_chunks():
+            if chunk.empty:
+                continue
+            if self.backtester is None:
+                self.backtester = Backtester(data_source=chunk, **self.backtester_kwargs)
+                result = self.backtester.run(strategy, is_VT, target_vol)
+            else:
+                result = self.backtester.update(chunk, lookback=lookback)
+                # Les durées de chargement du premier bloc, reprises par chaque update, ne sont comptées qu'une fois
+                for name, seconds in self.backtester.init_timings.items():
+                    result.run_stats.timings[name] -= seconds
+            if run_stats is None:
+                run_stats = result.run_stats
+            else:
+                run_stats.merge(result.run_stats)
+
+            # Écriture des seuls rendements et trades des nouvelles dates (le registre des trades du Backtester
+            # ne contient que ceux du dernier run ou update), puis libération de l'historique ancien
+            new_returns = self.new_returns(last_date)
+            new_trades = self.backtester.trade_ledger
+            last_date = chunk.index[-1]
+            if self.output_path is not None:
+                new_returns.to_csv(self.output_path, mode="a", header=not os.path.exists(self.output_path))
+            else:
+                returns_chunks.append(new_returns)
+            if self.ledger_path is not None:
+                new_trades.to_csv(self.ledger_path, mode="a", index=False, header=not os.path.exists(self.ledger_path))
+            else:
+                ledger_chunks.append(new_trades)
+            self.backtester.trim_history(self.max_history)
+
+        if self.backtester is None:
+            raise ValueError("Le DataFrame fourni est vide ou invalide.")
+
+        if self.output_path is not None:
+            returns = pd.read_csv(self.output_path, index_col=0, parse_dates=True)
+        else:
+            returns = pd.concat(returns_chunks)
+        if self.ledger_path is not None:
+            trade_ledger = pd.read_csv(self.ledger_path, parse_dates=["date"])
+        else:
+            trade_ledger = pd.concat(ledger_chunks, ignore_index=True)
+        with run_stats.stage("metrics"):
+            return Result(
+                portfolio_returns=returns["portfolio_returns"],
+                cumulative_returns=returns["cumulative_returns"],
+                risk_free_rate=self.backtester.rfr,
+                trade_stats=(result.total_trades, result.winning_trades),
+                plot_library=self.backtester.plot_library,
+                trade_ledger=trade_ledger,
+                run_stats=run_stats
+            )
+
+    def new_returns(self, last_date) -> pd.DataFrame:
+        """
+        Rendements et rendements cumulés du portefeuille postérieurs à last_date.
+
+        :param last_date: Dernière date déjà écrite (None pour le premier bloc).
+        :return: DataFrame à deux colonnes (portfolio_returns, cumulative_returns).
+        """
+        state = self.backtester.state
+        returns = pd.DataFrame({
+            "portfolio_returns": state["portfolio_returns"].astype("float64"),
+            "cumulative_returns": state["cumulative_returns"].astype("float64"),
+        })
+        return returns if last_date is None else returns.loc[returns.index > last_date]
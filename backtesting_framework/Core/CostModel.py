@@ -0,0 +1,167 @@
+from abc import ABC, abstractmethod
+
+import numpy as np
+import pandas as pd
+
+from backtesting_framework.Utils import Indicators
+
+
+class CostModel(ABC):
+    """
+    Modèle de coûts de transaction : transforme la matrice des variations de pondérations (dates x actifs)
+    en coût par période, exprimé en rendement du portefeuille. Les calculs portent sur le panel entier.
+
+    Les panels de marché (spreads, volatilités, volumes) sont alignés sur la date de décision du trade,
+    c'est-à-dire décalés d'une période comme les pondérations.
+    """
+
+    @abstractmethod
+    def compute_costs(self, weight_changes: pd.DataFrame, backtester) -> pd.Series:
+        """
+        Calcule les coûts par période.
+
+        :param weight_changes: DataFrame des variations des pondérations décalées (dates x actifs).
+        :param backtester: Instance de Backtester fournissant asset_returns.
+        :return: Série Pandas des coûts par période.
+        """
+        pass
+
+    @staticmethod
+    def trade_sizes(weight_changes: pd.DataFrame) -> np.ndarray:
+        """
+        Valeur absolue des variations de pondérations, 0 lorsque la variation n'est pas définie.
+
+        :param weight_changes: DataFrame des variations des pondérations.
+        :return: np.ndarray (dates x actifs).
+        """
+        return np.nan_to_num(np.abs(weight_changes.to_numpy(dtype="float64")))
+
+    @staticmethod
+    def align(panel, weight_changes: pd.DataFrame) -> np.ndarray:
+        """
+        Aligne un paramètre de coût sur la matrice des variations de pondérations.
+
+        :param panel: Scalaire, Series indexée par actif ou DataFrame dates x actifs (décalé d'une période).
+        :param weight_changes: DataFrame des variations des pondérations.
+        :return: np.ndarray diffusable sur (dates x actifs).
+        """
+        if isinstance(panel, pd.DataFrame):
+            panel = panel.reindex(index=weight_changes.index, columns=weight_changes.columns).shift(1)
+            return panel.to_numpy(dtype="float64")
+        if isinstance(panel, pd.Series):
+            return panel.reindex(weight_changes.columns).to_numpy(dtype="float64")[np.newaxis, :]
+        return np.float64(panel)
+
+    @staticmethod
+    def to_series(costs: np.ndarray, weight_changes: pd.DataFrame) -> pd.Series:
+        """
+        Somme les coûts par actif en un coût par période.
+
+        :param costs: np.ndarray des coûts (dates x actifs), NaN comptés comme nuls.
+        :param weight_changes: DataFrame des variations des pondérations (pour l'index).
+        :return: Série Pandas des coûts par période.
+        """
+        return pd.Series(np.nansum(costs, axis=1), index=weight_changes.index)
+
+
+class FlatCost(CostModel):
+    """
+    Coût proportionnel à la rotation, identique pour tous les actifs.
+    """
+
+    def __init__(self, rate: float):
+        """
+        :param rate: Coût par unité de pondération échangée (0.001 = 10 points de base).
+        """
+        self.rate = rate
+
+    def compute_costs(self, weight_changes, backtester):
+        return pd.Series(self.trade_sizes(weight_changes).sum(axis=1) * self.rate, index=weight_changes.index)
+
+
+class PerAssetBpsCost(CostModel):
+    """
+    Coût en points de base propre à chaque actif (table de frais par titre).
+    """
+
+    def __init__(self, bps, default_bps: float = 0.0):
+        """
+        :param bps: Dictionnaire ou Series {actif: coût en points de base}, ou DataFrame dates x actifs.
+        :param default_bps: Coût appliqué aux actifs absents de la table (par défaut : 0.0).
+        """
+        self.bps = pd.Series(bps, dtype="float64") if isinstance(bps, dict) else bps
+        self.default_bps = default_bps
+
+    def compute_costs(self, weight_changes, backtester):
+        bps = self.align(self.bps, weight_changes)
+        bps = np.where(np.isnan(bps), self.default_bps, bps)
+        return self.to_series(self.trade_sizes(weight_changes) * bps / 10000, weight_changes)
+
+
+class SpreadCost(CostModel):
+    """
+    Coût de franchissement de la fourchette : chaque trade paie la moitié du spread relatif (bid-ask / mid).
+    """
+
+    def __init__(self, spreads):
+        """
+        :param spreads: Spread relatif : scalaire, Series par actif ou DataFrame dates x actifs.
+        """
+        self.spreads = spreads
+
+    def compute_costs(self, weight_changes, backtester):
+        spreads = self.align(self.spreads, weight_changes)
+        return self.to_series(self.trade_sizes(weight_changes) * spreads / 2, weight_changes)
+
+
+class SquareRootImpact(CostModel):
+    """
+    Impact de marché en racine carrée : le coût unitaire d'un trade vaut coefficient x σ x sqrt(Q / ADV),
+    où Q est le montant échangé et ADV le volume quotidien moyen échangé (en devise).
+    Les actifs sans volume connu n'ont pas de coût d'impact.
+    """
+
+    def __init__(self, adv, portfolio_value: float, volatility=None, coefficient: float = 1.0, window: int = 20):
+        """
+        :param adv: Volume quotidien moyen échangé en devise : Series par actif ou DataFrame dates x actifs.
+        :param portfolio_value: Valeur du portefeuille en devise, pour convertir les pondérations en montants.
+        :param volatility: Volatilité quotidienne : Series par actif ou DataFrame dates x actifs. Par défaut,
+                           écart-type glissant des rendements des actifs sur window jours.
+        :param coefficient: Coefficient d'impact (par défaut : 1.0).
+        :param window: Fenêtre de la volatilité par défaut (par défaut : 20).
+        """
+        self.adv = adv
+        self.portfolio_value = portfolio_value
+        self.volatility = volatility
+        self.coefficient = coefficient
+        self.window = window
+
+    def compute_costs(self, weight_changes, backtester):
+        volatility = self.volatility
+        if volatility is None:
+            volatility = Indicators.rolling_std(backtester.asset_returns, self.window)
+
+        sizes = self.trade_sizes(weight_changes)
+        adv = self.align(self.adv, weight_changes)
+        participation = np.full(np.broadcast(sizes, adv).shape, np.nan)
+        np.divide(sizes * self.portfolio_value, adv, out=participation, where=adv > 0)
+        impact = self.coefficient * self.align(volatility, weight_changes) * np.sqrt(participation)
+        return self.to_series(sizes * impact, weight_changes)
+
+
+class CompositeCost(CostModel):
+    """
+    Somme de plusieurs modèles de coûts (par exemple frais fixes + spread + impact).
+    """
+
+    def __init__(self, *models: CostModel):
+        """
+        :param models: Modèles de coûts à additionner.
+        """
+        self.models = models
+
+    def compute_costs(self, weight_changes, backtester):
+        costs = pd.Series(0.0, index=weight_changes.index)
+        for model in self.models:
+            costs = costs + model.compute_costs(weight_changes, backtester)
+        return costs
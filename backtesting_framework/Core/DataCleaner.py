@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+
+
+class DataCleaner:
+    """
+    Classe de nettoyage des données de marché, appliquée une seule fois à l'initialisation du Backtester :
+    Prolongation limitée des prix manquants, masquage des périodes avant cotation et après radiation,
+    et détection des prix figés. Produit le panel nettoyé et le masque de validité lu par les stratégies.
+    """
+
+    def __init__(self, ffill_limit=5, stale_limit=None, mask_unlisted=True):
+        """
+        Initialisation du nettoyeur de données.
+
+        :param ffill_limit: Nombre maximal de prix manquants consécutifs prolongés par la dernière valeur connue
+                            (None = sans limite, 0 = aucune prolongation).
+        :param stale_limit: Nombre maximal de prix identiques consécutifs avant que les suivants ne soient
+                            considérés comme figés et invalidés (None = pas de détection).
+        :param mask_unlisted: Si True, aucun prix n'est prolongé avant la première ni après la dernière cotation.
+        :raises ValueError: Si ffill_limit ou stale_limit est négatif.
+        """
+        if ffill_limit is not None and ffill_limit < 0:
+            raise ValueError("ffill_limit doit être positif ou nul.")
+        if stale_limit is not None and stale_limit < 1:
+            raise ValueError("stale_limit doit être supérieur ou égal à 1.")
+
+        self.ffill_limit = ffill_limit
+        self.stale_limit = stale_limit
+        self.mask_unlisted = mask_unlisted
+
+    def clean(self, data: pd.DataFrame) -> tuple:
+        """
+        Nettoie le panel de prix sans modifier le DataFrame fourni.
+
+        :param data: pd.DataFrame des prix (dates x actifs).
+        :return: Tuple (panel nettoyé, masque de validité booléen de même forme).
+        """
+        stale = self.detect_stale_prices(data)
+
+        if self.ffill_limit == 0:
+            cleaned = data.copy()
+        else:
+            limit_area = "inside" if self.mask_unlisted else None
+            cleaned = data.ffill(limit=self.ffill_limit, limit_area=limit_area)
+
+        if stale is not None:
+            cleaned = cleaned.mask(stale)
+
+        valid_mask = cleaned.notna()
+        return cleaned, valid_mask
+
+    def detect_stale_prices(self, data: pd.DataFrame):
+        """
+        Identifie les prix figés : au-delà de stale_limit prix identiques consécutifs, les suivants sont invalides.
+
+        :param data: pd.DataFrame des prix (dates x actifs).
+        :return: pd.DataFrame booléen des prix figés, ou None si la détection est désactivée.
+        """
+        if self.stale_limit is None:
+            return None
+
+        values = data.to_numpy(dtype="float64")
+        unchanged = np.zeros(values.shape, dtype=bool)
+        unchanged[1:] = values[1:] == values[:-1]
+
+        # Longueur de la série de prix inchangés en cours, remise à zéro à chaque variation
+        cumulative = np.cumsum(unchanged, axis=0)
+        last_reset = np.maximum.accumulate(np.where(unchanged, 0, cumulative), axis=0)
+        run_length = cumulative - last_reset
+
+        return pd.DataFrame(run_length >= self.stale_limit, index=data.index, columns=data.columns)
@@ -0,0 +1,112 @@
+import numpy as np
+import pandas as pd
+from backtesting_framework.Utils.Tools import load_panel
+
+
+class FactorEngine:
+    """
+    Moteur de facteurs cross-sectionnels :
+    Combine un nombre quelconque de métriques (PER, ROE, capitalisation, etc.) en un score par actif et par date,
+    puis construit la matrice de composition long/short complète en une seule passe vectorisée.
+    """
+
+    def __init__(self, metrics: dict, window: int = 30, assets_picked_long: int = 5, assets_picked_short: int = 5,
+                 dtype: str = "float64"):
+        """
+        Initialisation du moteur de facteurs.
+
+        :param metrics: Dictionnaire {nom de la métrique: (direction, poids)}. Une direction de 1 signifie qu'une
+                        valeur élevée de la métrique est favorable, une direction de -1 qu'une valeur basse l'est.
+        :param window: Période, en nombre de jours, de la fenêtre glissante pour lisser les métriques.
+        :param assets_picked_long: Nombre d'actifs à acheter à chaque date.
+        :param assets_picked_short: Nombre d'actifs à vendre à chaque date.
+        :param dtype: Type flottant des panels de métriques ('float64' ou 'float32').
+        :raises ValueError: Si aucune métrique n'est fournie ou si une direction est invalide.
+        """
+        if not metrics:
+            raise ValueError("Au moins une métrique doit être fournie au moteur de facteurs.")
+        for name, (direction, _) in metrics.items():
+            if direction not in (1, -1):
+                raise ValueError(f"La direction de la métrique '{name}' doit valoir 1 ou -1.")
+
+        self.metrics = metrics
+        self.window = window
+        self.assets_picked_long = assets_picked_long
+        self.assets_picked_short = assets_picked_short
+        self.dtype = dtype
+        self.scores = None
+        self.composition = None
+
+    def fit(self, panels: dict) -> pd.DataFrame:
+        """
+        Calcule les scores puis la matrice de composition à partir des panels de métriques.
+
+        :param panels: Dictionnaire {nom de la métrique: DataFrame dates x actifs}.
+        :return: DataFrame de composition (1 = long, -1 = short, 0 = neutre).
+        :raises KeyError: Si une métrique configurée est absente des panels.
+        """
+        missing = [name for name in self.metrics if name not in panels]
+        if missing:
+            raise KeyError(f"Métriques manquantes pour le moteur de facteurs : {missing}")
+
+        self.scores = self.compute_scores(panels)
+        self.composition = self.select_positions(self.scores)
+        return self.composition
+
+    def compute_scores(self, panels: dict) -> pd.DataFrame:
+        """
+        Lisse chaque métrique sur la fenêtre glissante, la classe de manière cross-sectionnelle
+        puis combine les rangs selon les poids de chaque métrique.
+        Plus le score est élevé, plus l'actif est attractif. Les panels fournis ne sont jamais modifiés.
+
+        :param panels: Dictionnaire {nom de la métrique: DataFrame dates x actifs ou chemin CSV/Parquet}.
+        :return: DataFrame des scores combinés (NaN si une métrique est indisponible).
+        """
+        weighted_sum = None
+        total_weight = 0.0
+        for name, (direction, weight) in self.metrics.items():
+            panel = load_panel(panels[name], self.dtype)
+            rolling = panel.rolling(self.window).mean()
+            score = rolling.rank(axis=1, method="first", ascending=(direction == 1))
+            weighted_sum = weight * score if weighted_sum is None else weighted_sum + weight * score
+            total_weight += weight
+
+        return weighted_sum / total_weight
+
+    def select_positions(self, scores: pd.DataFrame) -> pd.DataFrame:
+        """
+        Sélectionne, pour chaque date, les assets_picked_long meilleurs scores (long) et les
+        assets_picked_short moins bons (short). En cas d'égalité, tous les actifs ex-aequo sont retenus.
+
+        Les seuils de sélection sont obtenus par np.partition sur l'ensemble des dates partageant le même nombre
+        d'actifs valides, sans classement complet ni boucle par actif.
+
+        :param scores: DataFrame des scores combinés (dates x actifs).
+        :return: DataFrame de composition (1 = long, -1 = short, 0 = neutre).
+        """
+        values = scores.to_numpy(dtype="float64")
+        valid = ~np.isnan(values)
+        counts = valid.sum(axis=1)
+        # Les NaN sont repoussés en fin de ligne pour que les valeurs valides occupent les premiers rangs
+        filled = np.where(valid, values, np.inf)
+
+        long_threshold = np.full(len(values), np.inf)
+        short_threshold = np.full(len(values), -np.inf)
+
+        for count in np.unique(counts[counts > 0]):
+            rows = counts == count
+            long_kth = count - self.assets_picked_long - 1
+            short_kth = min(self.assets_picked_short, count) - 1
+            kth = sorted({k for k in (long_kth, short_kth) if k >= 0})
+
+            partitioned = np.partition(filled[rows], kth, axis=1) if kth else None
+            # Long : score strictement supérieur à la (count - assets_picked_long)-ième plus petite valeur
+            long_threshold[rows] = partitioned[:, long_kth] if long_kth >= 0 else -np.inf
+            # Short : score inférieur ou égal à la assets_picked_short-ième plus petite valeur
+            short_threshold[rows] = partitioned[:, short_kth] if short_kth >= 0 else -np.inf
+
+        is_long = valid & (values > long_threshold[:, np.newaxis])
+        is_short = valid & ~is_long & (values <= short_threshold[:, np.newaxis])
+        composition = np.where(is_long, 1.0, np.where(is_short, -1.0, 0.0))
+
+        return pd.DataFrame(composition, index=scores.index, columns=scores.columns)
@@ -0,0 +1,131 @@
+import cProfile
+import json
+import os
+import pstats
+import tracemalloc
+
+import pandas as pd
+
+
+class Profiler:
+    """
+    Profilage d'un backtest : profil déterministe des appels (cProfile) et pic de mémoire allouée
+    par étape (tracemalloc), mesuré à partir des étapes de RunStats.
+
+    Les résultats sont écrits dans output_dir sous la forme d'un fichier .prof standard (lisible par pstats,
+    snakeviz, etc.) et d'un fichier JSON résumant les durées, les pics de mémoire et les fonctions
+    les plus coûteuses du framework (Strategies/ et Core/).
+    """
+
+    # Variable d'environnement activant le profilage : '1' (répertoire par défaut) ou répertoire de sortie
+    ENV_VARIABLE = "BACKTEST_PROFILE"
+    DEFAULT_DIRECTORY = "profiles"
+    # Répertoires du framework dont les fonctions sont retenues dans le résumé
+    PACKAGES = ("Strategies", "Core")
+
+    def __init__(self, output_dir: str = DEFAULT_DIRECTORY, top: int = 20):
+        """
+        :param output_dir: Répertoire des fichiers de profilage (créé si nécessaire, par défaut : 'profiles').
+        :param top: Nombre de fonctions retenues dans le résumé (par défaut : 20).
+        """
+        self.output_dir = output_dir
+        self.top = top
+        self.profile = cProfile.Profile()
+        self.peak_memory = {}
+        self._peaks = []
+        self._was_tracing = False
+
+    @classmethod
+    def from_setting(cls, profile=None):
+        """
+        Construit le profileur correspondant au paramètre profile de Backtester.run ou, à défaut,
+        à la variable d'environnement BACKTEST_PROFILE.
+
+        :param profile: True (répertoire par défaut), répertoire de sortie, False (désactivé)
+                        ou None (selon la variable d'environnement).
+        :return: Instance de Profiler, ou None si le profilage est désactivé.
+        """
+        if profile is None:
+            profile = os.environ.get(cls.ENV_VARIABLE, "")
+            if profile.lower() in ("", "0", "false"):
+                return None
+            if profile.lower() in ("1", "true"):
+                profile = True
+        if profile is False:
+            return None
+        return cls() if profile is True else cls(str(profile))
+
+    def __enter__(self):
+        self._was_tracing = tracemalloc.is_tracing()
+        if not self._was_tracing:
+            tracemalloc.start()
+        self.profile.enable()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.profile.disable()
+        if not self._was_tracing:
+            tracemalloc.stop()
+        return False
+
+    def hook(self, event: str, name: str, value=None):
+        """
+        Fonction d'écoute de RunStats : mesure le pic de mémoire allouée pendant chaque étape,
+        étapes imbriquées comprises.
+        """
+        if not tracemalloc.is_tracing():
+            return
+        if event == "stage_start":
+            # Le pic de l'étape englobante avant cette étape est conservé, puis le pic est réinitialisé
+            if self._peaks:
+                self._peaks[-1] = max(self._peaks[-1], tracemalloc.get_traced_memory()[1])
+            self._peaks.append(0)
+            tracemalloc.reset_peak()
+        elif event == "stage_end" and self._peaks:
+            peak = max(self._peaks.pop(), tracemalloc.get_traced_memory()[1])
+            self.peak_memory[name] = max(self.peak_memory.get(name, 0), peak)
+            if self._peaks:
+                self._peaks[-1] = max(self._peaks[-1], peak)
+            tracemalloc.reset_peak()
+
+    def hot_functions(self, top: int = None) -> pd.DataFrame:
+        """
+        Fonctions du framework (Strategies/ et Core/) les plus coûteuses, triées par temps propre.
+
+        :param top: Nombre de fonctions retenues (par défaut : top du profileur).
+        :return: DataFrame (function, calls, tottime, cumtime), tottime et cumtime en secondes.
+        """
+        top = self.top if top is None else top
+        folders = tuple(f"{os.sep}{package}{os.sep}" for package in self.PACKAGES)
+        rows = []
+        for (filename, line, function), (_, calls, tottime, cumtime, _) in pstats.Stats(self.profile).stats.items():
+            if "backtesting_framework" in filename and any(folder in filename for folder in folders):
+                module = filename.split(f"backtesting_framework{os.sep}")[-1]
+                rows.append({"function": f"{module}:{line}({function})", "calls": calls, "tottime": tottime,
+                             "cumtime": cumtime})
+        hot = pd.DataFrame(rows, columns=["function", "calls", "tottime", "cumtime"])
+        return hot.sort_values("tottime", ascending=False).head(top).reset_index(drop=True)
+
+    def save(self, name: str, run_stats=None) -> tuple:
+        """
+        Écrit le profil (.prof) et le résumé JSON (durées et pics de mémoire par étape, compteurs,
+        fonctions les plus coûteuses) dans output_dir.
+
+        :param name: Nom des fichiers (sans extension), par exemple le nom de la stratégie.
+        :param run_stats: Instance de RunStats du backtest profilé (optionnel).
+        :return: Tuple (chemin du fichier .prof, chemin du fichier JSON).
+        """
+        os.makedirs(self.output_dir, exist_ok=True)
+        profile_path = os.path.join(self.output_dir, f"{name}.prof")
+        summary_path = os.path.join(self.output_dir, f"{name}.json")
+        self.profile.dump_stats(profile_path)
+
+        summary = {
+            "timings": run_stats.timings if run_stats is not None else {},
+            "peak_memory": self.peak_memory,
+            "counters": run_stats.counters if run_stats is not None else {},
+            "hot_functions": self.hot_functions().to_dict(orient="records"),
+        }
+        with open(summary_path, "w", encoding="utf-8") as file:
+            json.dump(summary, file, indent=2)
+        return profile_path, summary_path
@@ -0,0 +1,209 @@
+import base64
+import copy
+import html
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+
+# Graphiques d'un rapport : nom du fichier (sans extension) -> (méthode du Result, titre)
+CHARTS = {
+    "cumulative_returns": ("plot_cumulative_returns", "Rendements Cumulés"),
+    "monthly_returns_heatmap": ("plot_monthly_returns_heatmap", "Heatmap des Rendements Mensuels"),
+    "returns_distribution": ("plot_returns_distribution", "Distribution des Rendements"),
+}
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="fr">
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<style>
+body {{ font-family: sans-serif; margin: 2em; }}
+table {{ border-collapse: collapse; }}
+th, td {{ border: 1px solid #ccc; padding: 4px 8px; text-align: right; }}
+th {{ background: #f0f0f0; }}
+img {{ max-width: 100%; }}
+</style>
+{scripts}
+</head>
+<body>
+<h1>{title}</h1>
+{body}
+</body>
+</html>
+"""
+
+
+def render_charts(result, paths: dict, plot_library: str = None) -> dict:
+    """
+    Enregistre les graphiques d'un Result dans des fichiers, sur un canevas Agg (sans pyplot ni changement de backend).
+    Fonction exécutée dans les processus du pool de ReportBuilder, une fois par Result (transmis une seule fois) ;
+    le Result transmis n'est pas modifié.
+
+    :param result: Instance de Result.
+    :param paths: Dictionnaire {nom du graphique (clé de CHARTS): fichier de sortie}.
+    :param plot_library: Bibliothèque de visualisation (par défaut : celle du Result).
+    :return: Dictionnaire des fichiers écrits.
+    """
+    if plot_library is not None:
+        result = copy.copy(result)
+        result.plot_library = plot_library
+    for chart, output_path in paths.items():
+        method, _ = CHARTS[chart]
+        getattr(result, method)(output_path=output_path)
+    return paths
+
+
+class ReportBuilder:
+    """
+    Génération de rapports sans affichage : les graphiques de chaque stratégie sont rendus dans des fichiers
+    (PNG ou SVG avec matplotlib et seaborn, fragments HTML avec plotly) en parallèle dans un pool de processus,
+    à raison d'une tâche par stratégie.
+
+    Chaque stratégie dispose d'un rapport HTML autonome (statistiques et graphiques intégrés) dans son répertoire,
+    et une page d'index compare toutes les stratégies avec un lien vers chaque rapport. Les graphiques plotly
+    sont intégrés comme fragments et plotly.js n'est inclus qu'une fois par rapport.
+    """
+
+    IMAGE_FORMATS = ("png", "svg", "html")
+
+    def __init__(self, output_dir: str, plot_library: str = None, image_format: str = None, max_workers: int = None):
+        """
+        :param output_dir: Répertoire des rapports (créé si nécessaire).
+        :param plot_library: Bibliothèque de visualisation imposée à tous les Result (par défaut : celle de chaque Result).
+        :param image_format: Format des graphiques : 'png', 'svg' ou 'html' (par défaut : 'html' avec plotly, 'png' sinon).
+        :param max_workers: Nombre de processus du pool (par défaut : nombre de processeurs ; 1 pour un rendu
+                            dans le processus courant).
+        :raises ValueError: Si le format des graphiques n'est pas supporté.
+        """
+        if image_format is not None and image_format.lower() not in self.IMAGE_FORMATS:
+            raise ValueError(f"Format '{image_format}' non supporté. Formats disponibles : {list(self.IMAGE_FORMATS)}")
+        self.output_dir = output_dir
+        self.plot_library = plot_library
+        self.image_format = image_format.lower() if image_format is not None else None
+        self.max_workers = max_workers
+        self.report_paths = {}
+
+    @staticmethod
+    def slug(name: str) -> str:
+        """
+        Nom de répertoire d'une stratégie (caractères alphanumériques, tirets et soulignés).
+
+        :param name: Nom de la stratégie.
+        :return: Nom de répertoire.
+        """
+        return re.sub(r"[^\w\-]+", "_", str(name)).strip("_") or "strategy"
+
+    def chart_format(self, result) -> str:
+        """
+        Format des graphiques d'un Result.
+
+        :param result: Instance de Result.
+        :return: Format des graphiques ('png', 'svg' ou 'html').
+        """
+        if self.image_format is not None:
+            return self.image_format
+        plot_library = self.plot_library or result.plot_library
+        return "html" if plot_library == "plotly" else "png"
+
+    def build(self, results: dict) -> str:
+        """
+        Génère les graphiques en parallèle, le rapport de chaque stratégie et la page d'index.
+
+        :param results: Dictionnaire {nom de la stratégie: Result}.
+        :return: Chemin de la page d'index.
+        :raises ValueError: Si deux stratégies ont le même nom de répertoire.
+        """
+        os.makedirs(self.output_dir, exist_ok=True)
+        directories = {name: self.slug(name) for name in results}
+        if len(set(directories.values())) < len(directories):
+            raise ValueError("Plusieurs stratégies ont le même nom de répertoire.")
+
+        charts = {}
+        for name, result in results.items():
+            os.makedirs(os.path.join(self.output_dir, directories[name]), exist_ok=True)
+            # Les graphiques HTML sont des fragments (.div), intégrés au rapport qui charge plotly.js
+            extension = {"html": "div"}.get(self.chart_format(result), self.chart_format(result))
+            charts[name] = {chart: os.path.join(self.output_dir, directories[name], f"{chart}.{extension}")
+                            for chart in CHARTS}
+
+        if self.max_workers == 1:
+            for name, result in results.items():
+                render_charts(result, charts[name], self.plot_library)
+        else:
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = [executor.submit(render_charts, result, charts[name], self.plot_library)
+                           for name, result in results.items()]
+                for future in futures:
+                    future.result()
+
+        self.report_paths = {name: self.write_report(name, result, charts[name])
+                             for name, result in results.items()}
+        return self.write_index(results, directories)
+
+    def write_report(self, name: str, result, charts: dict) -> str:
+        """
+        Écrit le rapport HTML autonome d'une stratégie : statistiques et graphiques intégrés au fichier,
+        plotly.js inclus une seule fois si le rapport contient des graphiques plotly.
+
+        :param name: Nom de la stratégie.
+        :param result: Instance de Result.
+        :param charts: Dictionnaire {nom du graphique: fichier du graphique}.
+        :return: Chemin du rapport.
+        """
+        statistics = pd.Series(result.statistics(), name="Valeur").to_frame()
+        sections = ["<h2>Statistiques de Performance</h2>", statistics.to_html(header=False)]
+        for chart, path in charts.items():
+            sections.append(f"<h2>{CHARTS[chart][1]}</h2>")
+            sections.append(self.embed_chart(path))
+
+        scripts = ""
+        if any(path.endswith(".div") for path in charts.values()):
+            from plotly.offline import get_plotlyjs
+            # plotly.js est intégré au rapport : la page s'affiche sans accès réseau
+            scripts = f'<script type="text/javascript">{get_plotlyjs()}</script>'
+
+        path = os.path.join(self.output_dir, self.slug(name), "report.html")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(PAGE_TEMPLATE.format(title=html.escape(str(name)), scripts=scripts, body="\n".join(sections)))
+        return path
+
+    @staticmethod
+    def embed_chart(path: str) -> str:
+        """
+        Code HTML intégrant un graphique au rapport : image encodée en base64, ou fragment plotly.
+
+        :param path: Fichier du graphique.
+        :return: Code HTML.
+        """
+        if path.endswith(".div"):
+            with open(path, encoding="utf-8") as file:
+                return file.read()
+        mime = "image/svg+xml" if path.endswith(".svg") else "image/png"
+        with open(path, "rb") as file:
+            data = base64.b64encode(file.read()).decode("ascii")
+        return f'<img src="data:{mime};base64,{data}" alt="{os.path.basename(path)}">'
+
+    def write_index(self, results: dict, directories: dict) -> str:
+        """
+        Écrit la page d'index : tableau comparatif des stratégies avec un lien vers chaque rapport.
+
+        :param results: Dictionnaire {nom de la stratégie: Result}.
+        :param directories: Dictionnaire {nom de la stratégie: répertoire du rapport}.
+        :return: Chemin de la page d'index.
+        """
+        rows = {}
+        for name, result in results.items():
+            link = f'<a href="{directories[name]}/report.html">{html.escape(str(name))}</a>'
+            rows[link] = result.statistics()
+        table = pd.DataFrame.from_dict(rows, orient="index")
+        table.index.name = "Stratégie"
+
+        path = os.path.join(self.output_dir, "index.html")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(PAGE_TEMPLATE.format(title="Rapports des stratégies", scripts="",
+                                            body=table.to_html(escape=False)))
+        return path
@@ -1,10 +1,9 @@
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-import plotly.express as px
 import calendar
-from scipy.stats import skew, kurtosis
+import contextlib
+from backtesting_framework.Utils.Downsampling import DOWNSAMPLING_METHODS, downsample
+from backtesting_framework.Utils.Tools import from_record_batch, read_arrow, to_record_batch, write_arrow
 
 
 class Result:
@@ -14,9 +13,12 @@ class Result:
     et fournit des graphiques (rendements cumulés, heatmap mensuelle, distribution) en utilisant la bibliothèque de visualisation choisie.
     """
     PERIODS_PER_YEAR = 252
+    # Nombre maximal de points par série tracée (les séries plus longues sont sous-échantillonnées)
+    MAX_PLOT_POINTS = 5000
 
     def __init__(self, portfolio_returns, cumulative_returns, risk_free_rate=0.0, trade_stats=None,
-                 plot_library='matplotlib'):
+                 plot_library='matplotlib', trade_ledger=None, run_stats=None, max_points=MAX_PLOT_POINTS,
+                 downsampling='lttb'):
         """
         Initialise l'objet Result.
 
@@ -33,6 +35,14 @@ class Result:
         :param plot_library: str, optionnel
             Bibliothèque de visualisation à utiliser pour les graphiques. Choix possibles : 'matplotlib', 'seaborn', 'plotly'.
             Par défaut : 'matplotlib'.
+        :param trade_ledger: pd.DataFrame, optionnel
+            Registre des trades (date, actif, positions et prix avant/après, trade gagnant).
+        :param run_stats: RunStats, optionnel
+            Instrumentation du backtest (durées des étapes, compteurs et latences des appels).
+        :param max_points: int, optionnel
+            Nombre maximal de points par série tracée (par défaut = 5000). None pour tracer toutes les valeurs.
+        :param downsampling: str, optionnel
+            Méthode de sous-échantillonnage des séries tracées : 'lttb' ou 'minmax'. Par défaut : 'lttb'.
         """
         if not isinstance(portfolio_returns, pd.Series) or not isinstance(cumulative_returns, pd.Series):
             raise TypeError("portfolio_returns et cumulative_returns doivent être des séries pandas.")
@@ -42,6 +52,8 @@ class Result:
             raise TypeError("plot_library doit être une chaîne de caractères.")
         if plot_library.lower() not in ['matplotlib', 'seaborn', 'plotly']:
             raise ValueError("plot_library doit être l'une des suivantes : 'matplotlib', 'seaborn', 'plotly'.")
+        if downsampling not in DOWNSAMPLING_METHODS:
+            raise ValueError(f"downsampling doit être l'une des suivantes : {list(DOWNSAMPLING_METHODS)}.")
 
         daily_returns = pd.to_numeric(portfolio_returns, errors='coerce').dropna()
         self.portfolio_returns = daily_returns.copy()
@@ -49,6 +61,8 @@ class Result:
         self.cumulative_returns = cumulative_returns
         self.risk_free_rate = risk_free_rate
         self.plot_library = plot_library.lower()
+        self.max_points = max_points
+        self.downsampling = downsampling
 
         # Métriques de performance de base
         self.total_return = self.calculate_total_return()
@@ -62,13 +76,15 @@ class Result:
 
         # Skewness et Kurtosis
         daily_returns_array = daily_returns.to_numpy()
-        self.skewness = skew(daily_returns_array)
-        self.kurtosis = kurtosis(daily_returns_array)
+        self.skewness = self.calculate_skewness(daily_returns_array)
+        self.kurtosis = self.calculate_kurtosis(daily_returns_array)
 
         # Statistiques des trades
         self.total_trades = trade_stats[0] if trade_stats else 0
         self.winning_trades = trade_stats[1] if trade_stats else 0
         self.win_rate = (self.winning_trades / self.total_trades) if self.total_trades > 0 else 0.0
+        self.trade_ledger = trade_ledger
+        self.run_stats = run_stats
 
     def calculate_total_return(self):
         """
@@ -170,6 +186,44 @@ class Result:
         mdd = abs(self.max_drawdown)
         return np.nan if mdd == 0 else round((self.annualized_return / mdd), 3)
 
+    @staticmethod
+    def central_moments(returns):
+        """
+        Calcule les moments centrés d'ordre 2, 3 et 4 des rendements (estimateurs biaisés, comme scipy.stats).
+
+        :param returns: np.ndarray
+            Tableau des rendements.
+        :return: tuple
+            Moments centrés (m2, m3, m4).
+        """
+        deviations = np.asarray(returns, dtype="float64") - np.mean(returns)
+        squared = deviations ** 2
+        return squared.mean(), (squared * deviations).mean(), (squared ** 2).mean()
+
+    def calculate_skewness(self, returns):
+        """
+        Calcule le coefficient d'asymétrie (skewness) des rendements.
+
+        :param returns: np.ndarray
+            Tableau des rendements.
+        :return: float
+            Skewness (NaN si les rendements sont constants).
+        """
+        m2, m3, _ = self.central_moments(returns)
+        return m3 / m2 ** 1.5 if m2 > 0 else np.nan
+
+    def calculate_kurtosis(self, returns):
+        """
+        Calcule le coefficient d'aplatissement (kurtosis) en excès des rendements (définition de Fisher).
+
+        :param returns: np.ndarray
+            Tableau des rendements.
+        :return: float
+            Kurtosis en excès (NaN si les rendements sont constants).
+        """
+        m2, _, m4 = self.central_moments(returns)
+        return m4 / m2 ** 2 - 3.0 if m2 > 0 else np.nan
+
     def calculate_var(self, alpha=0.05):
         """
         Calcule la Value at Risk (VaR) au niveau de confiance alpha.
@@ -211,15 +265,15 @@ class Result:
         pivot.columns = [calendar.month_abbr[int(m)] for m in pivot.columns]
         return pivot
 
-    def display_statistics(self, streamlit_display=False):
+    def statistics(self):
         """
-        Affiche les principales statistiques de performance.
+        Retourne les principales statistiques de performance, mises en forme pour l'affichage.
         Inclut la VaR et l'Expected Shortfall à 95% par défaut.
 
-        :param streamlit_display: bool, optionnel
-            Si True, affiche les statistiques via Streamlit. Sinon, les imprime dans la console.
+        :return: dict
+            Dictionnaire {nom de la statistique: valeur formatée}.
         """
-        stats = {
+        return {
             'Rendement Total': f"{self.total_return:.2%}",
             'Rendement Annualisé': f"{self.annualized_return:.2%}",
             'Volatilité': f"{self.volatility:.2%}",
@@ -241,6 +295,16 @@ class Result:
             'Expected Shortfall (95%)': f"{self.calculate_expected_shortfall(0.05):.2%}"
         }
 
+    def display_statistics(self, streamlit_display=False):
+        """
+        Affiche les principales statistiques de performance.
+        Inclut la VaR et l'Expected Shortfall à 95% par défaut.
+
+        :param streamlit_display: bool, optionnel
+            Si True, affiche les statistiques via Streamlit. Sinon, les imprime dans la console.
+        """
+        stats = self.statistics()
+
         if streamlit_display:
             import streamlit as st
             st.subheader("Statistiques de Performance")
@@ -252,7 +316,7 @@ class Result:
             for key, val in stats.items():
                 print(f"{key} : {val}")
 
-    def compare(self, other_results, strategy_names=None, streamlit_display=False):
+    def compare(self, other_results, strategy_names=None, streamlit_display=False, output_path=None):
         """
         Compare l'objet actuel (self) avec d'autres objets Result passés en paramètre.
         Affiche (ou retourne) un tableau comparatif ET trace un graphique comparant
@@ -266,6 +330,9 @@ class Result:
         :param streamlit_display: bool, optionnel
             Si True, affiche le tableau et le graphique via Streamlit.
             Sinon, imprime le tableau dans la console et affiche le graphique via la librairie choisie.
+        :param output_path: str, optionnel
+            Fichier dans lequel le graphique est enregistré au lieu d'être affiché (PNG, SVG, PDF avec matplotlib ;
+            HTML statique avec plotly, ou image si kaleido est installé).
         :return: pd.DataFrame
             Un DataFrame contenant la comparaison des stratégies.
         """
@@ -318,54 +385,39 @@ class Result:
             print("------------------------------------------")
             print(df_comparison.to_string(index=False))
 
-        # 5Construction d'un DataFrame avec les rendements cumulés de chaque stratégie
-        df_cum_returns = pd.DataFrame()
-        for idx, res in enumerate(all_results):
-            col_name = strategy_names[idx]
-            if df_cum_returns.empty:
-                df_cum_returns = res.cumulative_returns.to_frame(name=col_name)
-            else:
-                df_cum_returns = df_cum_returns.join(
-                    res.cumulative_returns.to_frame(name=col_name),
-                    how='outer'
-                )
-
-        df_cum_returns.fillna(method='ffill', inplace=True)
+        # Construction d'un DataFrame avec les rendements cumulés de chaque stratégie (index aligné en une fois)
+        df_cum_returns = pd.concat(
+            [res.cumulative_returns.rename(name) for res, name in zip(all_results, strategy_names)],
+            axis=1, join='outer'
+        ).ffill()
+        # Chaque série est sous-échantillonnée séparément pour l'affichage
+        plotted = {col: self.plot_points(df_cum_returns[col]) for col in df_cum_returns.columns}
 
         # Graphique comparant les rendements cumulés
         if self.plot_library in ['matplotlib', 'seaborn']:
-            plt.figure(figsize=(10, 6))
+            figure, ax = self._new_figure((10, 6), output_path)
 
-            if self.plot_library == 'seaborn':
-                sns.set(style="darkgrid")
-
-            for col in df_cum_returns.columns:
-                plt.plot(df_cum_returns.index, df_cum_returns[col], label=col)
+            for col, series in plotted.items():
+                ax.plot(series.index, series, label=col)
 
-            plt.title("Comparaison des Rendements Cumulés")
-            plt.xlabel("Date")
-            plt.ylabel("Rendements Cumulés")
-            plt.legend()
-            plt.grid(True)
+            ax.set_title("Comparaison des Rendements Cumulés")
+            ax.set_xlabel("Date")
+            ax.set_ylabel("Rendements Cumulés")
+            ax.legend()
+            ax.grid(True)
 
-            if streamlit_display:
-                import streamlit as st
-                st.pyplot(plt)
-                plt.close()
-            else:
-                plt.show()
+            self._show_matplotlib(figure, streamlit_display, output_path)
 
         elif self.plot_library == 'plotly':
-            df_long = df_cum_returns.reset_index().melt(
-                id_vars=df_cum_returns.index.name or 'index',
-                var_name='Strategy',
-                value_name='Cumulative Return'
-            )
-            time_col = df_cum_returns.index.name if df_cum_returns.index.name else 'index'
+            import plotly.express as px
+            df_long = pd.concat([
+                pd.DataFrame({'Date': series.index, 'Strategy': col, 'Cumulative Return': series.to_numpy()})
+                for col, series in plotted.items()
+            ], ignore_index=True)
 
             fig = px.line(
                 df_long,
-                x=time_col,
+                x='Date',
                 y='Cumulative Return',
                 color='Strategy',
                 labels={'Cumulative Return': 'Rendements Cumulés'},
@@ -373,90 +425,82 @@ class Result:
             )
             fig.update_layout(xaxis_title="Date", yaxis_title="Rendements Cumulés")
 
-            if streamlit_display:
-                import streamlit as st
-                st.plotly_chart(fig)
-            else:
-                fig.show(renderer="browser")
+            self._show_plotly(fig, streamlit_display, output_path)
 
         return df_comparison
 
-    def plot_cumulative_returns(self, streamlit_display=False):
+    def plot_cumulative_returns(self, streamlit_display=False, output_path=None):
         """
         Trace les rendements cumulés au fil du temps en utilisant la bibliothèque de visualisation sélectionnée.
 
         :param streamlit_display: bool, optionnel
             Si True, affiche le graphique via Streamlit. Sinon, affiche avec plt.show() ou plotly.
+        :param output_path: str, optionnel
+            Fichier dans lequel le graphique est enregistré au lieu d'être affiché (PNG, SVG, PDF avec matplotlib ;
+            HTML statique avec plotly, ou image si kaleido est installé).
         """
+        cumulative_returns = self.plot_points(self.cumulative_returns)
+
         if self.plot_library in ['matplotlib', 'seaborn']:
-            plt.figure(figsize=(12, 6))
+            figure, ax = self._new_figure((12, 6), output_path)
             if self.plot_library == 'seaborn':
-                sns.set(style="darkgrid")
-                sns.lineplot(x=self.cumulative_returns.index, y=self.cumulative_returns, label="Rendements Cumulés")
-            else:
-                plt.plot(self.cumulative_returns.index, self.cumulative_returns, label="Rendements Cumulés")
-
-            plt.title("Rendements Cumulés du Portefeuille")
-            plt.xlabel("Date")
-            plt.ylabel("Rendement Cumulé")
-            plt.legend()
-            plt.grid(True)
-
-            if streamlit_display:
-                import streamlit as st
-                st.pyplot(plt)
-                plt.close()
+                import seaborn as sns
+                sns.lineplot(x=cumulative_returns.index, y=cumulative_returns, label="Rendements Cumulés", ax=ax)
             else:
-                plt.show()
-                plt.close()
+                ax.plot(cumulative_returns.index, cumulative_returns, label="Rendements Cumulés")
+
+            ax.set_title("Rendements Cumulés du Portefeuille")
+            ax.set_xlabel("Date")
+            ax.set_ylabel("Rendement Cumulé")
+            ax.legend()
+            ax.grid(True)
+
+            self._show_matplotlib(figure, streamlit_display, output_path)
 
         elif self.plot_library == 'plotly':
+            import plotly.express as px
             fig = px.line(
-                x=self.cumulative_returns.index,
-                y=self.cumulative_returns,
+                x=cumulative_returns.index,
+                y=cumulative_returns,
                 labels={'x': 'Date', 'y': 'Rendement Cumulé'},
                 title="Rendements Cumulés du Portefeuille"
             )
             fig.update_layout(xaxis_title="Date", yaxis_title="Rendement Cumulé")
 
-            if streamlit_display:
-                import streamlit as st
-                st.plotly_chart(fig)
-            else:
-                fig.show(renderer="browser")
+            self._show_plotly(fig, streamlit_display, output_path)
 
-    def plot_monthly_returns_heatmap(self, streamlit_display=False):
+    def plot_monthly_returns_heatmap(self, streamlit_display=False, output_path=None):
         """
         Trace une heatmap des rendements mensuels en utilisant la bibliothèque de visualisation sélectionnée.
 
         :param streamlit_display: bool, optionnel
             Si True, affiche le graphique via Streamlit. Sinon, affiche avec plt.show() ou plotly.
+        :param output_path: str, optionnel
+            Fichier dans lequel le graphique est enregistré au lieu d'être affiché (PNG, SVG, PDF avec matplotlib ;
+            HTML statique avec plotly, ou image si kaleido est installé).
         """
         monthly_returns_pivot = self.calculate_monthly_returns()
 
         if self.plot_library in ['matplotlib', 'seaborn']:
-            plt.figure(figsize=(10, 6))
+            import seaborn as sns
+            figure, ax = self._new_figure((10, 6), output_path)
             sns.heatmap(
                 monthly_returns_pivot,
                 annot=True,
                 fmt=".2%",
                 cmap="RdYlGn",
-                center=0
+                center=0,
+                ax=ax
             )
-            plt.title("Heatmap des Rendements Mensuels")
-            plt.xlabel("Mois")
-            plt.ylabel("Année")
-            plt.tight_layout()
-
-            if streamlit_display:
-                import streamlit as st
-                st.pyplot(plt)
-                plt.close()
-            else:
-                plt.show()
-                plt.close()
+            ax.set_title("Heatmap des Rendements Mensuels")
+            ax.set_xlabel("Mois")
+            ax.set_ylabel("Année")
+            figure.tight_layout()
+
+            self._show_matplotlib(figure, streamlit_display, output_path)
 
         elif self.plot_library == 'plotly':
+            import plotly.express as px
             heatmap_data = monthly_returns_pivot.reset_index()
             heatmap_data_melt = heatmap_data.melt(id_vars='Année', var_name='Mois', value_name='Rendements Mensuels')
             pivot_plotly = heatmap_data_melt.pivot(index='Année', columns='Mois', values='Rendements Mensuels')
@@ -476,13 +520,9 @@ class Result:
 
             fig.update_traces(texttemplate='%{text:.2%}', textfont={"size": 12})
 
-            if streamlit_display:
-                import streamlit as st
-                st.plotly_chart(fig)
-            else:
-                fig.show(renderer="browser")
+            self._show_plotly(fig, streamlit_display, output_path)
 
-    def plot_returns_distribution(self, alpha=0.05, bins=50, streamlit_display=False):
+    def plot_returns_distribution(self, alpha=0.05, bins=50, streamlit_display=False, output_path=None):
         """
         Trace un histogramme des rendements quotidiens pour visualiser leur distribution.
         Ajoute des lignes verticales pour la VaR et l'Expected Shortfall au niveau de confiance alpha.
@@ -493,40 +533,38 @@ class Result:
             Nombre de bins dans l'histogramme (par défaut = 50).
         :param streamlit_display: bool, optionnel
             Si True, affiche le graphique via Streamlit. Sinon, affiche avec plt.show() ou plotly.
+        :param output_path: str, optionnel
+            Fichier dans lequel le graphique est enregistré au lieu d'être affiché (PNG, SVG, PDF avec matplotlib ;
+            HTML statique avec plotly, ou image si kaleido est installé).
         """
         var_value = self.calculate_var(alpha)
         es_value = self.calculate_expected_shortfall(alpha)
 
         if self.plot_library in ['matplotlib', 'seaborn']:
-            plt.figure(figsize=(10, 6))
+            import seaborn as sns
+            figure, ax = self._new_figure((10, 6), output_path)
             if self.plot_library == 'seaborn':
-                sns.set(style="darkgrid")
-                sns.histplot(self.portfolio_returns, bins=bins, kde=True, color='blue', alpha=0.6)
+                sns.histplot(self.portfolio_returns, bins=bins, kde=True, color='blue', alpha=0.6, ax=ax)
             else:
-                plt.hist(self.portfolio_returns, bins=bins, alpha=0.6, color='blue', density=True,
-                         label='Rendements Quotidiens')
-                sns.kdeplot(self.portfolio_returns, color='blue', fill=False)
-
-            plt.axvline(var_value, color='red', linestyle='--',
-                        label=f"VaR({int((1 - alpha) * 100)}%) = {var_value:.2%}")
-            plt.axvline(es_value, color='orange', linestyle='--',
-                        label=f"ES({int((1 - alpha) * 100)}%) = {es_value:.2%}")
-
-            plt.title("Distribution des Rendements Quotidiens avec VaR & ES")
-            plt.xlabel("Rendement Quotidien")
-            plt.ylabel("Fréquence")
-            plt.grid(True)
-            plt.legend()
-
-            if streamlit_display:
-                import streamlit as st
-                st.pyplot(plt)
-                plt.close()
-            else:
-                plt.show()
-                plt.close()
+                ax.hist(self.portfolio_returns, bins=bins, alpha=0.6, color='blue', density=True,
+                        label='Rendements Quotidiens')
+                sns.kdeplot(self.portfolio_returns, color='blue', fill=False, ax=ax)
+
+            ax.axvline(var_value, color='red', linestyle='--',
+                       label=f"VaR({int((1 - alpha) * 100)}%) = {var_value:.2%}")
+            ax.axvline(es_value, color='orange', linestyle='--',
+                       label=f"ES({int((1 - alpha) * 100)}%) = {es_value:.2%}")
+
+            ax.set_title("Distribution des Rendements Quotidiens avec VaR & ES")
+            ax.set_xlabel("Rendement Quotidien")
+            ax.set_ylabel("Fréquence")
+            ax.grid(True)
+            ax.legend()
+
+            self._show_matplotlib(figure, streamlit_display, output_path)
 
         elif self.plot_library == 'plotly':
+            import plotly.express as px
             fig = px.histogram(
                 x=self.portfolio_returns,
                 nbins=bins,
@@ -552,8 +590,217 @@ class Result:
 
             fig.update_layout(xaxis_title="Rendement Quotidien", yaxis_title="Densité")
 
-            if streamlit_display:
-                import streamlit as st
-                st.plotly_chart(fig)
+            self._show_plotly(fig, streamlit_display, output_path)
+
+    def plot_points(self, series):
+        """
+        Sous-échantillonne une série avant de la tracer, selon max_points et la méthode downsampling.
+
+        :param series: pd.Series
+            Série à tracer.
+        :return: pd.Series
+            Série d'au plus max_points points (série complète si max_points vaut None).
+        """
+        return downsample(series, self.max_points, self.downsampling)
+
+    def _new_figure(self, figsize, output_path=None):
+        """
+        Crée une figure matplotlib et ses axes (style darkgrid avec seaborn). Une figure destinée à un fichier
+        est construite sans pyplot, sur un canevas Agg : le backend global n'est pas modifié.
+        """
+        if output_path is not None:
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            from matplotlib.figure import Figure
+            figure = Figure(figsize=figsize)
+            FigureCanvasAgg(figure)
+        else:
+            import matplotlib.pyplot as plt
+            figure = plt.figure(figsize=figsize)
+
+        style = contextlib.nullcontext()
+        if self.plot_library == 'seaborn':
+            import seaborn as sns
+            style = sns.axes_style("darkgrid")
+        with style:
+            ax = figure.add_subplot()
+        return figure, ax
+
+    @staticmethod
+    def _show_matplotlib(figure, streamlit_display=False, output_path=None):
+        """
+        Enregistre une figure matplotlib dans output_path, ou l'affiche (Streamlit ou plt.show()) puis la ferme.
+        """
+        if output_path is not None:
+            figure.savefig(output_path, bbox_inches="tight")
+            return
+        import matplotlib.pyplot as plt
+        if streamlit_display:
+            import streamlit as st
+            st.pyplot(figure)
+        else:
+            plt.show()
+        plt.close(figure)
+
+    @staticmethod
+    def _show_plotly(fig, streamlit_display=False, output_path=None):
+        """
+        Enregistre une figure plotly dans output_path (HTML statique autonome, fragment HTML .div à intégrer dans
+        une page qui charge plotly.js, ou image via kaleido), ou l'affiche (Streamlit ou navigateur).
+        """
+        if output_path is not None:
+            if str(output_path).lower().endswith((".html", ".htm")):
+                # plotly.js est intégré au fichier : la page s'affiche sans accès réseau
+                fig.write_html(output_path, include_plotlyjs=True)
+            elif str(output_path).lower().endswith(".div"):
+                with open(output_path, "w", encoding="utf-8") as file:
+                    file.write(fig.to_html(full_html=False, include_plotlyjs=False))
             else:
-                fig.show(renderer="browser")
+                fig.write_image(output_path)
+        elif streamlit_display:
+            import streamlit as st
+            st.plotly_chart(fig)
+        else:
+            fig.show(renderer="browser")
+
+    # Métriques enregistrées dans l'en-tête des fichiers de sauvegarde (et relues sans recalcul)
+    HEADER_METRICS = [
+        'total_return', 'annualized_return', 'volatility', 'sharpe_ratio', 'max_drawdown',
+        'max_drawdown_recovery_time', 'sortino_ratio', 'calmar_ratio', 'skewness', 'kurtosis',
+        'total_trades', 'winning_trades', 'win_rate', 'risk_free_rate', 'plot_library'
+    ]
+    FORMAT_VERSION = 1
+
+    def save(self, path):
+        """
+        Sauvegarde le résultat dans un répertoire au format Arrow IPC (colonnes binaires non compressées) :
+        returns.arrow contient les dates, rendements et rendements cumulés, et porte dans ses métadonnées
+        un en-tête JSON avec les métriques ; trade_ledger.arrow contient le registre des trades, s'il existe.
+
+        :param path: str
+            Répertoire de sauvegarde (créé si nécessaire).
+        """
+        import json
+        import os
+
+        header = {name: getattr(self, name) for name in self.HEADER_METRICS}
+        header = {name: value.item() if isinstance(value, np.generic) else value for name, value in header.items()}
+        header.update(format_version=self.FORMAT_VERSION, portfolio_returns_name=self.portfolio_returns.name,
+                      cumulative_returns_name=self.cumulative_returns.name,
+                      index_name=self.cumulative_returns.index.name)
+
+        os.makedirs(path, exist_ok=True)
+        returns = self.to_arrow().replace_schema_metadata({b"result": json.dumps(header).encode()})
+        write_arrow(returns, os.path.join(path, "returns.arrow"))
+
+        ledger_path = os.path.join(path, "trade_ledger.arrow")
+        if self.trade_ledger is not None:
+            write_arrow(self.ledger_to_arrow(), ledger_path)
+        elif os.path.exists(ledger_path):
+            os.remove(ledger_path)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Recharge un résultat sauvegardé avec save. Les fichiers sont mappés en mémoire et les rendements
+        sont lus sans copie ; les métriques sont lues dans l'en-tête, sans recalcul.
+
+        :param path: str
+            Répertoire de sauvegarde.
+        :return: Result
+            Résultat rechargé.
+        :raises ValueError: Si le répertoire ne contient pas de résultat sauvegardé.
+        """
+        import json
+        import os
+
+        returns_path = os.path.join(path, "returns.arrow")
+        if not os.path.exists(returns_path):
+            raise ValueError("Aucun résultat sauvegardé dans ce répertoire.")
+        returns = read_arrow(returns_path)
+        header = json.loads(returns.schema.metadata[b"result"])
+
+        result = cls.__new__(cls)
+        for name in cls.HEADER_METRICS:
+            setattr(result, name, header[name])
+        portfolio_returns, cumulative_returns = cls.returns_from_arrow(returns)
+        portfolio_returns.name = header["portfolio_returns_name"]
+        cumulative_returns.name = header["cumulative_returns_name"]
+        portfolio_returns.index.name = cumulative_returns.index.name = header["index_name"]
+        result.portfolio_returns, result.cumulative_returns = portfolio_returns, cumulative_returns
+
+        ledger_path = os.path.join(path, "trade_ledger.arrow")
+        result.trade_ledger = None
+        result.run_stats = None
+        result.max_points, result.downsampling = cls.MAX_PLOT_POINTS, 'lttb'
+        if os.path.exists(ledger_path):
+            result.trade_ledger = from_record_batch(read_arrow(ledger_path), index_name=None)
+        return result
+
+    def to_arrow(self):
+        """
+        Exporte les rendements en RecordBatch Arrow (date, portfolio_returns, cumulative_returns) sur l'index
+        des rendements cumulés, en partageant la mémoire des séries pandas ; les rendements absents valent NaN.
+
+        :return: pyarrow.RecordBatch
+        """
+        import pyarrow as pa
+
+        portfolio_returns = self.portfolio_returns
+        if not portfolio_returns.index.equals(self.cumulative_returns.index):
+            portfolio_returns = portfolio_returns.reindex(self.cumulative_returns.index)
+        return pa.record_batch({
+            "date": self.cumulative_returns.index.to_numpy(dtype="datetime64[ns]"),
+            "portfolio_returns": portfolio_returns.to_numpy(dtype="float64"),
+            "cumulative_returns": self.cumulative_returns.to_numpy(dtype="float64"),
+        })
+
+    def ledger_to_arrow(self):
+        """
+        Exporte le registre des trades en RecordBatch Arrow.
+
+        :return: pyarrow.RecordBatch, ou None si le résultat n'a pas de registre des trades.
+        """
+        if self.trade_ledger is None:
+            return None
+        return to_record_batch(self.trade_ledger.set_index("date"))
+
+    @classmethod
+    def from_arrow(cls, returns, trade_ledger=None, risk_free_rate=0.0, trade_stats=None, plot_library='matplotlib'):
+        """
+        Construit un résultat à partir de données Arrow (produites par to_arrow et ledger_to_arrow, ou par un
+        autre processus) : les rendements sont repris sans copie et les métriques sont calculées.
+
+        :param returns: pyarrow.RecordBatch ou pyarrow.Table (date, portfolio_returns, cumulative_returns).
+        :param trade_ledger: pyarrow.RecordBatch ou pyarrow.Table du registre des trades (optionnel).
+        :param risk_free_rate: float, optionnel
+            Taux sans risque annualisé (par défaut = 0.0).
+        :param trade_stats: tuple, optionnel
+            Tuple de (total_trades, winning_trades). Déduit du registre des trades s'il est fourni.
+        :param plot_library: str, optionnel
+            Bibliothèque de visualisation (par défaut : 'matplotlib').
+        :return: Result
+        """
+        portfolio_returns, cumulative_returns = cls.returns_from_arrow(returns)
+        if trade_ledger is not None:
+            trade_ledger = from_record_batch(trade_ledger, index_name=None)
+            if trade_stats is None:
+                trade_stats = (len(trade_ledger), int(trade_ledger["winning"].sum()))
+        return cls(portfolio_returns, cumulative_returns, risk_free_rate=risk_free_rate, trade_stats=trade_stats,
+                   plot_library=plot_library, trade_ledger=trade_ledger)
+
+    @staticmethod
+    def returns_from_arrow(returns):
+        """
+        Reconstruit les séries de rendements à partir de données Arrow, sans copier les colonnes numériques.
+        Les dates sans rendement (NaN) sont retirées des rendements quotidiens, comme à l'initialisation.
+
+        :param returns: pyarrow.RecordBatch ou pyarrow.Table (date, portfolio_returns, cumulative_returns).
+        :return: tuple
+            (portfolio_returns, cumulative_returns) sous forme de séries pandas.
+        """
+        frame = from_record_batch(returns)
+        frame.index = pd.DatetimeIndex(frame.index, copy=False, name=None)
+        portfolio_returns, cumulative_returns = frame["portfolio_returns"], frame["cumulative_returns"]
+        if portfolio_returns.isna().any():
+            portfolio_returns = portfolio_returns.dropna()
+        return portfolio_returns, cumulative_returns
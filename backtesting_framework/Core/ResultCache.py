@@ -0,0 +1,201 @@
+import hashlib
+import os
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from backtesting_framework.Core.SparseWeights import SparseWeights
+from backtesting_framework.Utils.Tools import data_fingerprint, parameters_fingerprint
+
+
+class ResultCache:
+    """
+    Cache disque des backtests, adressé par le contenu de leur configuration : la clé est une empreinte des données,
+    de la stratégie (classe et paramètres), du schéma de pondération, des coûts, de la fréquence de rebalancement,
+    de special_start et du Vol Targeting.
+
+    Chaque entrée est un fichier .npz (tableaux NumPy binaires) contenant les rendements du portefeuille,
+    les pondérations et la composition stockées par événements, et le registre des trades. Les entrées les moins
+    récemment utilisées sont supprimées lorsque la taille totale du cache dépasse max_bytes.
+    """
+
+    # Version du format des entrées : une modification du format invalide les entrées existantes
+    FORMAT_VERSION = 1
+
+    def __init__(self, directory: str, max_bytes: int = 256 * 2 ** 20):
+        """
+        :param directory: Répertoire du cache (créé si nécessaire).
+        :param max_bytes: Taille maximale du cache en octets (par défaut : 256 Mo).
+        :raises ValueError: Si max_bytes n'est pas strictement positif.
+        """
+        if max_bytes <= 0:
+            raise ValueError("max_bytes doit être strictement positif.")
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    def key(self, backtester, strategy, is_VT: bool, target_vol) -> str:
+        """
+        Clé d'un backtest : empreinte de tous les paramètres qui déterminent ses résultats.
+
+        :param backtester: Instance de Backtester (données, pondération, coûts, calendrier).
+        :param strategy: Instance de la classe Strategy, avant exécution.
+        :param is_VT: Activation du Vol Targeting.
+        :param target_vol: Volatilité cible.
+        :return: Clé hexadécimale (str).
+        """
+        market_caps = backtester.market_caps if backtester.weighting.requires_market_caps else None
+        components = [
+            self.FORMAT_VERSION,
+            data_fingerprint(backtester.data),
+            # Seuls les paramètres et les données ajustées sont hachés : l'état modifié par run (z-score,
+            # itérations, masque de validité) ne change pas la clé d'un backtest relancé
+            parameters_fingerprint(strategy, strategy.fitted_state()),
+            parameters_fingerprint(backtester.weighting),
+            None if market_caps is None else data_fingerprint(market_caps),
+            parameters_fingerprint(backtester.cost_model),
+            backtester.transaction_cost, backtester.slippage, backtester.accounting,
+            backtester.rebalancing_frequency, backtester.special_start, backtester.rfr,
+            bool(is_VT), target_vol,
+        ]
+        return hashlib.blake2b(repr(components).encode(), digest_size=16).hexdigest()
+
+    def path(self, key: str) -> str:
+        """
+        Chemin du fichier d'une entrée.
+
+        :param key: Clé du backtest.
+        :return: Chemin du fichier .npz.
+        """
+        return os.path.join(self.directory, f"{key}.npz")
+
+    def get(self, key: str):
+        """
+        Lit une entrée du cache et la marque comme la plus récemment utilisée.
+
+        :param key: Clé du backtest.
+        :return: Dictionnaire (portfolio_returns, cumulative_returns, raw_portfolio_returns, weight_matrix,
+                 composition_matrix, trade_stats, trade_state, trade_ledger), ou None si la clé est absente.
+        """
+        path = self.path(key)
+        try:
+            with np.load(path, allow_pickle=False) as entry:
+                arrays = dict(entry)
+        except (FileNotFoundError, OSError, ValueError):
+            return None
+        os.utime(path)
+
+        columns = pd.Index(arrays["columns"])
+        returns_index = pd.DatetimeIndex(arrays["returns_index"])
+        ledger = pd.DataFrame({
+            "date": pd.DatetimeIndex(arrays["ledger_date"]),
+            "asset": columns[arrays["ledger_asset"]],
+            "previous_position": arrays["ledger_previous_position"],
+            "position": arrays["ledger_position"],
+            "previous_price": arrays["ledger_previous_price"],
+            "price": arrays["ledger_price"],
+            "winning": arrays["ledger_winning"],
+        })
+        return {
+            "portfolio_returns": pd.Series(arrays["portfolio_returns"], index=returns_index),
+            "cumulative_returns": pd.Series(arrays["cumulative_returns"], index=returns_index),
+            "raw_portfolio_returns": pd.Series(arrays["raw_portfolio_returns"],
+                                               index=pd.DatetimeIndex(arrays["index"])),
+            "weight_matrix": self.read_events(arrays, "weights", columns),
+            "composition_matrix": self.read_events(arrays, "composition", columns),
+            "trade_stats": tuple(arrays["trade_stats"].tolist()),
+            "trade_state": dict(zip(columns, zip(arrays["trade_positions"].tolist(),
+                                                 arrays["trade_prices"].tolist()))),
+            "trade_ledger": ledger,
+        }
+
+    def put(self, key: str, portfolio_returns: pd.Series, cumulative_returns: pd.Series,
+            raw_portfolio_returns: pd.Series, weight_matrix, composition_matrix, trade_stats: tuple,
+            trade_state: dict, trade_ledger: pd.DataFrame):
+        """
+        Écrit une entrée du cache (écriture atomique), puis supprime les entrées les moins récemment utilisées
+        si la taille du cache dépasse max_bytes.
+
+        :param key: Clé du backtest.
+        :param portfolio_returns: Rendements du portefeuille.
+        :param cumulative_returns: Rendements cumulés du portefeuille.
+        :param raw_portfolio_returns: Rendements du portefeuille avant Vol Targeting, sur toutes les dates.
+        :param weight_matrix: Matrice des pondérations (DataFrame ou SparseWeights).
+        :param composition_matrix: Matrice de composition (DataFrame ou SparseWeights).
+        :param trade_stats: Tuple (nombre de trades, nombre de trades gagnants).
+        :param trade_state: Dictionnaire {actif: (dernière position, prix du dernier trade)}.
+        :param trade_ledger: Registre des trades.
+        """
+        if not isinstance(weight_matrix, SparseWeights):
+            weight_matrix = SparseWeights.from_dense(weight_matrix)
+        columns = weight_matrix.columns
+        arrays = {
+            "columns": columns.to_numpy(dtype=str),
+            "index": weight_matrix.index.to_numpy(dtype="datetime64[ns]"),
+            "returns_index": portfolio_returns.index.to_numpy(dtype="datetime64[ns]"),
+            "portfolio_returns": portfolio_returns.to_numpy(dtype="float64"),
+            "cumulative_returns": cumulative_returns.to_numpy(dtype="float64"),
+            "raw_portfolio_returns": raw_portfolio_returns.to_numpy(dtype="float64"),
+            "trade_stats": np.asarray(trade_stats, dtype=np.int64),
+            "trade_positions": np.array([trade_state[asset][0] for asset in columns], dtype="float64"),
+            "trade_prices": np.array([trade_state[asset][1] for asset in columns], dtype="float64"),
+            "ledger_date": trade_ledger["date"].to_numpy(dtype="datetime64[ns]"),
+            "ledger_asset": columns.get_indexer(trade_ledger["asset"]),
+            "ledger_winning": trade_ledger["winning"].to_numpy(dtype=bool),
+        }
+        for name in ("previous_position", "position", "previous_price", "price"):
+            arrays[f"ledger_{name}"] = trade_ledger[name].to_numpy(dtype="float64")
+        self.write_events(arrays, "weights", weight_matrix)
+        if not isinstance(composition_matrix, SparseWeights):
+            composition_matrix = SparseWeights.from_dense(composition_matrix)
+        self.write_events(arrays, "composition", composition_matrix)
+
+        path = self.path(key)
+        temporary_path = f"{path}.tmp"
+        with open(temporary_path, "wb") as file:
+            np.savez(file, **arrays)
+        os.replace(temporary_path, path)
+        self.evict()
+
+    def evict(self):
+        """
+        Supprime les entrées les moins récemment utilisées jusqu'à ce que la taille du cache soit inférieure
+        ou égale à max_bytes.
+        """
+        entries = [os.path.join(self.directory, name) for name in os.listdir(self.directory) if name.endswith(".npz")]
+        entries = sorted((os.stat(path).st_mtime_ns, os.stat(path).st_size, path) for path in entries)
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            os.remove(path)
+            total -= size
+
+    def clear(self):
+        """
+        Supprime toutes les entrées du cache.
+        """
+        for name in os.listdir(self.directory):
+            if name.endswith(".npz"):
+                os.remove(os.path.join(self.directory, name))
+
+    @staticmethod
+    def write_events(arrays: dict, prefix: str, matrix: SparseWeights):
+        """
+        Ajoute une matrice stockée par événements (CSR) aux tableaux d'une entrée.
+        """
+        arrays[f"{prefix}_data"] = matrix.events.data
+        arrays[f"{prefix}_indices"] = matrix.events.indices
+        arrays[f"{prefix}_indptr"] = matrix.events.indptr
+        arrays[f"{prefix}_rows"] = matrix.event_rows
+
+    @staticmethod
+    def read_events(arrays: dict, prefix: str, columns: pd.Index) -> SparseWeights:
+        """
+        Reconstruit une matrice stockée par événements à partir des tableaux d'une entrée.
+        """
+        rows = arrays[f"{prefix}_rows"]
+        events = sparse.csr_matrix((arrays[f"{prefix}_data"], arrays[f"{prefix}_indices"], arrays[f"{prefix}_indptr"]),
+                                   shape=(len(rows), len(columns)))
+        return SparseWeights(events, rows, pd.DatetimeIndex(arrays["index"]), columns)
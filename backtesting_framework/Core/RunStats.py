@@ -0,0 +1,171 @@
+import time
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+
+
+class RunStats:
+    """
+    Instrumentation d'un backtest : durée de chaque étape (chargement des données, calendrier, composition,
+    pondérations, rendements, évaluation des trades, métriques du Result), compteurs et latences des appels
+    (par exemple get_position de chaque stratégie).
+
+    Les durées des étapes sont exclusives : le temps passé dans une étape imbriquée n'est compté que dans celle-ci,
+    de sorte que la somme des durées est le temps total mesuré.
+
+    Des fonctions d'écoute (hooks) peuvent être abonnées : chacune est appelée avec (event, name, value),
+    où event vaut 'stage_start' (value None), 'stage_end' (value = durée en secondes) ou 'call'
+    (value = latence en secondes).
+    """
+
+    # Bornes (en secondes) des histogrammes de latence : de la microseconde à 10 secondes, par demi-décade
+    LATENCY_BINS = np.logspace(-6, 1, 15)
+
+    def __init__(self, hooks=None):
+        """
+        :param hooks: Liste de fonctions d'écoute hook(event, name, value) (optionnel).
+        """
+        self.timings = {}
+        self.counters = {}
+        self.latencies = {}
+        self.hooks = list(hooks) if hooks is not None else []
+        # Durée des étapes imbriquées dans chaque étape en cours
+        self._children = []
+
+    def __getstate__(self):
+        # Les fonctions d'écoute ne sont pas sauvegardées (fonctions locales ou lambdas non sérialisables)
+        state = self.__dict__.copy()
+        state["hooks"] = []
+        state["_children"] = []
+        return state
+
+    def add_hook(self, hook):
+        """
+        Abonne une fonction d'écoute.
+
+        :param hook: Fonction hook(event, name, value).
+        """
+        self.hooks.append(hook)
+
+    def emit(self, event: str, name: str, value=None):
+        """
+        Transmet un événement aux fonctions d'écoute.
+
+        :param event: Type d'événement ('stage_start', 'stage_end' ou 'call').
+        :param name: Nom de l'étape ou de l'appel.
+        :param value: Durée ou latence en secondes (None au début d'une étape).
+        """
+        for hook in self.hooks:
+            hook(event, name, value)
+
+    @contextmanager
+    def stage(self, name: str):
+        """
+        Mesure la durée d'une étape, hors étapes imbriquées (cumulée si l'étape est exécutée plusieurs fois).
+
+        :param name: Nom de l'étape.
+        """
+        self.emit("stage_start", name)
+        self._children.append(0.0)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            children = self._children.pop()
+            if self._children:
+                self._children[-1] += elapsed
+            self.timings[name] = self.timings.get(name, 0.0) + elapsed - children
+            self.emit("stage_end", name, elapsed)
+
+    def count(self, name: str, increment: int = 1):
+        """
+        Incrémente un compteur.
+
+        :param name: Nom du compteur.
+        :param increment: Valeur ajoutée (par défaut : 1).
+        """
+        self.counters[name] = self.counters.get(name, 0) + increment
+
+    def record(self, name: str, latency: float):
+        """
+        Enregistre la latence d'un appel et incrémente le compteur correspondant.
+
+        :param name: Nom de l'appel.
+        :param latency: Latence en secondes.
+        """
+        self.latencies.setdefault(name, []).append(latency)
+        self.count(name)
+        if self.hooks:
+            self.emit("call", name, latency)
+
+    def timed(self, name: str, func):
+        """
+        Enveloppe une fonction pour compter ses appels et mesurer leur latence.
+
+        :param name: Nom de l'appel (par exemple 'MovingAverage.get_position').
+        :param func: Fonction à mesurer.
+        :return: Fonction enveloppée, de même signature.
+        """
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.record(name, time.perf_counter() - start)
+
+        return wrapper
+
+    def merge(self, other):
+        """
+        Ajoute les durées, compteurs et latences d'une autre instrumentation (par exemple celle d'un bloc
+        de dates suivant).
+
+        :param other: Instance de RunStats.
+        """
+        for name, seconds in other.timings.items():
+            self.timings[name] = self.timings.get(name, 0.0) + seconds
+        for name, value in other.counters.items():
+            self.count(name, value)
+        for name, latencies in other.latencies.items():
+            self.latencies.setdefault(name, []).extend(latencies)
+
+    def histogram(self, name: str) -> pd.Series:
+        """
+        Histogramme des latences d'un appel.
+
+        :param name: Nom de l'appel.
+        :return: Série Pandas du nombre d'appels par intervalle de latence (borne supérieure en secondes).
+        """
+        latencies = np.asarray(self.latencies.get(name, []), dtype="float64")
+        bins = np.concatenate([[0.0], self.LATENCY_BINS, [np.inf]])
+        counts, _ = np.histogram(latencies, bins=bins)
+        return pd.Series(counts, index=pd.Index(bins[1:], name="latency_max"), name=name)
+
+    @property
+    def total_time(self) -> float:
+        """
+        Durée totale des étapes mesurées (en secondes).
+        """
+        return sum(self.timings.values())
+
+    def summary(self) -> pd.DataFrame:
+        """
+        Tableau récapitulatif des étapes (durée et part du temps total) et des appels mesurés
+        (nombre, latence moyenne et 99e centile).
+
+        :return: DataFrame indexé par le nom de l'étape ou de l'appel.
+        """
+        total = self.total_time
+        rows = [{"name": name, "kind": "stage", "seconds": seconds, "share": seconds / total if total else 0.0}
+                for name, seconds in self.timings.items()]
+        for name, latencies in self.latencies.items():
+            latencies = np.asarray(latencies, dtype="float64")
+            rows.append({"name": name, "kind": "call", "seconds": latencies.sum(), "count": len(latencies),
+                         "mean_latency": latencies.mean(), "p99_latency": np.percentile(latencies, 99)})
+        for name, value in self.counters.items():
+            if name not in self.latencies:
+                rows.append({"name": name, "kind": "counter", "count": value})
+        columns = ["name", "kind", "seconds", "share", "count", "mean_latency", "p99_latency"]
+        return pd.DataFrame(rows, columns=columns).set_index("name")
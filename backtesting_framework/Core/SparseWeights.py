@@ -0,0 +1,268 @@
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+
+class SparseWeights:
+    """
+    Stockage par événements d'une matrice de pondérations (ou de composition) constante par morceaux :
+    seules les lignes où le portefeuille change sont conservées, sous forme de matrice creuse CSR
+    (une ligne par événement, triplets (date, actif, pondération) non nuls).
+
+    Une date porte les pondérations du dernier événement antérieur ou égal ; avant le premier événement,
+    toutes les pondérations sont nulles. Les valeurs manquantes sont traitées comme des pondérations nulles.
+    """
+
+    def __init__(self, events: sparse.csr_matrix, event_rows: np.ndarray, index: pd.Index, columns: pd.Index):
+        """
+        :param events: Matrice creuse CSR (événements x actifs) des pondérations après chaque événement.
+        :param event_rows: Positions, dans index, des dates d'événement (strictement croissantes).
+        :param index: Index complet des dates.
+        :param columns: Index des actifs.
+        """
+        self.events = sparse.csr_matrix(events, dtype="float64")
+        self.event_rows = np.asarray(event_rows, dtype=np.int64)
+        self.index = index
+        self.columns = columns
+
+    @classmethod
+    def from_dense(cls, matrix: pd.DataFrame) -> "SparseWeights":
+        """
+        Construit le stockage par événements à partir d'une matrice dense.
+
+        :param matrix: DataFrame des pondérations (dates x actifs).
+        :return: Instance de SparseWeights.
+        """
+        return cls.from_rows(matrix.to_numpy(dtype="float64"), np.arange(len(matrix)), matrix.index, matrix.columns)
+
+    @classmethod
+    def from_rows(cls, values: np.ndarray, rows: np.ndarray, index: pd.Index, columns: pd.Index) -> "SparseWeights":
+        """
+        Construit le stockage à partir des lignes denses de certaines dates seulement (par exemple les dates
+        de rebalancement) : la matrice est constante entre deux lignes fournies et nulle avant la première.
+
+        :param values: Tableau des pondérations des lignes fournies (lignes x actifs).
+        :param rows: Positions, dans index, des lignes fournies (strictement croissantes).
+        :param index: Index complet des dates.
+        :param columns: Index des actifs.
+        :return: Instance de SparseWeights.
+        """
+        values = np.nan_to_num(np.asarray(values, dtype="float64"))
+        changed = np.empty(len(values), dtype=bool)
+        if len(values):
+            changed[0] = values[0].any()
+            changed[1:] = (values[1:] != values[:-1]).any(axis=1)
+        kept = np.flatnonzero(changed)
+        return cls(sparse.csr_matrix(values[kept]), np.asarray(rows, dtype=np.int64)[kept], index, columns)
+
+    @classmethod
+    def from_events(cls, dates, assets, weights, index: pd.Index, columns: pd.Index) -> "SparseWeights":
+        """
+        Construit le stockage à partir de triplets (date, actif, pondération), sans matrice dense intermédiaire.
+        Chaque date d'événement décrit le portefeuille complet : les actifs absents sont à zéro.
+
+        :param dates: Dates des triplets (présentes dans index).
+        :param assets: Actifs des triplets (présents dans columns).
+        :param weights: Pondérations des triplets.
+        :param index: Index complet des dates.
+        :param columns: Index des actifs.
+        :return: Instance de SparseWeights.
+        :raises KeyError: Si une date ou un actif est absent de index ou de columns.
+        """
+        rows = index.get_indexer(pd.Index(dates))
+        cols = columns.get_indexer(pd.Index(assets))
+        if (rows < 0).any() or (cols < 0).any():
+            raise KeyError("Dates ou actifs absents de l'index ou des colonnes.")
+
+        event_rows, event_ids = np.unique(rows, return_inverse=True)
+        events = sparse.coo_matrix((np.asarray(weights, dtype="float64"), (event_ids, cols)),
+                                   shape=(len(event_rows), len(columns)))
+        return cls(events.tocsr(), event_rows, index, columns)
+
+    def append(self, matrix: pd.DataFrame) -> "SparseWeights":
+        """
+        Ajoute de nouvelles dates à la fin du stockage, sans reconstruire les événements existants.
+
+        :param matrix: DataFrame des pondérations des nouvelles dates (mêmes colonnes, dates postérieures).
+        :return: Nouvelle instance de SparseWeights.
+        """
+        values = np.nan_to_num(matrix.reindex(columns=self.columns).to_numpy(dtype="float64"))
+        last = self.events[-1].toarray() if len(self.event_rows) else np.zeros((1, len(self.columns)))
+        changed = (values != np.vstack([last, values[:-1]])).any(axis=1)
+        rows = np.flatnonzero(changed)
+
+        events = sparse.vstack([self.events, sparse.csr_matrix(values[rows])], format="csr")
+        event_rows = np.concatenate([self.event_rows, rows + len(self.index)])
+        return SparseWeights(events, event_rows, self.index.append(matrix.index), self.columns)
+
+    def to_arrow(self):
+        """
+        Exporte les événements en RecordBatch Arrow au format long (date, asset, weight), une ligne par pondération
+        non nulle. Les pondérations et les indices des actifs (colonne dictionnaire sur columns) partagent
+        la mémoire de la matrice CSR, sans copie.
+
+        :return: pyarrow.RecordBatch.
+        """
+        import pyarrow as pa
+
+        event_counts = np.diff(self.events.indptr)
+        dates = self.index.to_numpy(dtype="datetime64[ns]")[np.repeat(self.event_rows, event_counts)]
+        assets = pa.DictionaryArray.from_arrays(self.events.indices.astype(np.int32, copy=False),
+                                                pa.array(self.columns.astype(str)))
+        return pa.record_batch({"date": dates, "asset": assets, "weight": self.events.data})
+
+    @property
+    def shape(self) -> tuple:
+        return len(self.index), len(self.columns)
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Mémoire occupée par les événements (en octets), hors index des dates et des actifs.
+        """
+        return self.events.data.nbytes + self.events.indices.nbytes + self.events.indptr.nbytes \
+            + self.event_rows.nbytes
+
+    def event_of_row(self) -> np.ndarray:
+        """
+        Indice de l'événement en vigueur à chaque date (-1 avant le premier événement).
+
+        :return: np.ndarray d'entiers (une valeur par date).
+        """
+        return np.searchsorted(self.event_rows, np.arange(len(self.index)), side="right") - 1
+
+    def expand(self) -> sparse.csr_matrix:
+        """
+        Matrice creuse (dates x actifs) des pondérations à chaque date.
+
+        :return: Matrice creuse CSR.
+        """
+        event_of_row = self.event_of_row()
+        # Une ligne nulle supplémentaire représente l'état avant le premier événement
+        padded = sparse.vstack([self.events, sparse.csr_matrix((1, len(self.columns)))], format="csr")
+        return padded[np.where(event_of_row < 0, len(self.event_rows), event_of_row)]
+
+    def to_dense(self) -> pd.DataFrame:
+        """
+        Reconstruit la matrice dense des pondérations.
+
+        :return: DataFrame (dates x actifs).
+        """
+        return pd.DataFrame(self.expand().toarray(), index=self.index, columns=self.columns)
+
+    def rows_frame(self, rows: np.ndarray) -> pd.DataFrame:
+        """
+        Matrice dense restreinte à certaines dates.
+
+        :param rows: Positions des dates dans index (croissantes).
+        :return: DataFrame (dates retenues x actifs).
+        """
+        event_of_row = np.searchsorted(self.event_rows, rows, side="right") - 1
+        values = np.zeros((len(rows), len(self.columns)))
+        has_event = event_of_row >= 0
+        values[has_event] = self.events[event_of_row[has_event]].toarray()
+        return pd.DataFrame(values, index=self.index[rows], columns=self.columns)
+
+    def event_frame(self) -> pd.DataFrame:
+        """
+        Matrice dense restreinte à la première date et aux dates d'événement : elle suffit pour détecter les trades.
+
+        :return: DataFrame (dates d'événement x actifs).
+        """
+        return self.rows_frame(np.union1d([0], self.event_rows) if len(self.index) else self.event_rows)
+
+    def segments(self):
+        """
+        Segments de dates entre deux événements dont les pondérations ne sont pas toutes nulles.
+
+        :return: Générateur de tuples (première date, date de fin exclue, positions des actifs, pondérations).
+        """
+        bounds = np.append(self.event_rows, len(self.index))
+        for event in range(len(self.event_rows)):
+            first, last = self.events.indptr[event], self.events.indptr[event + 1]
+            if first < last:
+                yield bounds[event], bounds[event + 1], self.events.indices[first:last], self.events.data[first:last]
+
+    def aligned_values(self, frame: pd.DataFrame) -> np.ndarray:
+        """
+        Valeurs d'un DataFrame (dates x actifs) alignées sur index et columns, sans copie s'il l'est déjà.
+
+        :param frame: DataFrame à aligner.
+        :return: np.ndarray (dates x actifs).
+        """
+        if not (frame.index.equals(self.index) and frame.columns.equals(self.columns)):
+            frame = frame.reindex(index=self.index, columns=self.columns)
+        return frame.to_numpy(dtype="float64")
+
+    def shift(self, periods: int = 1) -> "SparseWeights":
+        """
+        Décale les pondérations de periods dates vers le futur (équivalent de DataFrame.shift(periods).fillna(0)).
+
+        :param periods: Nombre de dates de décalage (positif).
+        :return: Nouvelle instance de SparseWeights.
+        """
+        event_rows = self.event_rows + periods
+        keep = event_rows < len(self.index)
+        return SparseWeights(self.events[np.flatnonzero(keep)], event_rows[keep], self.index, self.columns)
+
+    def slice(self, start: int) -> "SparseWeights":
+        """
+        Restreint les pondérations aux dates à partir de la position start (équivalent de iloc[start:]).
+
+        :param start: Position de la première date conservée.
+        :return: Nouvelle instance de SparseWeights.
+        """
+        current = np.searchsorted(self.event_rows, start, side="right") - 1
+        later = np.flatnonzero(self.event_rows > start)
+        selected = later if current < 0 else np.concatenate([[current], later])
+        event_rows = self.event_rows[selected] - start
+        if current >= 0:
+            event_rows[0] = 0
+        return SparseWeights(self.events[selected], event_rows, self.index[start:], self.columns)
+
+    def turnover(self) -> pd.Series:
+        """
+        Rotation à chaque date (somme des variations absolues de pondération), non nulle uniquement aux événements.
+        La première date a une rotation nulle, comme DataFrame.diff().abs().sum(axis=1).
+
+        :return: Série Pandas de la rotation par date.
+        """
+        previous = sparse.vstack([sparse.csr_matrix((1, len(self.columns))), self.events[:-1]], format="csr")
+        event_turnover = np.asarray(abs(self.events - previous).sum(axis=1)).ravel()
+        turnover = np.zeros(len(self.index))
+        turnover[self.event_rows] = event_turnover
+        if len(self.index):
+            turnover[0] = 0.0
+        return pd.Series(turnover, index=self.index)
+
+    def contributions(self, asset_returns: pd.DataFrame) -> pd.DataFrame:
+        """
+        Contribution de chaque actif au rendement du portefeuille (pondération x rendement), stockée en creux
+        et calculée segment par segment sur les seules positions non nulles.
+
+        :param asset_returns: DataFrame des rendements des actifs (dates x actifs).
+        :return: DataFrame creux (SparseDtype) des contributions.
+        """
+        returns = self.aligned_values(asset_returns)
+        rows, columns, values = [np.zeros(0, dtype=np.int64)], [np.zeros(0, dtype=np.int32)], [np.zeros(0)]
+        for start, end, assets, weights in self.segments():
+            rows.append(np.repeat(np.arange(start, end), len(assets)))
+            columns.append(np.tile(assets, end - start))
+            values.append((returns[start:end, assets] * weights).ravel())
+        contributions = sparse.csr_matrix((np.concatenate(values), (np.concatenate(rows), np.concatenate(columns))),
+                                          shape=self.shape)
+        return pd.DataFrame.sparse.from_spmatrix(contributions, index=self.index, columns=self.columns)
+
+    def portfolio_returns(self, asset_returns: pd.DataFrame) -> pd.Series:
+        """
+        Rendement brut du portefeuille à chaque date, calculé segment par segment sur les seules positions non nulles,
+        sans reconstruire la matrice des pondérations à chaque date.
+
+        :param asset_returns: DataFrame des rendements des actifs (dates x actifs).
+        :return: Série Pandas des rendements.
+        """
+        returns = self.aligned_values(asset_returns)
+        gross = np.zeros(len(self.index))
+        for start, end, assets, weights in self.segments():
+            gross[start:end] = returns[start:end, assets] @ weights
+        return pd.Series(gross, index=self.index)
@@ -1,13 +1,76 @@
 from abc import ABC, abstractmethod
+import pandas as pd
 
 class Strategy(ABC):
 
     def __init__(self, multi_asset=False):
         self.multi_asset = multi_asset
+        self.valid_mask = None
+        self.valid_counts = None
 
     @abstractmethod
     def get_position(self, historical_data, current_position):
         pass
 
     def fit(self, data):
-        pass
\ No newline at end of file
+        pass
+
+    def fitted_state(self):
+        """
+        Données ajustées (par fit ou à l'initialisation) qui déterminent les positions en plus des paramètres
+        du constructeur, incluses dans la clé du cache des résultats.
+
+        :return: Dictionnaire {nom: valeur} (vide par défaut).
+        """
+        return {}
+
+    def get_signals(self, data):
+        """
+        Calcul vectorisé optionnel des positions sur l'ensemble du panel de prix.
+
+        La ligne d'une date doit contenir la position que retournerait get_position à cette date,
+        NaN signifiant le maintien de la position courante.
+
+        :param data: pd.DataFrame des prix (dates x actifs).
+        :return: pd.DataFrame des positions, ou None si la stratégie ne propose pas de calcul vectorisé.
+        """
+        return None
+
+    def set_valid_mask(self, valid_mask):
+        """
+        Reçoit le masque de validité des prix calculé une seule fois par le Backtester,
+        et en déduit le nombre cumulé d'observations valides par actif.
+
+        :param valid_mask: pd.DataFrame booléen (dates x actifs).
+        """
+        self.valid_mask = valid_mask
+        self.valid_counts = valid_mask.cumsum()
+
+    def extend_valid_mask(self, new_mask):
+        """
+        Ajoute de nouvelles dates au masque de validité, en prolongeant le nombre cumulé d'observations valides
+        à partir de la dernière date connue plutôt qu'en le recalculant sur tout l'historique.
+
+        :param new_mask: pd.DataFrame booléen des nouvelles dates (mêmes colonnes).
+        """
+        if self.valid_counts is None:
+            return self.set_valid_mask(new_mask)
+        new_counts = new_mask.cumsum() + self.valid_counts.iloc[-1]
+        self.valid_mask = pd.concat([self.valid_mask, new_mask])
+        self.valid_counts = pd.concat([self.valid_counts, new_counts])
+
+    def valid_columns(self, historical_data, min_count=2):
+        """
+        Retourne les actifs disposant d'au moins min_count observations valides jusqu'à la dernière date
+        de historical_data, par lecture du masque de validité s'il est disponible.
+
+        :param historical_data: pd.DataFrame des prix historiques.
+        :param min_count: Nombre minimal d'observations valides.
+        :return: pd.Index des colonnes valides.
+        """
+        current_date = historical_data.index[-1]
+        if self.valid_counts is None or current_date not in self.valid_counts.index:
+            return historical_data.columns[historical_data.notna().sum() >= min_count]
+
+        counts = self.valid_counts.loc[current_date].reindex(historical_data.columns, fill_value=0)
+        return historical_data.columns[counts.to_numpy() >= min_count]
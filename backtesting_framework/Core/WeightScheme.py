@@ -0,0 +1,296 @@
+from abc import ABC, abstractmethod
+
+import numpy as np
+import pandas as pd
+
+from backtesting_framework.Utils import Indicators
+
+
+class WeightScheme(ABC):
+    """
+    Schéma de pondération : transforme la matrice de composition (1 = long, -1 = short, 0 = neutre)
+    en matrice de pondérations du portefeuille. Les données nécessaires (rendements des actifs mis en cache,
+    capitalisations boursières, calendrier de rebalancement) sont lues sur le Backtester.
+    """
+
+    # Indique si le schéma nécessite les capitalisations boursières (market_cap_source)
+    requires_market_caps = False
+    # Indique si les pondérations ne changent qu'aux dates de mise à jour (update_dates) : elles peuvent alors
+    # être calculées sur ces seules dates (stockage par événements, sparse_weights)
+    piecewise_constant = False
+
+    @abstractmethod
+    def compute_weights(self, composition_matrix: pd.DataFrame, backtester) -> pd.DataFrame:
+        """
+        Calcule la matrice des pondérations.
+
+        :param composition_matrix: DataFrame des positions du portefeuille (dates x actifs).
+        :param backtester: Instance de Backtester fournissant asset_returns, market_caps et calendar.
+        :return: DataFrame des pondérations (dates x actifs).
+        """
+        pass
+
+    @staticmethod
+    def update_dates(composition_matrix: pd.DataFrame, backtester) -> np.ndarray:
+        """
+        Dates auxquelles les pondérations sont recalculées : dates de rebalancement et dates où la composition change.
+
+        :param composition_matrix: DataFrame des positions du portefeuille.
+        :param backtester: Instance de Backtester.
+        :return: Tableau booléen (une valeur par date).
+        """
+        is_rebalancing = composition_matrix.index.isin(list(backtester.calendar.rebalancing_dates))
+        has_changed = composition_matrix.ne(composition_matrix.shift()).any(axis=1).to_numpy()
+        return is_rebalancing | has_changed
+
+    @staticmethod
+    def hold(weights: np.ndarray, update: np.ndarray, composition_matrix: pd.DataFrame) -> pd.DataFrame:
+        """
+        Conserve les pondérations calculées aux dates de mise à jour jusqu'à la mise à jour suivante.
+
+        :param weights: Tableau des pondérations (dates x actifs), seules les lignes de mise à jour sont utilisées.
+        :param update: Tableau booléen des dates de mise à jour.
+        :param composition_matrix: DataFrame des positions (pour l'index et les colonnes).
+        :return: DataFrame des pondérations maintenues entre deux mises à jour.
+        """
+        held = pd.DataFrame(weights, index=composition_matrix.index, columns=composition_matrix.columns)
+        return held.where(pd.Series(update, index=held.index), axis=0).ffill().fillna(0.0)
+
+
+class EqualWeight(WeightScheme):
+    """
+    Équipondération des actifs en position.
+    """
+
+    piecewise_constant = True
+
+    def compute_weights(self, composition_matrix, backtester):
+        # Comptage du nombre d'actifs en position pour chaque date
+        selected_counts = composition_matrix.abs().sum(axis=1).replace(0, pd.NA)
+        # Normalisation des poids
+        return composition_matrix.divide(selected_counts, axis=0).fillna(0)
+
+
+class MarketCapWeight(WeightScheme):
+    """
+    Pondération par la capitalisation boursière.
+    """
+
+    requires_market_caps = True
+
+    def compute_weights(self, composition_matrix, backtester):
+        weighted_market_caps = composition_matrix * backtester.market_caps
+        sum_market_caps = weighted_market_caps.abs().sum(axis=1).replace(0, pd.NA)
+        return weighted_market_caps.divide(sum_market_caps, axis=0).fillna(0)
+
+
+class CappedMarketCapWeight(MarketCapWeight):
+    """
+    Pondération par la capitalisation boursière dont le poids absolu de chaque actif est plafonné.
+    L'excédent des actifs plafonnés est redistribué proportionnellement aux actifs non plafonnés.
+    """
+
+    def __init__(self, cap: float = 0.1):
+        """
+        :param cap: Poids absolu maximal d'un actif (entre 0 et 1, par défaut : 0.1).
+        :raises ValueError: Si cap n'est pas dans ]0, 1].
+        """
+        if not 0 < cap <= 1:
+            raise ValueError("cap doit être compris entre 0 (exclu) et 1.")
+        self.cap = cap
+
+    def compute_weights(self, composition_matrix, backtester):
+        weights = super().compute_weights(composition_matrix, backtester)
+        values = weights.to_numpy(dtype="float64")
+        signs = np.sign(values)
+        capped = self.cap_weights(np.abs(values), self.cap)
+
+        # Plafond irréalisable (nombre d'actifs x cap < 1) : équipondération des actifs en position
+        selected = values != 0
+        counts = selected.sum(axis=1)
+        infeasible = (counts > 0) & (counts * self.cap < 1)
+        capped[infeasible] = selected[infeasible] / counts[infeasible, np.newaxis]
+
+        return pd.DataFrame(signs * capped, index=weights.index, columns=weights.columns)
+
+    @staticmethod
+    def cap_weights(weights: np.ndarray, cap: float) -> np.ndarray:
+        """
+        Plafonne des poids positifs de somme 1, ligne par ligne et pour toutes les dates à la fois.
+
+        :param weights: Tableau des poids absolus (dates x actifs).
+        :param cap: Poids maximal d'un actif.
+        :return: Tableau des poids plafonnés.
+        """
+        weights = weights.copy()
+        for _ in range(weights.shape[1]):
+            if not (weights > cap).any():
+                break
+            capped = np.minimum(weights, cap)
+            excess = (weights - capped).sum(axis=1)
+            free = (weights > 0) & (weights < cap)
+            free_total = np.where(free, weights, 0.0).sum(axis=1)
+            scale = np.divide(excess, free_total, out=np.zeros_like(excess), where=free_total > 0)
+            weights = np.where(free, weights * (1 + scale[:, np.newaxis]), capped)
+        return weights
+
+
+class InverseVolatilityWeight(WeightScheme):
+    """
+    Pondération inversement proportionnelle à la volatilité glissante de chaque actif.
+
+    Le panel des volatilités est calculé en une seule passe sur les rendements mis en cache par le Backtester
+    (Indicators.rolling_std), puis les poids sont figés entre deux dates de mise à jour.
+    Si un actif en position n'a pas d'estimation de volatilité, la date est équipondérée.
+    """
+
+    piecewise_constant = True
+
+    def __init__(self, window: int = 60):
+        """
+        :param window: Nombre de jours de la fenêtre de volatilité (par défaut : 60).
+        """
+        self.window = window
+
+    def compute_weights(self, composition_matrix, backtester):
+        positions = composition_matrix.fillna(0.0).to_numpy(dtype="float64")
+
+        # Seules les dates couvertes par la composition (et la fenêtre qui les précède) sont utilisées
+        returns = backtester.asset_returns
+        rows = returns.index.get_indexer(composition_matrix.index)
+        start, end = max(rows[0] - self.window + 1, 0), rows[-1] + 1
+        if (start, end) != (0, len(returns)):
+            returns = returns.iloc[start:end]
+        volatility = Indicators.rolling_std(returns, self.window)
+        # Tableaux contigus par date : les sommes par ligne ne dépendent pas de la disposition en mémoire du panel
+        volatility = np.ascontiguousarray(volatility.reindex(index=composition_matrix.index,
+                                                             columns=composition_matrix.columns).to_numpy())
+        positions = np.ascontiguousarray(positions)
+
+        selected = positions != 0
+        missing = (selected & ~(volatility > 0)).any(axis=1)
+        inverse_volatility = np.divide(1.0, volatility, out=np.zeros_like(volatility), where=volatility > 0)
+
+        raw = np.where(selected, inverse_volatility, 0.0)
+        raw[missing] = selected[missing]
+        total = raw.sum(axis=1, keepdims=True)
+        weights = np.sign(positions) * np.divide(raw, total, out=np.zeros_like(raw), where=total > 0)
+
+        return self.hold(weights, self.update_dates(composition_matrix, backtester), composition_matrix)
+
+
+class EqualRiskContribution(WeightScheme):
+    """
+    Pondération à contributions au risque égales (risk parity) des actifs en position.
+
+    À chaque date de mise à jour, la covariance des rendements signés (position x rendement) est estimée
+    sur la fenêtre glissante, puis le problème min 1/2 x'Σx - b'log(x) est résolu par la méthode de Newton,
+    initialisée avec la solution de la date précédente. Les poids sont figés entre deux mises à jour.
+    Si un actif en position n'a pas d'historique complet ou a une variance nulle, la date est équipondérée.
+    """
+
+    piecewise_constant = True
+
+    def __init__(self, window: int = 60, tol: float = 1e-10, max_iter: int = 50):
+        """
+        :param window: Nombre de jours de la fenêtre d'estimation de la covariance (par défaut : 60).
+        :param tol: Tolérance sur l'écart entre contributions au risque et budgets (par défaut : 1e-10).
+        :param max_iter: Nombre maximal d'itérations de Newton par date (par défaut : 50).
+        """
+        self.window = window
+        self.tol = tol
+        self.max_iter = max_iter
+        self.iterations = 0
+
+    def compute_weights(self, composition_matrix, backtester):
+        positions = composition_matrix.fillna(0.0).to_numpy(dtype="float64")
+        returns = backtester.asset_returns.reindex(columns=composition_matrix.columns).to_numpy(dtype="float64")
+        rows_in_returns = backtester.asset_returns.index.get_indexer(composition_matrix.index)
+        update = self.update_dates(composition_matrix, backtester)
+
+        weights = np.zeros_like(positions)
+        previous = np.zeros(positions.shape[1])
+        self.iterations = 0
+
+        for row in np.flatnonzero(update):
+            selected = np.flatnonzero(positions[row])
+            if selected.size == 0:
+                previous[:] = 0.0
+                continue
+
+            signs = np.sign(positions[row, selected])
+            budgets = np.abs(positions[row, selected]) / np.abs(positions[row, selected]).sum()
+            end = rows_in_returns[row] + 1
+            if end < self.window:
+                weights[row, selected] = signs / selected.size
+                continue
+
+            window_returns = returns[end - self.window:end, selected] * signs
+            covariance = np.atleast_2d(np.cov(window_returns, rowvar=False))
+            variances = np.diag(covariance)
+            if not (np.all(np.isfinite(covariance)) and np.all(variances > 0)):
+                weights[row, selected] = signs / selected.size
+                continue
+
+            # Démarrage à chaud : poids de la date précédente, 1 / volatilité pour les nouveaux actifs
+            start = np.where(previous[selected] > 0, previous[selected], 1 / np.sqrt(variances))
+            solution = self.solve(covariance, budgets, start)
+
+            previous[:] = 0.0
+            previous[selected] = solution
+            weights[row, selected] = signs * solution
+
+        return self.hold(weights, update, composition_matrix)
+
+    def solve(self, covariance: np.ndarray, budgets: np.ndarray, start: np.ndarray) -> np.ndarray:
+        """
+        Résout le problème de budget de risque par la méthode de Newton.
+
+        :param covariance: Matrice de covariance (k x k).
+        :param budgets: Budgets de risque positifs de somme 1.
+        :param start: Point de départ positif (seule sa direction compte).
+        :return: Poids positifs de somme 1 dont les contributions au risque sont proportionnelles aux budgets.
+        """
+        # Mise à l'échelle du point de départ pour que x'Σx = somme des budgets, comme à l'optimum
+        x = start / np.sqrt(start @ covariance @ start)
+        for _ in range(self.max_iter):
+            marginal_risk = covariance @ x
+            if np.max(np.abs(x * marginal_risk - budgets)) < self.tol:
+                break
+            self.iterations += 1
+            gradient = marginal_risk - budgets / x
+            hessian = covariance + np.diag(budgets / x ** 2)
+            step = np.linalg.solve(hessian, -gradient)
+
+            # Pas réduit de moitié tant que les poids ne restent pas strictement positifs
+            size = 1.0
+            while np.any(x + size * step <= 0):
+                size /= 2
+            x = x + size * step
+
+        return x / x.sum()
+
+
+# Schémas disponibles par leur nom (paramètres par défaut)
+WEIGHT_SCHEMES = {
+    "EqualWeight": EqualWeight,
+    "MarketCapWeight": MarketCapWeight,
+    "CappedMarketCapWeight": CappedMarketCapWeight,
+    "InverseVolatilityWeight": InverseVolatilityWeight,
+    "EqualRiskContribution": EqualRiskContribution,
+}
+
+
+def get_weight_scheme(weight_scheme) -> WeightScheme:
+    """
+    Retourne l'objet schéma de pondération correspondant à un nom ou à une instance.
+
+    :param weight_scheme: Nom du schéma (clé de WEIGHT_SCHEMES) ou instance de WeightScheme.
+    :return: Instance de WeightScheme.
+    :raises ValueError: Si le schéma de pondération n'est pas reconnu.
+    """
+    if isinstance(weight_scheme, WeightScheme):
+        return weight_scheme
+    if isinstance(weight_scheme, str) and weight_scheme in WEIGHT_SCHEMES:
+        return WEIGHT_SCHEMES[weight_scheme]()
+    raise ValueError(f"Schéma de pondération inconnu : {weight_scheme}")
@@ -4,6 +4,7 @@
 import streamlit as st
 import pandas as pd
 from backtesting_framework.Core.Backtester import Backtester
+from backtesting_framework.Core.WeightScheme import WEIGHT_SCHEMES
 from backtesting_framework.Strategies.RSI import RSI
 from backtesting_framework.Strategies.BollingerBands import BollingerBands
 from backtesting_framework.Strategies.MeanReversion import MeanReversion
@@ -15,13 +16,14 @@ from backtesting_framework.Strategies.BuyAndHold import BuyAndHold
 from backtesting_framework.Strategies.MinVariance import MinVariance
 from backtesting_framework.Strategies.Volatility_Trend import VolatilityTrendStrategy
 from backtesting_framework.Strategies.KeltnerChannelStrategy import KeltnerChannelStrategy
+from backtesting_framework.Utils.Tools import NA_VALUES, load_panel
 
 
 @st.cache_data
 def load_data(file_path):
     # Vérifier le format du fichier
     if file_path.name.endswith('.csv'):
-        data = pd.read_csv(file_path, index_col=0)
+        data = pd.read_csv(file_path, index_col=0, na_values=NA_VALUES)
     elif file_path.name.endswith('.parquet'):
         data = pd.read_parquet(file_path)
     else:
@@ -33,7 +35,8 @@ def load_data(file_path):
     except Exception as e:
         raise ValueError(f"Error converting index to datetime: {e}")
 
-    return data
+    # Conversion unique en panel numérique, partagé sans copie par les stratégies
+    return load_panel(data)
 
 # Interface utilisateur
 st.title("Backtesting Interface")
@@ -55,14 +58,14 @@ transaction_cost_1 = st.sidebar.number_input("Transaction Cost (Strategy 1, %):"
 slippage_1 = st.sidebar.number_input("Slippage (Strategy 1, %):", min_value=0.0, max_value=100.0, value=0.0, step=0.1)/100
 risk_free_rate_1 = st.sidebar.number_input("Risk Free Rate (Strategy 1, %):", min_value=0.0, max_value=100.0, value=0.0, step=0.1)/100
 rebalancing_frequency_1 = st.sidebar.selectbox("Rebalancing Frequency (Strategy 1):", ["daily", "weekly", "monthly"], index=2)
-weight_scheme_1 = st.sidebar.selectbox("Weighting Scheme (Strategy 1):", ["EqualWeight", "MarketCapWeight"], index=0)
+weight_scheme_1 = st.sidebar.selectbox("Weighting Scheme (Strategy 1):", list(WEIGHT_SCHEMES), index=0)
 special_start_1 = st.sidebar.number_input("Special Start (Strategy 1, Index):", min_value=1, max_value=1000, value=1)
 plot_library_1 = st.sidebar.selectbox("Visualization Library (Strategy 1):", ["matplotlib", "seaborn", "plotly"], index=0)
 apply_vol_target_1 = st.sidebar.checkbox("Apply Vol Target (Strategy 1)", value=False)
 target_vol_1 = st.sidebar.number_input("Target Volatility (Strategy 1, %):", min_value=0.0, max_value=100.0, value=10.0, step=0.1) if apply_vol_target_1 else None
 
 market_cap_file_1 = None
-if weight_scheme_1 == "MarketCapWeight":
+if WEIGHT_SCHEMES[weight_scheme_1].requires_market_caps:
     st.sidebar.subheader("Market Cap Data - Strategy 1")
     selected_market_cap_file_1 = st.sidebar.selectbox("Select Market Cap File (Strategy 1):", options=list(data_files.keys()))
     market_cap_file_1 = data_files[selected_market_cap_file_1] if selected_market_cap_file_1 else None
@@ -178,14 +181,14 @@ if compare_strategies:
     slippage_2 = st.sidebar.number_input("Slippage (Strategy 2, %):", min_value=0.0, max_value=100.0, value=0.0, step=0.1)/100
     risk_free_rate_2 = st.sidebar.number_input("Risk Free Rate (Strategy 2, %):", min_value=0.0, max_value=100.0,value=0.0, step=0.1)/100
     rebalancing_frequency_2 = st.sidebar.selectbox("Rebalancing Frequency (Strategy 2):", ["daily", "weekly", "monthly"], index=2)
-    weight_scheme_2 = st.sidebar.selectbox("Weighting Scheme (Strategy 2):", ["EqualWeight", "MarketCapWeight"], index=0)
+    weight_scheme_2 = st.sidebar.selectbox("Weighting Scheme (Strategy 2):", list(WEIGHT_SCHEMES), index=0)
     special_start_2 = st.sidebar.number_input("Special Start (Strategy 2, Index):", min_value=1, max_value=1000, value=1)
     plot_library_2 = st.sidebar.selectbox("Visualization Library (Strategy 2):", ["matplotlib", "seaborn", "plotly"], index=0)
     apply_vol_target_2 = st.sidebar.checkbox("Apply Vol Target (Strategy 2)", value=False)
     target_vol_2 = st.sidebar.number_input("Target Volatility (Strategy 2, %):", min_value=0.0, max_value=100.0, value=10.0, step=0.1)/100 if apply_vol_target_2 else None
 
     market_cap_file_2 = None
-    if weight_scheme_2 == "MarketCapWeight":
+    if WEIGHT_SCHEMES[weight_scheme_2].requires_market_caps:
         st.sidebar.subheader("Market Cap Data - Strategy 2")
         selected_market_cap_file_2 = st.sidebar.selectbox("Select Market Cap File (Strategy 2):", options=list(data_files.keys()))
         market_cap_file_2 = data_files[selected_market_cap_file_2] if selected_market_cap_file_2 else None
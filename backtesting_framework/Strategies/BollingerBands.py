@@ -1,4 +1,5 @@
 from backtesting_framework.Core.Strategy import Strategy
+from backtesting_framework.Utils import Indicators
 import pandas as pd
 import numpy as np
 
@@ -68,6 +69,19 @@ class BollingerBands(Strategy):
 
         return moving_average, upper_band, lower_band
 
+    def get_signals(self, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Calcul vectorisé des signaux sur l'ensemble du panel de prix, à partir des indicateurs partagés.
+
+        :param data: pd.DataFrame des prix (dates x actifs).
+        :return: pd.DataFrame des positions (NaN = maintien de la position tant que l'historique est insuffisant).
+        """
+        _, upper_band, lower_band = Indicators.bollinger_bands(data, self.window, self.num_std_dev)
+
+        signals = np.where(data < lower_band, 1.0, np.where(data > upper_band, -1.0, 0.0))
+        signals[:self.window - 1] = np.nan
+        return pd.DataFrame(signals, index=data.index, columns=data.columns)
+
     def fit(self, data):
         """
         Méthode d'ajustement optionnelle. Non utilisée pour cette stratégie.
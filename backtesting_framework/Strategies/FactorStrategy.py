@@ -0,0 +1,91 @@
+from backtesting_framework.Core.Strategy import Strategy
+from backtesting_framework.Core.FactorEngine import FactorEngine
+import pandas as pd
+
+
+class FactorStrategy(Strategy):
+    """
+    Classe de base des stratégies factorielles cross-sectionnelles (Value, Quality, Size) :
+    Délègue le calcul des scores et de la matrice de composition au FactorEngine.
+
+    Les classes filles définissent METRICS, le dictionnaire {nom de la métrique: (direction, poids)}.
+    """
+
+    METRICS = {}
+
+    def __init__(self, window: int = 30, assets_picked_long: int = 5, assets_picked_short: int = 5,
+                 dtype: str = "float64"):
+        """
+        Initialisation de la stratégie factorielle.
+
+        :param window: Période, en nombre de jours, de la fenêtre glissante pour lisser les métriques.
+        :param assets_picked_long: Nombre d'actifs à acheter.
+        :param assets_picked_short: Nombre d'actifs à vendre.
+        :param dtype: Type flottant des panels de métriques ('float64' ou 'float32').
+        """
+        super().__init__(multi_asset=False)
+        self.window = window
+        self.assets_picked_long = assets_picked_long
+        self.assets_picked_short = assets_picked_short
+        self.engine = FactorEngine(self.METRICS, window, assets_picked_long, assets_picked_short, dtype)
+        # DataFrame de composition (1 = long, -1 = short, 0 = neutre) pour chaque actif et chaque date.
+        self.composition = None
+
+    def fit(self, data: dict):
+        """
+        Calcul de la matrice de composition à partir des panels de métriques.
+        Les DataFrames fournis ne sont ni copiés s'ils sont déjà numériques, ni modifiés.
+
+        :param data: Dictionnaire {nom de la métrique: DataFrame dates x actifs}.
+        """
+        self.composition = self.engine.fit(data)
+
+    def fitted_state(self):
+        """
+        La matrice de composition calculée par fit détermine les positions.
+
+        :return: Dictionnaire {'composition': DataFrame de composition}.
+        """
+        return {"composition": self.composition}
+
+    def get_position(self, historical_data: pd.Series, current_position: float) -> float:
+        """
+        Détermine la position à prendre (long, short ou neutre) pour un actif donné à une date donnée,
+        par simple lecture de la matrice de composition calculée lors du fit.
+
+        :param historical_data: pd.Series contenant les prix historiques pour un actif donné.
+        :param current_position: Position actuelle sur l'actif (1 pour long, -1 pour short, 0 pour neutral).
+        :return: La nouvelle position à prendre (1 = long, -1 = short, 0 = neutral).
+        :raises ValueError: Si la stratégie n'a pas été ajustée au préalable.
+        """
+        self._check_fitted()
+
+        # Récupération du ticker et de la date
+        current_ticker = historical_data.name
+        current_date = historical_data.index[-1]
+
+        # Absence du ticker ou de la date dans la matrice de composition
+        if (current_ticker not in self.composition.columns) or (current_date not in self.composition.index):
+            return 0.0
+
+        return float(self.composition.at[current_date, current_ticker])
+
+    def get_signals(self, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Retourne la matrice de composition alignée sur les données de marché.
+
+        :param data: pd.DataFrame des prix (dates x actifs).
+        :return: pd.DataFrame des positions, nulles pour les actifs ou dates sans score.
+        :raises ValueError: Si la stratégie n'a pas été ajustée au préalable.
+        """
+        self._check_fitted()
+        return self.composition.reindex(index=data.index, columns=data.columns).fillna(0.0)
+
+    def _check_fitted(self):
+        """
+        Vérifie que la matrice de composition a été calculée.
+
+        :raises ValueError: Si fit n'a pas été appelé.
+        """
+        if self.composition is None:
+            raise ValueError("La stratégie doit être ajustée avec fit avant d'être utilisée.")
@@ -1,4 +1,6 @@
 from backtesting_framework.Core.Strategy import Strategy
+from backtesting_framework.Utils import Indicators
+import numpy as np
 import pandas as pd
 
 class KeltnerChannelStrategy(Strategy):
@@ -28,9 +30,9 @@ class KeltnerChannelStrategy(Strategy):
         :param period: Nombre de périodes pour le calcul de l'ATR.
         :return: Valeur de l'ATR calculée.
         """
-        delta = prices[1:] - prices[:-1]
-        delta = pd.Series(delta)
-        atr = delta.abs().rolling(period).mean().iloc[-1]
+        if len(prices) <= period:
+            return np.nan
+        atr = np.abs(np.diff(prices[-(period + 1):])).mean()
         return atr
 
     def calculate_sma(self, prices, period):
@@ -41,8 +43,9 @@ class KeltnerChannelStrategy(Strategy):
         :param period: Nombre de périodes pour le calcul de la SMA.
         :return: Valeur de la SMA calculée.
         """
-        prices = pd.Series(prices)
-        sma = prices.rolling(period).mean().iloc[-1]
+        if len(prices) < period:
+            return np.nan
+        sma = prices[-period:].mean()
         return sma
 
     def get_position(self, historical_data: pd.DataFrame, current_position: float) -> float:
@@ -73,6 +76,21 @@ class KeltnerChannelStrategy(Strategy):
         else:
             return current_position  # Maintien de la position actuelle
 
+    def get_signals(self, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Calcul vectorisé des signaux sur l'ensemble du panel de prix, à partir des indicateurs partagés.
+
+        :param data: pd.DataFrame des prix (dates x actifs).
+        :return: pd.DataFrame des positions (NaN = maintien de la position actuelle).
+        """
+        atr = Indicators.atr(data, self.atr_period)
+        sma = Indicators.sma(data, self.sma_period)
+        upper_band = sma + atr * self.atr_multiplier
+        lower_band = sma - atr * self.atr_multiplier
+
+        signals = np.where(data > upper_band, 1.0, np.where(data < lower_band, -1.0, np.nan))
+        return pd.DataFrame(signals, index=data.index, columns=data.columns)
+
     def fit(self, data):
         """
         Méthode optionnelle pour l'ajustement. Non utilisée dans cette stratégie.
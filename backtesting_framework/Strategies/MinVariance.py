@@ -26,8 +26,8 @@ class MinVariance(Strategy):
         :param current_position: Position actuelle (non utilisée dans cette stratégie).
         :return: np.ndarray contenant les pondérations optimisées, avec 0 pour les actifs sans données suffisantes.
         """
-        # Identification des colonnes valides (actifs) avec au moins deux points de données valides
-        valid_columns = historical_data.columns[historical_data.notna().sum() >= 2]
+        # Identification des colonnes valides (actifs) avec au moins deux points de données valides (masque de validité)
+        valid_columns = self.valid_columns(historical_data, min_count=2)
         historical_data_valid = historical_data[valid_columns]
 
         if historical_data_valid.shape[1] == 0:
@@ -1,4 +1,6 @@
 from backtesting_framework.Core.Strategy import Strategy
+from backtesting_framework.Utils import Indicators
+import numpy as np
 import pandas as pd
 
 class MovingAverage(Strategy):
@@ -80,6 +82,21 @@ class MovingAverage(Strategy):
 
         return ema
 
+    def get_signals(self, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Calcul vectorisé des signaux sur l'ensemble du panel de prix, à partir des indicateurs partagés.
+
+        :param data: pd.DataFrame des prix (dates x actifs).
+        :return: pd.DataFrame des positions (NaN = maintien de la position actuelle).
+        """
+        moving_average = Indicators.ema if self.exponential_mode else Indicators.sma
+        ma_short = moving_average(data, self.short_window)
+        ma_long = moving_average(data, self.long_window)
+
+        signals = np.where(ma_short > ma_long, 1.0, np.where(ma_short < ma_long, -1.0, np.nan))
+        signals[:max(self.short_window, self.long_window) - 1] = np.nan
+        return pd.DataFrame(signals, index=data.index, columns=data.columns)
+
     def fit(self, data):
         """
         Méthode optionnelle d'ajustement (fit). Non utilisée pour cette stratégie.
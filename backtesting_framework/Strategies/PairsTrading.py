@@ -15,14 +15,26 @@ class PairsTradingStrategy(Strategy):
     basés sur les écarts de prix (spread) entre ces paires.
     """
 
-    def __init__(self, data, z_score_upper=1.0, z_score_lower=-1.0, significant_level=0.05):
+    def __init__(self, data=None, z_score_upper=1.0, z_score_lower=-1.0, significant_level=0.05,
+                 reselection_window=None, reselection_frequency=21, boundary_band=(0.5, 2.0),
+                 beta_tolerance=0.1, min_correlation=0.0):
         """
         Initialisation de la stratégie de trading de paires.
 
-        :param data: Données des actifs et leurs prix respectifs.
+        Par défaut, les paires sont sélectionnées une seule fois sur l'ensemble des données fournies.
+        Si reselection_window est renseigné, les paires sont re-sélectionnées périodiquement pendant le
+        backtest en n'utilisant que les reselection_window dernières observations (sélection point-in-time).
+
+        :param data: Données des actifs et leurs prix respectifs (inutilisées en mode re-sélection).
         :param z_score_upper: Seuil supérieur pour le z-score, déclenchant une position courte sur une paire.
         :param z_score_lower: Seuil inférieur pour le z-score, déclenchant une position longue sur une paire.
         :param significant_level: Niveau de significativité pour le test de cointégration (p-value).
+        :param reselection_window: Nombre d'observations de la fenêtre glissante de sélection (None = sélection unique).
+        :param reselection_frequency: Nombre minimal de jours entre deux re-sélections des paires.
+        :param boundary_band: Bornes (basse, haute), en multiples de significant_level, de la zone de p-values
+                              pour laquelle une paire déjà testée est re-testée.
+        :param beta_tolerance: Variation relative du coefficient de couverture au-delà de laquelle une paire est re-testée.
+        :param min_correlation: Corrélation absolue minimale des prix pour qu'une paire soit testée.
         """
 
         super().__init__(multi_asset=True)
@@ -30,7 +42,48 @@ class PairsTradingStrategy(Strategy):
         self.z_score_lower = z_score_lower
         self.z_score_upper = z_score_upper
         self.significant_level = significant_level
-        self.pairs = self.find_cointegrated_pairs(data, self.significant_level)
+        self.reselection_window = reselection_window
+        self.reselection_frequency = reselection_frequency
+        self.boundary_band = boundary_band
+        self.beta_tolerance = beta_tolerance
+        self.min_correlation = min_correlation
+
+        if self.reselection_window is None:
+            if data is None:
+                raise ValueError("data doit être fourni si reselection_window n'est pas renseigné.")
+            self.pairs = self.find_cointegrated_pairs(data, self.significant_level)
+        self._reset_selection()
+
+    def _reset_selection(self):
+        """
+        Réinitialise l'état de la sélection glissante (statistiques suffisantes de la fenêtre, résultats des
+        derniers tests et paires retenues). Sans effet en mode sélection unique.
+        """
+        if self.reselection_window is None:
+            return
+        self.pairs = []
+        # Indices (dans l'historique reçu) de la dernière sélection, de la fenêtre des statistiques et des tests,
+        # repérés par la dernière date vue et la longueur de l'historique correspondant
+        self._last_date = None
+        self._last_length = None
+        self._last_selection = None
+        self._stats_start = None
+        self._stats_end = None
+        self._counts = None
+        self._sums = None
+        self._cross = None
+        self._pvalue_matrix = None
+        self._beta_matrix = None
+        self._tested_at = None
+
+    def fitted_state(self):
+        """
+        Les paires sélectionnées à l'initialisation déterminent les positions ; en mode re-sélection,
+        elles sont recalculées pendant le backtest et ne font pas partie de la configuration.
+
+        :return: Dictionnaire {'pairs': paires co-intégrées}, vide en mode re-sélection.
+        """
+        return {"pairs": list(self.pairs)} if self.reselection_window is None else {}
 
     def find_cointegrated_pairs(self,data,significance_level=0.05):
         """
@@ -43,7 +96,6 @@ class PairsTradingStrategy(Strategy):
         # Suppression des colonnes avec des valeurs manquantes
         data_valid = data.dropna(axis=1)
         data_valid = data_valid.loc[:, data_valid.nunique() > 10]
-        warnings.filterwarnings("ignore", category=CollinearityWarning)
 
         keys = data_valid.keys()
         n = len(keys)
@@ -53,14 +105,16 @@ class PairsTradingStrategy(Strategy):
         indices = np.triu_indices(n, 1)
 
         # Application du test de cointégration pour chaque paire d'actifs
-        for i, j in zip(*indices):
-            S1 = data_valid[keys[i]]
-            S2 = data_valid[keys[j]]
-            score, pvalue, _ = coint(S1, S2)
-            score_matrix[i, j] = score
-            pvalue_matrix[i, j] = pvalue
-            if pvalue < significance_level:
-                pairs.append((keys[i], keys[j]))
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", CollinearityWarning)
+            for i, j in zip(*indices):
+                S1 = data_valid[keys[i]]
+                S2 = data_valid[keys[j]]
+                score, pvalue, _ = coint(S1, S2)
+                score_matrix[i, j] = score
+                pvalue_matrix[i, j] = pvalue
+                if pvalue < significance_level:
+                    pairs.append((keys[i], keys[j]))
         return pairs
 
     def calculate_z_score(self, series):
@@ -81,8 +135,14 @@ class PairsTradingStrategy(Strategy):
         :param current_position: Liste des positions actuelles sur les actifs.
         :return: Liste des nouvelles positions pour chaque actif.
         """
-        # Filtrage des colonnes valides (au moins 2 valeurs non nulles)
-        valid_columns = historical_data.columns[historical_data.notna().sum() >= 2]
+        # Re-sélection des paires sur les données passées uniquement, selon le calendrier défini
+        if self.reselection_window is not None:
+            self._align_state(historical_data.index)
+            if self._last_selection is None or len(historical_data) - self._last_selection >= self.reselection_frequency:
+                self.update_pairs(historical_data)
+
+        # Filtrage des colonnes valides (au moins 2 valeurs non nulles, lues dans le masque de validité)
+        valid_columns = self.valid_columns(historical_data, min_count=2)
         historical_data_valid = historical_data[valid_columns]
 
         if historical_data_valid.shape[1] == 0:
@@ -116,10 +176,145 @@ class PairsTradingStrategy(Strategy):
                 position[asset1] = 0
                 position[asset2] = 0
 
-        # Conversion des positions en liste
-        current_position = position.values.tolist()[0]
+        # Conversion des positions en liste sur l'ensemble des actifs (0 pour les actifs non valides)
+        current_position = position.reindex(columns=historical_data.columns, fill_value=0).values.tolist()[0]
         return current_position
 
+    def update_pairs(self, historical_data):
+        """
+        Met à jour la liste des paires co-intégrées à partir de la fenêtre glissante se terminant
+        à la dernière date de historical_data.
+
+        Les statistiques suffisantes de la régression (sommes et produits croisés des prix) sont mises à jour
+        de manière incrémentale. Seules les paires jamais testées, celles dont la p-value est proche du seuil
+        de significativité, les paires retenues dont le coefficient de couverture a dérivé et celles dont le dernier
+        test porte sur une fenêtre entièrement renouvelée sont re-testées.
+
+        :param historical_data: pd.DataFrame contenant les prix historiques jusqu'à la date courante.
+        :return: Liste des paires co-intégrées retenues.
+        """
+        self._align_state(historical_data.index)
+        keys = historical_data.columns
+        values = historical_data.to_numpy(dtype="float64")
+        end = len(values)
+        start = max(0, end - self.reselection_window)
+        window_length = end - start
+
+        if self._pvalue_matrix is None or self._pvalue_matrix.shape[0] != len(keys):
+            self._pvalue_matrix = np.full((len(keys), len(keys)), np.nan)
+            self._beta_matrix = np.full((len(keys), len(keys)), np.nan)
+            self._tested_at = np.zeros((len(keys), len(keys)), dtype="int64")
+            self._stats_end = None
+
+        self._update_window_statistics(values, start, end)
+        self._last_selection = end
+
+        # Actifs éligibles : historique complet sur la fenêtre et prix suffisamment variés
+        window = historical_data.iloc[start:end]
+        eligible = (self._counts == window_length) & (window.nunique().to_numpy() > 10)
+
+        # Covariances, corrélations et coefficients de couverture de toutes les paires
+        mean = self._sums / window_length
+        cov = self._cross / window_length - np.outer(mean, mean)
+        var = np.diag(cov).copy()
+        var[var <= 0] = np.nan
+        with np.errstate(invalid="ignore", divide="ignore"):
+            corr = cov / np.sqrt(np.outer(var, var))
+            beta = cov / var[np.newaxis, :]
+
+        i_idx, j_idx = np.triu_indices(len(keys), 1)
+        candidate = eligible[i_idx] & eligible[j_idx] & (np.abs(corr[i_idx, j_idx]) >= self.min_correlation)
+
+        # Les résultats des paires non candidates sont oubliés : elles seront re-testées si elles le redeviennent
+        self._pvalue_matrix[i_idx[~candidate], j_idx[~candidate]] = np.nan
+
+        pvalues = self._pvalue_matrix[i_idx, j_idx]
+        previous_beta = self._beta_matrix[i_idx, j_idx]
+        current_beta = beta[i_idx, j_idx]
+        lower_bound = self.significant_level * self.boundary_band[0]
+        upper_bound = self.significant_level * self.boundary_band[1]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            beta_drift = np.abs(current_beta - previous_beta) > self.beta_tolerance * np.abs(previous_beta)
+        expired = end - self._tested_at[i_idx, j_idx] >= self.reselection_window
+        to_test = candidate & (
+                np.isnan(pvalues)
+                | ((pvalues >= lower_bound) & (pvalues <= upper_bound))
+                | (beta_drift & (pvalues < upper_bound))
+                | expired
+        )
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", CollinearityWarning)
+            for i, j in zip(i_idx[to_test], j_idx[to_test]):
+                _, pvalue, _ = coint(values[start:end, i], values[start:end, j])
+                self._pvalue_matrix[i, j] = pvalue
+                self._beta_matrix[i, j] = beta[i, j]
+                self._tested_at[i, j] = end
+
+        selected = candidate & (self._pvalue_matrix[i_idx, j_idx] < self.significant_level)
+        self.pairs = [(keys[i], keys[j]) for i, j in zip(i_idx[selected], j_idx[selected])]
+        return self.pairs
+
+    def _align_state(self, index):
+        """
+        Ré-aligne les indices mémorisés sur l'historique reçu, à partir de la position de la dernière date vue.
+        Si l'historique a été tronqué par le début (trim_history, backtest par blocs), les indices sont décalés
+        d'autant ; si cette date n'y figure pas (nouveau backtest avec la même instance), l'état est réinitialisé.
+
+        :param index: Index des dates de l'historique reçu.
+        """
+        if len(index) == 0:
+            return
+        if self._last_date is not None:
+            position = index.get_indexer([self._last_date])[0]
+            if position < 0:
+                self._reset_selection()
+            else:
+                shift = self._last_length - 1 - position
+                if shift and self._last_selection is not None:
+                    self._last_selection -= shift
+                    self._tested_at -= shift
+                    if self._stats_end is not None:
+                        self._stats_start -= shift
+                        self._stats_end -= shift
+        self._last_date = index[-1]
+        self._last_length = len(index)
+
+    def _update_window_statistics(self, values, start, end):
+        """
+        Met à jour les statistiques suffisantes (nombre d'observations, sommes et produits croisés des prix)
+        de la fenêtre [start, end) en ajoutant les lignes entrantes et en retirant les lignes sortantes.
+        Les valeurs manquantes sont comptées comme nulles et exclues du nombre d'observations.
+
+        :param values: np.ndarray des prix historiques (dates x actifs).
+        :param start: Indice de début (inclus) de la fenêtre.
+        :param end: Indice de fin (exclu) de la fenêtre.
+        """
+        if self._stats_end is None or start >= self._stats_end or not 0 <= self._stats_start <= start:
+            # Pas de recouvrement avec la fenêtre précédente, ou lignes sortantes absentes de l'historique : calcul complet
+            self._counts, self._sums, self._cross = self._block_statistics(values[start:end])
+        else:
+            entering = self._block_statistics(values[self._stats_end:end])
+            leaving = self._block_statistics(values[self._stats_start:start])
+            self._counts = self._counts + entering[0] - leaving[0]
+            self._sums = self._sums + entering[1] - leaving[1]
+            self._cross = self._cross + entering[2] - leaving[2]
+
+        self._stats_start = start
+        self._stats_end = end
+
+    @staticmethod
+    def _block_statistics(block):
+        """
+        Calcule les statistiques suffisantes d'un bloc de lignes de prix.
+
+        :param block: np.ndarray (lignes x actifs), pouvant contenir des NaN.
+        :return: Tuple (nombre d'observations valides, sommes, matrice des produits croisés).
+        """
+        valid = ~np.isnan(block)
+        filled = np.where(valid, block, 0.0)
+        return valid.sum(axis=0), filled.sum(axis=0), filled.T @ filled
+
     def fit(self, data):
         """
         Méthode optionnelle d'ajustement (fit). Non utilisée pour cette stratégie.
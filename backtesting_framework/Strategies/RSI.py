@@ -1,4 +1,6 @@
 from backtesting_framework.Core.Strategy import Strategy
+from backtesting_framework.Utils import Indicators
+import numpy as np
 import pandas as pd
 
 class RSI(Strategy):
@@ -62,37 +64,28 @@ class RSI(Strategy):
         :param period: Nombre de périodes pour le calcul du RSI (par défaut 14).
         :return: Valeur du RSI (entre 0 et 100).
         """
-        # Convertir en Series pour utiliser diff() facilement
-        prices_series = pd.Series(prices)
+        # Noyau de lissage de Wilder partagé avec le calcul vectorisé sur le panel
+        rsi_value = Indicators.wilder_rsi(prices, period)[-1]
 
-        # Calcul des variations
-        delta = prices_series.diff(1).dropna()
+        # Retourne une valeur neutre si les données sont insuffisantes
+        if np.isnan(rsi_value):
+            return 50.0
+        return float(rsi_value)
 
-        # On sépare les gains et les pertes
-        gains = delta.where(delta > 0, 0.0)
-        losses = delta.where(delta < 0, 0.0).abs()
-
-        # Vérifier que nous avons suffisamment de données
-        if len(gains) < period:
-            return 50.0  # Retourne une valeur neutre si les données sont insuffisantes
-
-        # Moyenne des gains et pertes sur "period" périodes (méthode exponentielle lissée, standard pour le RSI)
-        avg_gain = gains.rolling(window=period, min_periods=period).mean().iloc[period - 1]
-        avg_loss = losses.rolling(window=period, min_periods=period).mean().iloc[period - 1]
-
-        # Ensuite, on fait le calcul progressif lissé en partant de la période "period+1"
-        for i in range(period, len(gains)):
-            avg_gain = (avg_gain * (period - 1) + gains.iloc[i]) / period
-            avg_loss = (avg_loss * (period - 1) + losses.iloc[i]) / period
+    def get_signals(self, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Calcul vectorisé des signaux RSI sur l'ensemble du panel de prix, identique au calcul date par date.
 
-        # Éviter la division par zéro
-        if avg_loss == 0:
-            return 100.0  # RSI = 100 => surachat extrême
+        :param data: pd.DataFrame des prix (dates x actifs).
+        :return: pd.DataFrame des positions (NaN = maintien de la position tant que l'historique est insuffisant).
+        """
+        rsi = Indicators.rsi(data, self.period).to_numpy()
+        # Valeur neutre lorsque l'historique ne permet pas de calculer le RSI
+        rsi = np.where(np.isnan(rsi), 50.0, rsi)
 
-        # Calcul du RSI
-        rs = avg_gain / avg_loss
-        rsi_value = 100 - (100 / (1 + rs))
-        return rsi_value
+        signals = np.where(rsi < self.oversold_threshold, 1.0, np.where(rsi > self.overbought_threshold, -1.0, 0.0))
+        signals[:self.period - 1] = np.nan
+        return pd.DataFrame(signals, index=data.index, columns=data.columns)
 
     def fit(self, data):
         """
@@ -1,4 +1,6 @@
 from backtesting_framework.Core.Strategy import Strategy
+from backtesting_framework.Utils import Indicators
+import numpy as np
 import pandas as pd
 
 class VolatilityTrendStrategy(Strategy):
@@ -29,9 +31,9 @@ class VolatilityTrendStrategy(Strategy):
         :param period: Nombre de périodes pour le calcul de l'ATR.
         :return: Valeur de l'ATR calculée.
         """
-        delta = prices[1:] - prices[:-1]
-        delta = pd.Series(delta)
-        atr = delta.abs().rolling(period).mean().iloc[-1]
+        if len(prices) <= period:
+            return np.nan
+        atr = np.abs(np.diff(prices[-(period + 1):])).mean()
         return atr
 
     def calculate_dmi(self,prices,period):
@@ -43,21 +45,22 @@ class VolatilityTrendStrategy(Strategy):
         :param period: Nombre de périodes pour le calcul du DMI.
         :return: Valeur du DMI calculée.
         """
-        delta = prices[1:] - prices[:-1]
-        delta = pd.Series(delta)
-        delta = delta.reset_index(drop=True)
+        if len(prices) <= period:
+            return np.nan
+        delta = np.diff(prices[-(period + 1):])
 
         # Calcul des mouvements directionnels positifs et négatifs
-        pos_dm = delta.where(delta > 0, 0).rolling(period).sum().iloc[-1]
-        neg_dm = -delta.where(delta < 0, 0).rolling(period).sum().iloc[-1]
+        pos_dm = np.where(delta > 0, delta, 0).sum()
+        neg_dm = -np.where(delta < 0, delta, 0).sum()
         atr = self.calculate_atr(prices,period)
 
         # Calcul de l'ATR pour normaliser les mouvements directionnels
-        pos_di = 100 * pos_dm / atr
-        neg_di = 100 * neg_dm / atr
+        with np.errstate(invalid="ignore", divide="ignore"):
+            pos_di = 100 * pos_dm / atr
+            neg_di = 100 * neg_dm / atr
 
-        # Calcul du DMI basé sur les indices directionnels
-        dmi = abs(pos_di - neg_di) / (pos_di + neg_di) * 100
+            # Calcul du DMI basé sur les indices directionnels
+            dmi = abs(pos_di - neg_di) / (pos_di + neg_di) * 100
         return dmi
 
     def get_position(self,historical_data:pd.DataFrame,current_position:float)->float:
@@ -81,6 +84,20 @@ class VolatilityTrendStrategy(Strategy):
         else:
             return 0  # Position neutre
 
+    def get_signals(self, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Calcul vectorisé des signaux sur l'ensemble du panel de prix, à partir des indicateurs partagés.
+
+        :param data: pd.DataFrame des prix (dates x actifs).
+        :return: pd.DataFrame des positions (1 = long, -1 = short, 0 = neutre).
+        """
+        atr = Indicators.atr(data, self.atr_period)
+        dmi = Indicators.dmi(data, self.dmi_period)
+        is_volatile = atr > self.atr_threshold
+
+        signals = np.where(is_volatile & (dmi > 0), 1.0, np.where(is_volatile & (dmi < 0), -1.0, 0.0))
+        return pd.DataFrame(signals, index=data.index, columns=data.columns)
+
     def fit(self, data):
         """
         Méthode optionnelle d'ajustement (fit). Non utilisée pour cette stratégie.
@@ -0,0 +1,144 @@
+"""
+Tests différentiels des chemins rapides du Backtester :
+Une stratégie est exécutée par le calcul vectorisé (get_signals) et par la boucle de référence (get_position
+date par date) sur des panels synthétiques aléatoires comportant des valeurs manquantes, des radiations
+de la cote et des jours fériés, cotés au centime comme les panels réels (les égalités de prix et d'indicateurs
+avec les seuils des stratégies y sont alors fréquentes). Les matrices de composition, les rendements et les nombres de trades
+des deux chemins sont comparés, et le gain de temps du chemin rapide est mesuré.
+"""
+import time
+
+import numpy as np
+import pandas as pd
+
+from backtesting_framework.Core.Backtester import Backtester
+from backtesting_framework.Utils import Indicators
+from backtesting_framework.Utils.MarketSimulator import MarketSimulator
+
+
+def perturb_panel(prices: pd.DataFrame, rng: np.random.Generator, nan_rate: float = 0.01,
+                  delisting_rate: float = 0.1, holiday_rate: float = 0.01, decimals: int = None) -> pd.DataFrame:
+    """
+    Dégrade un panel de prix comme un panel réel : valeurs manquantes isolées, actifs radiés (plus aucun prix
+    après une date tirée dans la seconde moitié du panel), jours fériés (dates retirées du panel) et,
+    si decimals est renseigné, prix arrondis au pas de cotation.
+
+    :param prices: DataFrame des prix (dates x actifs).
+    :param rng: Générateur aléatoire.
+    :param nan_rate: Proportion de prix manquants (par défaut : 0.01).
+    :param delisting_rate: Proportion d'actifs radiés (par défaut : 0.1).
+    :param holiday_rate: Proportion de dates retirées (par défaut : 0.01).
+    :param decimals: Nombre de décimales des prix (par défaut : None, prix non arrondis).
+    :return: Nouveau DataFrame des prix.
+    """
+    values = prices.to_numpy(dtype="float64", copy=True)
+    if decimals is not None:
+        values = np.round(values, decimals)
+    n_days, n_assets = values.shape
+    values[rng.random(values.shape) < nan_rate] = np.nan
+
+    delisted = np.flatnonzero(rng.random(n_assets) < delisting_rate)
+    for asset, last_day in zip(delisted, rng.integers(n_days // 2, n_days, size=len(delisted))):
+        values[last_day:, asset] = np.nan
+
+    # La première date est conservée pour que le panel garde son point de départ
+    kept = rng.random(n_days) >= holiday_rate
+    kept[0] = True
+    return pd.DataFrame(values[kept], index=prices.index[kept], columns=prices.columns)
+
+
+def run_path(backtester, strategy, vectorized: bool) -> dict:
+    """
+    Exécute un chemin du Backtester (composition, pondérations, rendements et trades) sans cache d'indicateurs.
+
+    :param backtester: Instance de Backtester.
+    :param strategy: Instance de Strategy (non partagée entre les deux chemins).
+    :param vectorized: True pour le chemin vectorisé (get_signals), False pour la boucle get_position.
+    :return: Dictionnaire (composition, portfolio_returns, trade_stats, seconds).
+    """
+    Indicators.clear_cache()
+    start = time.perf_counter()
+    composition = backtester.calculate_composition_matrix(strategy, vectorized=vectorized)
+    seconds = time.perf_counter() - start
+    backtester.weight_matrix = backtester.calculate_weight_matrix(composition)
+    _, portfolio_returns, _, _, trade_stats = backtester.calculate_returns()
+    return {"composition": composition.astype("float64"), "portfolio_returns": portfolio_returns.astype("float64"),
+            "trade_stats": trade_stats, "seconds": seconds}
+
+
+def compare_paths(strategy_factory, prices: pd.DataFrame, atol: float = 1e-10, **backtester_kwargs) -> dict:
+    """
+    Compare le chemin vectorisé et la boucle de référence d'une stratégie sur un panel.
+
+    :param strategy_factory: Fonction du panel de prix retournant une stratégie neuve (ajustée si nécessaire).
+    :param prices: DataFrame des prix (dates x actifs).
+    :param atol: Tolérance absolue sur la composition et les rendements (par défaut : 1e-10).
+    :param backtester_kwargs: Paramètres transmis au Backtester.
+    :return: Dictionnaire des écarts (composition_error, returns_error), des nombres de trades, du résultat
+             de la comparaison (match) et du gain de temps de la composition (speedup = référence / rapide).
+    """
+    backtester = Backtester(data_source=prices, verbose=False, **backtester_kwargs)
+    fast = run_path(backtester, strategy_factory(prices), vectorized=True)
+    reference = run_path(backtester, strategy_factory(prices), vectorized=False)
+
+    composition_error = np.nanmax(np.abs(fast["composition"].to_numpy() - reference["composition"].to_numpy()),
+                                  initial=0.0)
+    same_missing = (fast["composition"].isna() == reference["composition"].isna()).all().all()
+    returns_error = np.nanmax(np.abs(fast["portfolio_returns"].to_numpy()
+                                     - reference["portfolio_returns"].to_numpy()), initial=0.0)
+    return {
+        "composition_error": composition_error,
+        "returns_error": returns_error,
+        "trades_fast": fast["trade_stats"][0],
+        "trades_reference": reference["trade_stats"][0],
+        "match": bool(same_missing and composition_error <= atol and returns_error <= atol
+                      and fast["trade_stats"] == reference["trade_stats"]),
+        "seconds_fast": fast["seconds"],
+        "seconds_reference": reference["seconds"],
+        "speedup": reference["seconds"] / fast["seconds"] if fast["seconds"] > 0 else np.inf,
+    }
+
+
+def run_differential(strategies: dict, n_trials: int = 5, n_assets: int = 20, n_days: int = 500, seed: int = 0,
+                     nan_rate: float = 0.01, delisting_rate: float = 0.1, holiday_rate: float = 0.01,
+                     decimals: int = 2, atol: float = 1e-10, **backtester_kwargs) -> pd.DataFrame:
+    """
+    Compare les deux chemins de chaque stratégie sur n_trials panels synthétiques dégradés (perturb_panel).
+
+    :param strategies: Dictionnaire {nom: fonction du panel de prix retournant une stratégie neuve}
+                       (les stratégies factorielles peuvent ainsi être ajustées sur le panel).
+    :param n_trials: Nombre de panels aléatoires (par défaut : 5).
+    :param n_assets: Nombre d'actifs des panels (par défaut : 20).
+    :param n_days: Nombre de dates des panels avant retrait des jours fériés (par défaut : 500).
+    :param seed: Graine des panels (par défaut : 0).
+    :param nan_rate: Proportion de prix manquants (par défaut : 0.01).
+    :param delisting_rate: Proportion d'actifs radiés (par défaut : 0.1).
+    :param holiday_rate: Proportion de dates retirées (par défaut : 0.01).
+    :param decimals: Nombre de décimales des prix (par défaut : 2, cotation au centime ; None pour des prix
+                     non arrondis).
+    :param atol: Tolérance absolue sur la composition et les rendements (par défaut : 1e-10).
+    :param backtester_kwargs: Paramètres transmis au Backtester.
+    :return: DataFrame d'une ligne par (stratégie, panel) : écarts, nombres de trades, match et speedup.
+    """
+    rows = []
+    for trial in range(n_trials):
+        rng = np.random.default_rng([seed, trial])
+        prices = MarketSimulator(n_assets, n_days, seed=int(rng.integers(2 ** 31))).prices()
+        prices = perturb_panel(prices, rng, nan_rate, delisting_rate, holiday_rate, decimals)
+        for name, strategy_factory in strategies.items():
+            comparison = compare_paths(strategy_factory, prices, atol, **backtester_kwargs)
+            rows.append({"strategy": name, "trial": trial, **comparison})
+    return pd.DataFrame(rows)
+
+
+def assert_equivalent(report: pd.DataFrame):
+    """
+    Vérifie que les deux chemins concordent sur tous les panels d'un rapport de run_differential.
+
+    :param report: DataFrame retourné par run_differential.
+    :raises AssertionError: Si au moins une comparaison échoue (les comparaisons en échec sont listées).
+    """
+    failures = report.loc[~report["match"]]
+    if not failures.empty:
+        raise AssertionError("Les chemins vectorisé et de référence divergent :\n"
+                             + failures.drop(columns=["seconds_fast", "seconds_reference"]).to_string(index=False))
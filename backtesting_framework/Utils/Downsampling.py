@@ -0,0 +1,114 @@
+"""
+Sous-échantillonnage de séries temporelles avant affichage :
+Les graphiques d'une série de plusieurs millions de points (barres minute, comparaison de dizaines de stratégies)
+n'ont qu'une largeur de quelques milliers de pixels. Les séries sont réduites à un budget de points en conservant
+leur forme visuelle :
+- LTTB (Largest-Triangle-Three-Buckets) : dans chaque intervalle, le point formant le plus grand triangle
+  avec le point retenu dans l'intervalle précédent et la moyenne de l'intervalle suivant ;
+- min/max : le minimum et le maximum de chaque intervalle (pics et creux exacts).
+Le premier et le dernier point sont toujours conservés ; les valeurs manquantes sont ignorées.
+"""
+import numpy as np
+import pandas as pd
+
+
+def _positions(index: pd.Index) -> np.ndarray:
+    """
+    Abscisses numériques d'un index (nanosecondes pour les dates, positions sinon).
+
+    :param index: Index de la série.
+    :return: Tableau des abscisses.
+    """
+    if isinstance(index, pd.DatetimeIndex):
+        return index.asi8.astype("float64")
+    if pd.api.types.is_numeric_dtype(index):
+        return index.to_numpy(dtype="float64")
+    return np.arange(len(index), dtype="float64")
+
+
+def lttb(series: pd.Series, max_points: int) -> pd.Series:
+    """
+    Sous-échantillonnage LTTB (Largest-Triangle-Three-Buckets).
+
+    :param series: Série à réduire.
+    :param max_points: Nombre maximal de points retenus (au moins 3).
+    :return: Sous-série de max_points points au plus, dans l'ordre de l'index.
+    :raises ValueError: Si max_points est inférieur à 3.
+    """
+    if max_points < 3:
+        raise ValueError("max_points doit être au moins égal à 3.")
+    series = series.dropna()
+    n = len(series)
+    if n <= max_points:
+        return series
+
+    x, y = _positions(series.index), series.to_numpy(dtype="float64")
+    # Intervalles des points intermédiaires (le premier et le dernier point sont conservés)
+    edges = np.linspace(1, n - 1, max_points - 1).astype(np.int64)
+    selected = np.empty(max_points, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+
+    previous = 0
+    for bucket in range(max_points - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        # Moyenne de l'intervalle suivant (le dernier point pour le dernier intervalle)
+        next_start, next_end = end, edges[bucket + 2] if bucket + 2 < len(edges) else n
+        mean_x, mean_y = x[next_start:next_end].mean(), y[next_start:next_end].mean()
+
+        areas = np.abs((x[previous] - mean_x) * (y[start:end] - y[previous])
+                       - (x[previous] - x[start:end]) * (mean_y - y[previous]))
+        previous = start + int(np.argmax(areas))
+        selected[bucket + 1] = previous
+    return series.iloc[selected]
+
+
+def min_max(series: pd.Series, max_points: int) -> pd.Series:
+    """
+    Sous-échantillonnage min/max : minimum et maximum de chaque intervalle (max_points // 2 intervalles).
+
+    :param series: Série à réduire.
+    :param max_points: Nombre maximal de points retenus (au moins 4).
+    :return: Sous-série de max_points points au plus, dans l'ordre de l'index.
+    :raises ValueError: Si max_points est inférieur à 4.
+    """
+    if max_points < 4:
+        raise ValueError("max_points doit être au moins égal à 4.")
+    series = series.dropna()
+    n = len(series)
+    if n <= max_points:
+        return series
+
+    y = series.to_numpy(dtype="float64")
+    # Le premier et le dernier point occupent deux places du budget
+    n_buckets = (max_points - 2) // 2
+    buckets = np.arange(n - 2) * n_buckets // (n - 2)
+    # Tri par intervalle puis par valeur : le premier point de chaque intervalle est le minimum, le dernier le maximum
+    order = np.lexsort((y[1:-1], buckets)) + 1
+    bounds = np.searchsorted(buckets, np.arange(n_buckets))
+    minima = order[bounds]
+    maxima = order[np.append(bounds[1:], n - 2) - 1]
+    selected = np.unique(np.concatenate([[0, n - 1], minima, maxima]))
+    return series.iloc[selected]
+
+
+DOWNSAMPLING_METHODS = {
+    "lttb": lttb,
+    "minmax": min_max,
+}
+
+
+def downsample(series: pd.Series, max_points: int = None, method: str = "lttb") -> pd.Series:
+    """
+    Réduit une série à un budget de points pour l'affichage.
+
+    :param series: Série à réduire.
+    :param max_points: Nombre maximal de points (None : série complète, valeurs manquantes comprises).
+    :param method: Méthode de sous-échantillonnage : 'lttb' ou 'minmax' (par défaut : 'lttb').
+    :return: Série réduite.
+    :raises ValueError: Si la méthode n'est pas supportée.
+    """
+    if method not in DOWNSAMPLING_METHODS:
+        raise ValueError(f"Méthode '{method}' non supportée. Méthodes disponibles : {list(DOWNSAMPLING_METHODS)}")
+    if max_points is None or len(series) <= max_points:
+        return series
+    return DOWNSAMPLING_METHODS[method](series, max_points)
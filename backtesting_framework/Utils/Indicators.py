@@ -0,0 +1,327 @@
+"""
+Bibliothèque d'indicateurs techniques vectorisés :
+Chaque indicateur est calculé en une seule passe sur l'ensemble du panel (dates x actifs) avec NumPy,
+et mémorisé par (indicateur, paramètres, empreinte des données). Chaque fenêtre est réduite avec les mêmes
+opérations, dans le même ordre, que le calcul date par date des stratégies (sans somme cumulée courante) :
+les deux chemins donnent des valeurs identiques au bit près, et donc les mêmes signaux en cas d'égalité
+avec un seuil (prix sur une grille de cotation). Les stratégies et les balayages de
+paramètres qui partagent une SMA(20) ou un ATR(14) ne la calculent donc qu'une fois.
+
+Les résultats mémorisés sont partagés et en lecture seule. L'empreinte des données est recalculée à chaque appel
+(coût linéaire, inférieur à celui d'un indicateur) : un panel modifié en place n'obtient jamais un résultat périmé.
+"""
+import functools
+import inspect
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from backtesting_framework.Utils.Tools import data_fingerprint
+
+# Nombre maximal de résultats conservés dans le cache (éviction LRU)
+CACHE_SIZE = 128
+# Nombre maximal d'éléments des fenêtres glissantes matérialisées à la fois
+WINDOW_CHUNK = 2 ** 22
+
+_cache = OrderedDict()
+
+
+def clear_cache():
+    """
+    Vide le cache des indicateurs.
+    """
+    _cache.clear()
+
+
+def _memoize(func):
+    """
+    Décorateur mémorisant le résultat d'un indicateur par (nom, paramètres, empreinte des données).
+    """
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(data, *args, **kwargs):
+        bound = signature.bind(data, *args, **kwargs)
+        bound.apply_defaults()
+        params = tuple(list(bound.arguments.items())[1:])
+        key = (func.__name__, params, data_fingerprint(data))
+
+        if key in _cache:
+            _cache.move_to_end(key)
+            return _cache[key]
+
+        result = func(data, *args, **kwargs)
+        _cache[key] = result
+        if len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+        return result
+
+    return wrapper
+
+
+def _to_array(data):
+    """
+    Convertit un panel pandas en tableau NumPy 2D de flottants.
+
+    :param data: DataFrame ou Series pandas.
+    :return: np.ndarray (dates x actifs).
+    """
+    values = data.to_numpy(dtype="float64")
+    return values.reshape(len(data), -1)
+
+
+def _to_pandas(values, data):
+    """
+    Reconstruit un objet pandas de même forme que data à partir d'un tableau NumPy, en lecture seule.
+
+    :param values: np.ndarray (dates x actifs).
+    :param data: DataFrame ou Series pandas d'origine.
+    :return: DataFrame ou Series pandas.
+    """
+    values.flags.writeable = False
+    if isinstance(data, pd.Series):
+        return pd.Series(values[:, 0], index=data.index, name=data.name)
+    return pd.DataFrame(values, index=data.index, columns=data.columns)
+
+
+def _rolling_apply(values, window, reducer):
+    """
+    Applique une réduction à chaque fenêtre glissante complète de window dates, par blocs de dates pour borner
+    la mémoire des tableaux intermédiaires. Les fenêtres sont des vues (sans somme cumulée courante) : chacune est
+    réduite comme le tableau 1D prices[-window:] d'un calcul date par date, avec le même ordre de sommation.
+
+    :param values: np.ndarray (dates x actifs).
+    :param window: Taille de la fenêtre.
+    :param reducer: Fonction d'un tableau (fenêtres x actifs x window) réduisant le dernier axe.
+    :return: np.ndarray (dates x actifs), NaN tant que la fenêtre n'est pas complète.
+    """
+    result = np.full(values.shape, np.nan)
+    if window > len(values):
+        return result
+
+    windows = sliding_window_view(values, window, axis=0)
+    step = max(1, WINDOW_CHUNK // (window * max(values.shape[1], 1)))
+    for start in range(0, len(windows), step):
+        result[window - 1 + start:window - 1 + start + step] = reducer(windows[start:start + step])
+    return result
+
+
+def _rolling_sum(values, window):
+    """
+    Somme glissante. La somme vaut NaN tant que la fenêtre n'est pas complète ou si elle contient
+    une valeur manquante.
+
+    :param values: np.ndarray (dates x actifs).
+    :param window: Taille de la fenêtre.
+    :return: np.ndarray (dates x actifs).
+    """
+    return _rolling_apply(values, window, lambda windows: windows.sum(axis=-1))
+
+
+def _rolling_mean(values, window):
+    """
+    Moyenne glissante (NaN tant que la fenêtre n'est pas complète ou contient une valeur manquante).
+
+    :param values: np.ndarray (dates x actifs).
+    :param window: Taille de la fenêtre.
+    :return: np.ndarray (dates x actifs).
+    """
+    return _rolling_sum(values, window) / window
+
+
+def _rolling_std(values, window, ddof):
+    """
+    Écart-type glissant, calculé comme np.std sur chaque fenêtre (écarts à la moyenne de la fenêtre).
+
+    :param values: np.ndarray (dates x actifs).
+    :param window: Taille de la fenêtre.
+    :param ddof: Degrés de liberté retirés au dénominateur.
+    :return: np.ndarray (dates x actifs).
+    """
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return _rolling_apply(values, window, lambda windows: np.std(windows, axis=-1, ddof=ddof))
+
+
+def _diff(values):
+    """
+    Variation d'une date à l'autre (NaN sur la première date).
+
+    :param values: np.ndarray (dates x actifs).
+    :return: np.ndarray (dates x actifs).
+    """
+    delta = np.full(values.shape, np.nan)
+    delta[1:] = values[1:] - values[:-1]
+    return delta
+
+
+@_memoize
+def sma(data, window: int):
+    """
+    Moyenne mobile simple sur window périodes.
+
+    :param data: DataFrame (dates x actifs) ou Series de prix.
+    :param window: Nombre de périodes.
+    :return: Objet pandas de même forme que data.
+    """
+    return _to_pandas(_rolling_mean(_to_array(data), window), data)
+
+
+@_memoize
+def ema(data, window: int):
+    """
+    Moyenne mobile exponentielle calculée sur les window dernières périodes uniquement,
+    initialisée au premier prix de la fenêtre (convention de la stratégie MovingAverage).
+    La récurrence ema = alpha * prix + (1 - alpha) * ema est déroulée sur les positions de la fenêtre,
+    pour toutes les dates et tous les actifs à la fois.
+
+    :param data: DataFrame (dates x actifs) ou Series de prix.
+    :param window: Nombre de périodes.
+    :return: Objet pandas de même forme que data.
+    """
+    values = _to_array(data)
+    result = np.full(values.shape, np.nan)
+    if window <= len(values):
+        alpha = 2 / (window + 1)
+        count = len(values) - window + 1
+        # ema[t] part du premier prix de la fenêtre se terminant en t, puis intègre les prix suivants
+        ema = result[window - 1:]
+        ema[:] = values[:count]
+        for offset in range(1, window):
+            ema *= 1 - alpha
+            ema += alpha * values[offset:offset + count]
+    return _to_pandas(result, data)
+
+
+@_memoize
+def rolling_std(data, window: int, ddof: int = 1):
+    """
+    Écart-type glissant sur window périodes.
+
+    :param data: DataFrame (dates x actifs) ou Series.
+    :param window: Nombre de périodes.
+    :param ddof: Degrés de liberté retirés au dénominateur (1 par défaut, 0 pour l'écart-type de population).
+    :return: Objet pandas de même forme que data.
+    """
+    return _to_pandas(_rolling_std(_to_array(data), window, ddof), data)
+
+
+@_memoize
+def bollinger_bands(data, window: int, num_std_dev: float):
+    """
+    Bandes de Bollinger : moyenne mobile et bandes à +/- num_std_dev écarts-types (de population).
+
+    :param data: DataFrame (dates x actifs) ou Series de prix.
+    :param window: Nombre de périodes.
+    :param num_std_dev: Nombre d'écarts-types.
+    :return: Tuple (moyenne mobile, bande supérieure, bande inférieure).
+    """
+    moving_average = sma(data, window)
+    standard_deviation = rolling_std(data, window, ddof=0)
+    upper_band = moving_average + num_std_dev * standard_deviation
+    lower_band = moving_average - num_std_dev * standard_deviation
+    return moving_average, upper_band, lower_band
+
+
+@_memoize
+def atr(data, period: int):
+    """
+    Average True Range calculé sur les prix de clôture : moyenne des variations absolues
+    sur les period dernières périodes.
+
+    :param data: DataFrame (dates x actifs) ou Series de prix.
+    :param period: Nombre de périodes.
+    :return: Objet pandas de même forme que data.
+    """
+    return _to_pandas(_rolling_mean(np.abs(_diff(_to_array(data))), period), data)
+
+
+@_memoize
+def dmi(data, period: int):
+    """
+    Directional Movement Index : écart relatif entre les mouvements directionnels positifs et négatifs
+    cumulés sur period périodes, normalisés par l'ATR.
+
+    :param data: DataFrame (dates x actifs) ou Series de prix.
+    :param period: Nombre de périodes.
+    :return: Objet pandas de même forme que data.
+    """
+    delta = _diff(_to_array(data))
+    # Les variations manquantes ne comptent ni comme mouvement positif ni comme mouvement négatif
+    pos_dm = _rolling_sum(np.where(delta > 0, delta, 0.0), period)
+    neg_dm = -_rolling_sum(np.where(delta < 0, delta, 0.0), period)
+    average_range = _rolling_mean(np.abs(delta), period)
+    pos_dm[:period], neg_dm[:period] = np.nan, np.nan
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        pos_di = 100 * pos_dm / average_range
+        neg_di = 100 * neg_dm / average_range
+        result = np.abs(pos_di - neg_di) / (pos_di + neg_di) * 100
+    return _to_pandas(result, data)
+
+
+def wilder_rsi(values, period: int):
+    """
+    Noyau NumPy du RSI de Wilder, sans cache, appliqué à chaque colonne d'un tableau de prix.
+
+    Les prix manquants sont prolongés par la dernière valeur connue ; avant la première cotation d'un actif,
+    le prix est considéré constant. Le lissage de Wilder est un filtre récursif du premier ordre
+    avg(t) = (avg(t-1) * (period - 1) + x(t)) / period, amorcé par la moyenne des period premières variations,
+    évalué date par date simultanément pour tous les actifs, avec les opérations du calcul de référence.
+
+    :param values: np.ndarray (dates x actifs) ou (dates,) des prix.
+    :param period: Nombre de périodes du RSI.
+    :return: np.ndarray de même forme que values, NaN tant que moins de period variations sont disponibles
+             ou avant la première cotation de l'actif.
+    """
+    values = np.asarray(values, dtype="float64")
+    prices = values.reshape(len(values), -1)
+    result = np.full(prices.shape, np.nan)
+
+    filled = pd.DataFrame(prices).ffill().bfill().to_numpy()
+    delta = filled[1:] - filled[:-1]
+    gains = np.where(delta > 0, delta, 0.0)
+    losses = np.abs(np.where(delta < 0, delta, 0.0))
+
+    if len(delta) >= period:
+        # Amorçage par la moyenne des period premières variations ; la moyenne glissante pandas (sommation
+        # compensée) est celle du calcul de référence et donne le même arrondi
+        avg_gain = pd.DataFrame(gains[:period]).rolling(period).mean().to_numpy()[-1]
+        avg_loss = pd.DataFrame(losses[:period]).rolling(period).mean().to_numpy()[-1]
+        result[period] = _relative_strength_index(avg_gain, avg_loss)
+
+        for i in range(period, len(delta)):
+            avg_gain = (avg_gain * (period - 1) + gains[i]) / period
+            avg_loss = (avg_loss * (period - 1) + losses[i]) / period
+            result[i + 1] = _relative_strength_index(avg_gain, avg_loss)
+
+    # Aucune valeur avant la première cotation de chaque actif
+    quoted = np.logical_or.accumulate(~np.isnan(prices), axis=0)
+    result[~quoted] = np.nan
+    return result.reshape(values.shape)
+
+
+def _relative_strength_index(avg_gain, avg_loss):
+    """
+    Calcule le RSI à partir des moyennes lissées des hausses et des baisses (100 si aucune baisse).
+
+    :param avg_gain: np.ndarray des hausses moyennes.
+    :param avg_loss: np.ndarray des baisses moyennes.
+    :return: np.ndarray des valeurs du RSI (entre 0 et 100).
+    """
+    with np.errstate(invalid="ignore", divide="ignore"):
+        rs = avg_gain / avg_loss
+        return np.where(avg_loss == 0, 100.0, 100 - (100 / (1 + rs)))
+
+
+@_memoize
+def rsi(data, period: int):
+    """
+    Relative Strength Index de Wilder sur l'ensemble du panel.
+
+    :param data: DataFrame (dates x actifs) ou Series de prix.
+    :param period: Nombre de périodes du RSI.
+    :return: Objet pandas de même forme que data (NaN tant que l'historique est insuffisant).
+    """
+    return _to_pandas(wilder_rsi(_to_array(data), period), data)
@@ -0,0 +1,326 @@
+import os
+
+import numpy as np
+import pandas as pd
+from scipy.signal import lfilter
+
+
+class MarketSimulator:
+    """
+    Générateur de marchés synthétiques reproductibles (graine fixe), de taille paramétrable :
+    Les prix suivent des mouvements browniens géométriques (GBM) dont la tendance et la volatilité annuelles
+    sont tirées uniformément par actif. Trois extensions peuvent être combinées :
+    - corrélation : les chocs partagent un facteur de marché commun (corrélation moyenne entre actifs) ;
+    - changement de régime : une chaîne de Markov alterne un régime calme et un régime de crise
+      (volatilité multipliée et tendance dégradée pour tous les actifs) ;
+    - diffusion avec sauts (Merton) : sauts log-normaux à intensité poissonnienne, dont la tendance est compensée.
+
+    Les capitalisations boursières et les métriques fondamentales (PER, PBR, ROE, ROA) sont cohérentes
+    avec les prix, pour les stratégies Size, Value et Quality.
+
+    Les panels sont générés bloc par bloc (iter_panels) : chaque composante aléatoire a son propre flux,
+    tiré séquentiellement, de sorte que le résultat ne dépend ni de la taille des blocs ni des panels demandés.
+    Un univers de plusieurs milliers d'actifs sur plusieurs décennies peut ainsi être écrit en Parquet
+    ou en tableaux mémoire-mappés (.npy) sans être chargé en mémoire.
+    """
+
+    PERIODS_PER_YEAR = 252
+
+    # Flux aléatoires indépendants de chaque composante
+    PRICE_STREAM = 0
+    MARKET_CAP_STREAM = 1
+    FUNDAMENTAL_STREAM = 2
+    MARKET_FACTOR_STREAM = 3
+    REGIME_STREAM = 4
+    JUMP_STREAM = 5
+    JUMP_SIZE_STREAM = 6
+
+    # Régimes (calme, crise) : probabilité quotidienne de rester dans le régime, multiplicateur de volatilité
+    # et variation de la tendance annuelle
+    REGIME_PERSISTENCE = (0.995, 0.97)
+    REGIME_VOLATILITY = (1.0, 2.5)
+    REGIME_DRIFT = (0.0, -0.30)
+
+    # Paramètres du ROE (AR(1) quotidien) : niveau moyen, dispersion entre actifs, persistance et bruit
+    ROE_LEVEL = (0.12, 0.05)
+    ROE_PERSISTENCE = 0.995
+    ROE_NOISE = 0.002
+
+    def __init__(self, n_assets: int = 100, n_days: int = 2520, seed: int = 0, start_date: str = "2000-01-03",
+                 drift: tuple = (0.0, 0.10), volatility: tuple = (0.15, 0.40), initial_price: float = 100.0,
+                 correlation: float = 0.0, regime_switching: bool = False, jump_intensity: float = 0.0,
+                 jump_mean: float = -0.05, jump_std: float = 0.10):
+        """
+        :param n_assets: Nombre d'actifs (par défaut : 100).
+        :param n_days: Nombre de jours ouvrés (par défaut : 2520, soit 10 ans).
+        :param seed: Graine du générateur aléatoire (par défaut : 0).
+        :param start_date: Première date du panel (par défaut : '2000-01-03').
+        :param drift: Bornes (min, max) de la tendance annuelle des actifs (par défaut : (0.0, 0.10)).
+        :param volatility: Bornes (min, max) de la volatilité annuelle des actifs (par défaut : (0.15, 0.40)).
+        :param initial_price: Prix initial de chaque actif (par défaut : 100.0).
+        :param correlation: Corrélation des chocs entre actifs, via un facteur de marché (entre 0 et 1, par défaut : 0).
+        :param regime_switching: Active l'alternance des régimes calme et de crise (par défaut : False).
+        :param jump_intensity: Nombre moyen de sauts par actif et par an (par défaut : 0, sans saut).
+        :param jump_mean: Moyenne du logarithme de la taille des sauts (par défaut : -0.05).
+        :param jump_std: Écart-type du logarithme de la taille des sauts (par défaut : 0.10).
+        :raises ValueError: Si n_assets ou n_days n'est pas strictement positif, si correlation n'est pas
+                            dans [0, 1] ou si jump_intensity est négatif.
+        """
+        if n_assets <= 0 or n_days <= 0:
+            raise ValueError("n_assets et n_days doivent être strictement positifs.")
+        if not 0 <= correlation <= 1:
+            raise ValueError("correlation doit être comprise entre 0 et 1.")
+        if jump_intensity < 0:
+            raise ValueError("jump_intensity doit être positif.")
+        self.n_assets = n_assets
+        self.n_days = n_days
+        self.seed = seed
+        self.start_date = start_date
+        self.drift = drift
+        self.volatility = volatility
+        self.initial_price = initial_price
+        self.correlation = correlation
+        self.regime_switching = regime_switching
+        self.jump_intensity = jump_intensity
+        self.jump_mean = jump_mean
+        self.jump_std = jump_std
+
+    def rng(self, stream: int) -> np.random.Generator:
+        """
+        Générateur aléatoire d'un flux, déterminé par la graine et le numéro du flux.
+
+        :param stream: Numéro du flux.
+        :return: np.random.Generator.
+        """
+        return np.random.default_rng([self.seed, stream])
+
+    @property
+    def index(self) -> pd.DatetimeIndex:
+        return pd.bdate_range(self.start_date, periods=self.n_days)
+
+    @property
+    def columns(self) -> pd.Index:
+        return pd.Index([f"Asset{i}" for i in range(self.n_assets)])
+
+    def iter_prices(self, chunk_size: int = 252):
+        """
+        Génère les prix bloc par bloc : seul l'état de la fin du bloc précédent (dernier prix, régime)
+        est conservé d'un bloc à l'autre.
+
+        :param chunk_size: Nombre de dates par bloc (par défaut : 252).
+        :return: Générateur de DataFrames (dates x actifs) d'au plus chunk_size dates.
+        """
+        rng = self.rng(self.PRICE_STREAM)
+        drift = rng.uniform(*self.drift, size=self.n_assets)
+        volatility = rng.uniform(*self.volatility, size=self.n_assets)
+        market_rng, regime_rng, jump_rng, jump_size_rng = (
+            self.rng(stream) for stream in
+            (self.MARKET_FACTOR_STREAM, self.REGIME_STREAM, self.JUMP_STREAM, self.JUMP_SIZE_STREAM))
+        dt = 1 / self.PERIODS_PER_YEAR
+        # Compensation de la tendance des sauts : l'espérance du rendement ne dépend pas des sauts
+        jump_compensation = self.jump_intensity * (np.exp(self.jump_mean + self.jump_std ** 2 / 2) - 1)
+        regime_volatility, regime_drift = np.asarray(self.REGIME_VOLATILITY), np.asarray(self.REGIME_DRIFT)
+
+        log_price = np.full(self.n_assets, np.log(self.initial_price))
+        regime = 0
+        index, columns = self.index, self.columns
+        for start in range(0, self.n_days, chunk_size):
+            size = min(chunk_size, self.n_days - start)
+            shocks = rng.standard_normal((size, self.n_assets))
+            if self.correlation > 0:
+                market = market_rng.standard_normal((size, 1))
+                shocks = np.sqrt(self.correlation) * market + np.sqrt(1 - self.correlation) * shocks
+
+            scale, shift = np.ones((size, 1)), np.zeros((size, 1))
+            if self.regime_switching:
+                regimes, regime = self.regime_path(regime_rng, size, regime)
+                scale, shift = regime_volatility[regimes][:, None], regime_drift[regimes][:, None]
+
+            sigma = volatility * scale
+            log_returns = (drift + shift - jump_compensation - sigma ** 2 / 2) * dt + sigma * np.sqrt(dt) * shocks
+            if self.jump_intensity > 0:
+                counts = jump_rng.poisson(self.jump_intensity * dt, size=(size, self.n_assets))
+                normal = jump_size_rng.standard_normal((size, self.n_assets))
+                log_returns += counts * self.jump_mean + np.sqrt(counts) * self.jump_std * normal
+            if start == 0:
+                log_returns[0] = 0.0
+
+            log_prices = log_price + np.cumsum(log_returns, axis=0)
+            log_price = log_prices[-1]
+            yield pd.DataFrame(np.exp(log_prices), index=index[start:start + size], columns=columns)
+
+    def regime_path(self, rng: np.random.Generator, size: int, regime: int) -> tuple:
+        """
+        Trajectoire de la chaîne de Markov des régimes (0 = calme, 1 = crise).
+
+        :param rng: Générateur aléatoire du flux des régimes.
+        :param size: Nombre de dates.
+        :param regime: Régime de la date précédente.
+        :return: Tuple (régime de chaque date, dernier régime).
+        """
+        draws = rng.random(size)
+        regimes = np.empty(size, dtype=np.int64)
+        for day in range(size):
+            if draws[day] > self.REGIME_PERSISTENCE[regime]:
+                regime = 1 - regime
+            regimes[day] = regime
+        return regimes, regime
+
+    def prices(self) -> pd.DataFrame:
+        """
+        Panel des prix simulés.
+
+        :return: DataFrame (dates x actifs).
+        """
+        return pd.concat(self.iter_prices(self.n_days))
+
+    def market_caps(self, prices: pd.DataFrame = None) -> pd.DataFrame:
+        """
+        Capitalisations boursières : nombre d'actions (log-normal, constant) multiplié par le prix.
+
+        :param prices: Panel des prix (par défaut : prices()).
+        :return: DataFrame (dates x actifs).
+        """
+        prices = self.prices() if prices is None else prices
+        return prices * self.shares_outstanding()
+
+    def shares_outstanding(self) -> np.ndarray:
+        """
+        Nombre d'actions de chaque actif.
+
+        :return: Tableau (n_assets).
+        """
+        return self.rng(self.MARKET_CAP_STREAM).lognormal(mean=18.0, sigma=1.0, size=self.n_assets)
+
+    def fundamentals(self, prices: pd.DataFrame = None) -> dict:
+        """
+        Métriques fondamentales cohérentes avec les prix : la rentabilité des fonds propres (ROE) suit un processus
+        autorégressif autour d'un niveau propre à chaque actif, les fonds propres par action croissent
+        avec les bénéfices, et le PER, le PBR et le ROA en sont déduits.
+
+        :param prices: Panel des prix (par défaut : prices()).
+        :return: Dictionnaire {'PER', 'PBR', 'ROE', 'ROA'} de DataFrames (dates x actifs).
+        """
+        prices = self.prices() if prices is None else prices
+        return self.fundamental_chunk(prices, self.fundamental_state())
+
+    def fundamental_state(self) -> dict:
+        """
+        État initial de la génération des métriques fondamentales : paramètres propres à chaque actif
+        (niveau du ROE, PBR initial, levier) et état du processus, reporté d'un bloc de dates à l'autre.
+
+        :return: Dictionnaire de l'état.
+        """
+        rng = self.rng(self.FUNDAMENTAL_STREAM)
+        return {
+            "rng": rng,
+            "level": rng.normal(*self.ROE_LEVEL, size=self.n_assets),
+            "initial_pbr": rng.uniform(1.0, 4.0, size=self.n_assets),
+            "leverage": rng.uniform(1.5, 5.0, size=self.n_assets),
+            # État du filtre AR(1) et logarithme des fonds propres par action à la fin du bloc précédent
+            "filter_state": np.zeros((1, self.n_assets)),
+            "log_book": None,
+        }
+
+    def fundamental_chunk(self, prices: pd.DataFrame, state: dict) -> dict:
+        """
+        Métriques fondamentales d'un bloc de dates, à partir des prix du bloc ; l'état est mis à jour.
+
+        :param prices: DataFrame des prix du bloc (dates x actifs).
+        :param state: État retourné par fundamental_state, mis à jour par les blocs précédents.
+        :return: Dictionnaire {'PER', 'PBR', 'ROE', 'ROA'} de DataFrames.
+        """
+        values = prices.to_numpy(dtype="float64")
+        level = state["level"]
+        shocks = state["rng"].normal(0.0, self.ROE_NOISE, size=values.shape)
+        if state["log_book"] is None:
+            # Première date : ROE au niveau de long terme et PBR initial
+            shocks[0] = 0.0
+            state["log_book"] = np.log(values[0] / state["initial_pbr"]) - level / self.PERIODS_PER_YEAR
+        deviation, state["filter_state"] = lfilter([1.0], [1.0, -self.ROE_PERSISTENCE], shocks, axis=0,
+                                                   zi=state["filter_state"])
+        roe = level + deviation
+
+        # Fonds propres par action : croissance au rythme du ROE
+        log_book = state["log_book"] + np.cumsum(roe / self.PERIODS_PER_YEAR, axis=0)
+        state["log_book"] = log_book[-1]
+        book = np.exp(log_book)
+
+        earnings = roe * book
+        with np.errstate(divide="ignore"):
+            per = np.where(earnings > 0, values / earnings, np.nan)
+        panels = {"PER": per, "PBR": values / book, "ROE": roe, "ROA": roe / state["leverage"]}
+        return {name: pd.DataFrame(panel, index=prices.index, columns=prices.columns)
+                for name, panel in panels.items()}
+
+    def iter_panels(self, chunk_size: int = 252, fundamentals: bool = True):
+        """
+        Génère bloc par bloc les prix, les capitalisations boursières et, si demandé, les métriques fondamentales.
+
+        :param chunk_size: Nombre de dates par bloc (par défaut : 252).
+        :param fundamentals: Si True, ajoute PER, PBR, ROE et ROA (par défaut : True).
+        :return: Générateur de dictionnaires {'PX_LAST', 'MARKET_CAP'[, 'PER', 'PBR', 'ROE', 'ROA']} de DataFrames.
+        """
+        shares = self.shares_outstanding()
+        state = self.fundamental_state() if fundamentals else None
+        for prices in self.iter_prices(chunk_size):
+            panels = {"PX_LAST": prices, "MARKET_CAP": prices * shares}
+            if state is not None:
+                panels.update(self.fundamental_chunk(prices, state))
+            yield panels
+
+    def to_parquet(self, directory: str, chunk_size: int = 252, fundamentals: bool = True) -> dict:
+        """
+        Écrit les panels dans des fichiers Parquet (un fichier par panel, un groupe de lignes par bloc),
+        sans conserver plus d'un bloc en mémoire. Les fichiers sont lisibles par load_data et ChunkedBacktester.
+
+        :param directory: Répertoire de sortie (créé si nécessaire).
+        :param chunk_size: Nombre de dates par bloc (par défaut : 252).
+        :param fundamentals: Si True, écrit aussi PER, PBR, ROE et ROA (par défaut : True).
+        :return: Dictionnaire {nom du panel: chemin du fichier}.
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        os.makedirs(directory, exist_ok=True)
+        paths, writers = {}, {}
+        try:
+            for panels in self.iter_panels(chunk_size, fundamentals):
+                for name, panel in panels.items():
+                    table = pa.Table.from_pandas(panel.rename_axis("date"))
+                    if name not in writers:
+                        paths[name] = os.path.join(directory, f"{name}.parquet")
+                        writers[name] = pq.ParquetWriter(paths[name], table.schema)
+                    writers[name].write_table(table)
+        finally:
+            for writer in writers.values():
+                writer.close()
+        return paths
+
+    def to_memmap(self, directory: str, chunk_size: int = 252, fundamentals: bool = True) -> dict:
+        """
+        Écrit les panels dans des tableaux NumPy mémoire-mappés (.npy), bloc par bloc. Les dates et les noms
+        des actifs sont écrits dans dates.npy et columns.npy (à transmettre à ChunkedBacktester).
+
+        :param directory: Répertoire de sortie (créé si nécessaire).
+        :param chunk_size: Nombre de dates par bloc (par défaut : 252).
+        :param fundamentals: Si True, écrit aussi PER, PBR, ROE et ROA (par défaut : True).
+        :return: Dictionnaire {nom du panel: chemin du fichier}.
+        """
+        os.makedirs(directory, exist_ok=True)
+        np.save(os.path.join(directory, "dates.npy"), self.index.to_numpy(dtype="datetime64[ns]"))
+        np.save(os.path.join(directory, "columns.npy"), self.columns.to_numpy(dtype=str))
+
+        paths, arrays = {}, {}
+        start = 0
+        for panels in self.iter_panels(chunk_size, fundamentals):
+            for name, panel in panels.items():
+                if name not in arrays:
+                    paths[name] = os.path.join(directory, f"{name}.npy")
+                    arrays[name] = np.lib.format.open_memmap(paths[name], mode="w+", dtype="float64",
+                                                             shape=(self.n_days, self.n_assets))
+                arrays[name][start:start + len(panel)] = panel.to_numpy()
+            start += len(panels["PX_LAST"])
+        for array in arrays.values():
+            array.flush()
+        return paths
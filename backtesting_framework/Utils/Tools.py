@@ -1,5 +1,13 @@
+import hashlib
+import inspect
+import os
+import pickle
+import numpy as np
 import pandas as pd
 
+# Valeurs manquantes exportées par Bloomberg, interprétées comme NaN dès la lecture
+NA_VALUES = ["#N/A N/A", "#N/A", "#N/A Field Not Applicable", "#N/A Invalid Security", "#N/A Requesting Data..."]
+
 def load_data(data_source):
     """
     Chargement des données à partir de différentes sources :
@@ -13,8 +21,263 @@ def load_data(data_source):
         return data_source
     elif isinstance(data_source, str):
         if data_source.endswith('.csv'):
-            return pd.read_csv(data_source, index_col=0, parse_dates=True)
+            return pd.read_csv(data_source, index_col=0, parse_dates=True, na_values=NA_VALUES)
         elif data_source.endswith('.parquet'):
             return pd.read_parquet(data_source)
     raise ValueError("Le format de données n'est pas supporté. "
                      "Veuillez fournir un dict, un DataFrame ou un fichier CSV/Parquet.")
+
+def load_panel(data_source, dtype="float64"):
+    """
+    Chargement d'un panel numérique (prix, métriques fondamentales) au type flottant demandé :
+    Les valeurs manquantes Bloomberg sont converties en NaN et les colonnes converties une seule fois.
+    Un DataFrame déjà au bon type est retourné tel quel, sans copie ; sinon un nouveau DataFrame est créé
+    et l'objet d'origine n'est jamais modifié.
+
+    :param data_source: Source des données (fichier CSV/Parquet ou DataFrame pandas).
+    :param dtype: Type flottant du panel ('float64' ou 'float32').
+    :return: DataFrame pandas dont toutes les colonnes sont du type demandé.
+    :raises ValueError: Format de données ou type non supporté.
+    """
+    if np.dtype(dtype) not in (np.dtype("float64"), np.dtype("float32")):
+        raise ValueError("Le type du panel doit être 'float64' ou 'float32'.")
+
+    panel = load_data(data_source)
+    if (panel.dtypes == dtype).all():
+        return panel
+
+    if (panel.dtypes == object).any():
+        panel = panel.replace(NA_VALUES, np.nan)
+    return panel.astype(dtype)
+
+def data_fingerprint(data):
+    """
+    Calcul d'une empreinte du contenu d'un DataFrame ou d'une Series pandas :
+    Deux objets de mêmes valeurs, index et colonnes ont la même empreinte.
+
+    :param data: DataFrame ou Series pandas.
+    :return: Empreinte hexadécimale (str).
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr(data.shape).encode())
+    digest.update(pd.util.hash_pandas_object(data.index).to_numpy().tobytes())
+    if isinstance(data, pd.DataFrame):
+        digest.update(pd.util.hash_pandas_object(data.columns).to_numpy().tobytes())
+        digest.update(repr(data.dtypes.tolist()).encode())
+    else:
+        digest.update(repr((data.name, data.dtype)).encode())
+
+    values = data.to_numpy()
+    if values.dtype == object:
+        digest.update(pd.util.hash_pandas_object(pd.DataFrame(data), index=False).to_numpy().tobytes())
+    else:
+        digest.update(np.ascontiguousarray(values).tobytes())
+    return digest.hexdigest()
+
+def object_fingerprint(obj, exclude=()):
+    """
+    Calcul d'une empreinte d'un objet Python à partir de son contenu :
+    Les DataFrame, Series et tableaux NumPy sont hachés par valeur, les dictionnaires, listes et ensembles
+    élément par élément, et les objets (stratégies, schémas de pondération, modèles de coûts) par leur classe
+    et leurs attributs. Les autres valeurs sont hachées par leur représentation.
+
+    :param obj: Objet Python.
+    :param exclude: Noms d'attributs ou de clés ignorés (par exemple des données dérivées déjà hachées).
+    :return: Empreinte hexadécimale (str).
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    _update_fingerprint(digest, obj, set(exclude), set())
+    return digest.hexdigest()
+
+def parameters_fingerprint(obj, state=None):
+    """
+    Calcul d'une empreinte de la configuration d'un objet : sa classe et les valeurs des paramètres de son
+    constructeur conservés sous le même nom d'attribut. Les attributs d'état modifiés à l'exécution (z-score,
+    nombre d'itérations, ...) sont ignorés : l'empreinte est identique avant et après l'exécution.
+
+    :param obj: Objet Python (stratégie, schéma de pondération, modèle de coûts).
+    :param state: Données ajustées à inclure dans l'empreinte (par exemple la composition calculée par fit).
+    :return: Empreinte hexadécimale (str).
+    """
+    signature = inspect.signature(type(obj).__init__)
+    parameters = {name: getattr(obj, name) for name in signature.parameters
+                  if name != "self" and hasattr(obj, name)}
+    return object_fingerprint((type(obj).__module__, type(obj).__qualname__, parameters, state))
+
+def _update_fingerprint(digest, obj, exclude, seen):
+    if isinstance(obj, (pd.DataFrame, pd.Series)):
+        digest.update(data_fingerprint(obj).encode())
+    elif isinstance(obj, pd.Index):
+        digest.update(pd.util.hash_pandas_object(obj).to_numpy().tobytes())
+    elif isinstance(obj, np.ndarray) and obj.dtype != object:
+        digest.update(repr((obj.shape, obj.dtype.str)).encode())
+        digest.update(np.ascontiguousarray(obj).tobytes())
+    elif isinstance(obj, np.ndarray):
+        _update_fingerprint(digest, obj.tolist(), exclude, seen)
+    elif isinstance(obj, dict):
+        digest.update(b"dict")
+        for key in sorted(obj, key=repr):
+            if key not in exclude:
+                digest.update(repr(key).encode())
+                _update_fingerprint(digest, obj[key], exclude, seen)
+    elif isinstance(obj, (list, tuple)):
+        digest.update(type(obj).__name__.encode())
+        for item in obj:
+            _update_fingerprint(digest, item, exclude, seen)
+    elif isinstance(obj, (set, frozenset)):
+        digest.update(b"set" + repr(sorted(map(repr, obj))).encode())
+    elif hasattr(obj, "__dict__") and not isinstance(obj, type) and not callable(obj):
+        # Les références circulaires ne sont parcourues qu'une fois
+        if id(obj) in seen:
+            return
+        seen.add(id(obj))
+        digest.update(f"{type(obj).__module__}.{type(obj).__qualname__}".encode())
+        _update_fingerprint(digest, vars(obj), exclude, seen)
+    else:
+        digest.update(repr(obj).encode())
+
+def save_pickle(obj, path):
+    """
+    Sauvegarde atomique d'un objet Python avec pickle :
+    L'objet est écrit dans un fichier temporaire puis renommé, de sorte qu'une interruption pendant l'écriture
+    laisse intacte la sauvegarde précédente.
+
+    :param obj: Objet à sauvegarder.
+    :param path: Chemin du fichier de sauvegarde.
+    """
+    temporary_path = f"{path}.tmp"
+    with open(temporary_path, "wb") as file:
+        pickle.dump(obj, file, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temporary_path, path)
+
+def append_pickle(obj, path):
+    """
+    Ajout d'un objet Python à la fin d'un journal pickle (un enregistrement par appel), sans réécrire
+    les enregistrements précédents.
+
+    :param obj: Objet à ajouter.
+    :param path: Chemin du journal.
+    """
+    with open(path, "ab") as file:
+        pickle.dump(obj, file, protocol=pickle.HIGHEST_PROTOCOL)
+        file.flush()
+        os.fsync(file.fileno())
+
+def iter_pickle(path):
+    """
+    Lecture des enregistrements d'un journal écrit avec append_pickle. Un dernier enregistrement tronqué
+    (interruption pendant l'écriture) est ignoré ; il doit être supprimé avec truncate_pickle avant
+    tout nouvel ajout, faute de quoi les enregistrements suivants seraient illisibles.
+
+    :param path: Chemin du journal.
+    :return: Générateur des objets enregistrés, dans l'ordre d'écriture.
+    """
+    if not os.path.exists(path):
+        return
+    with open(path, "rb") as file:
+        while True:
+            try:
+                yield pickle.load(file)
+            except (EOFError, pickle.UnpicklingError):
+                return
+
+def truncate_pickle(path):
+    """
+    Suppression d'un dernier enregistrement tronqué (interruption pendant l'écriture) d'un journal écrit
+    avec append_pickle : le journal est ramené à la fin du dernier enregistrement complet, de sorte que
+    les enregistrements ajoutés ensuite restent lisibles par iter_pickle.
+
+    :param path: Chemin du journal.
+    :return: Nombre d'enregistrements complets du journal (0 s'il n'existe pas).
+    """
+    if not os.path.exists(path):
+        return 0
+    count, end = 0, 0
+    with open(path, "rb") as file:
+        while True:
+            try:
+                pickle.load(file)
+            except (EOFError, pickle.UnpicklingError):
+                break
+            count, end = count + 1, file.tell()
+    if end < os.path.getsize(path):
+        os.truncate(path, end)
+    return count
+
+def load_pickle(path):
+    """
+    Chargement d'un objet Python sauvegardé avec save_pickle.
+
+    :param path: Chemin du fichier de sauvegarde.
+    :return: Objet chargé.
+    """
+    with open(path, "rb") as file:
+        return pickle.load(file)
+
+def to_record_batch(frame, index_name="date"):
+    """
+    Conversion d'un DataFrame ou d'une Series pandas en RecordBatch Arrow :
+    L'index devient la première colonne (index_name) et chaque colonne numérique partage la mémoire
+    de pandas lorsqu'elle est contiguë (cas des colonnes issues d'un calcul), sans copie.
+
+    :param frame: DataFrame ou Series pandas.
+    :param index_name: Nom de la colonne Arrow de l'index (par défaut : 'date').
+    :return: pyarrow.RecordBatch.
+    """
+    import pyarrow as pa
+
+    if isinstance(frame, pd.Series):
+        frame = frame.to_frame(name=frame.name if frame.name is not None else "value")
+    columns = {index_name: frame.index.to_numpy()}
+    for name in frame.columns:
+        values = frame[name].to_numpy()
+        columns[str(name)] = values if values.dtype != object else pa.array(values, from_pandas=True)
+    return pa.record_batch(columns)
+
+def from_record_batch(batch, index_name="date"):
+    """
+    Conversion d'un RecordBatch ou d'une Table Arrow en DataFrame pandas indexé par la colonne index_name :
+    Les colonnes numériques sans valeur nulle sont reprises sans copie.
+
+    :param batch: pyarrow.RecordBatch ou pyarrow.Table.
+    :param index_name: Nom de la colonne Arrow de l'index (par défaut : 'date').
+    :return: DataFrame pandas.
+    """
+    columns = {}
+    for name in batch.schema.names:
+        column = batch.column(name)
+        if hasattr(column, "num_chunks"):
+            # Colonne d'une Table : un seul bloc est repris tel quel, plusieurs blocs sont concaténés
+            column = column.chunk(0) if column.num_chunks == 1 else column.combine_chunks()
+        columns[name] = column.to_numpy(zero_copy_only=False)
+    index = columns.pop(index_name) if index_name in columns else None
+    if index is not None:
+        index = pd.Index(index, name=index_name, copy=False)
+    return pd.DataFrame(columns, index=index, copy=False)
+
+def write_arrow(batch, path):
+    """
+    Écriture d'un RecordBatch ou d'une Table Arrow dans un fichier IPC non compressé,
+    relisible par mappage mémoire sans copie. Le fichier est écrit à côté puis renommé : un fichier existant,
+    éventuellement mappé par les tampons de batch, n'est jamais tronqué.
+
+    :param batch: pyarrow.RecordBatch ou pyarrow.Table.
+    :param path: Chemin du fichier.
+    """
+    import pyarrow as pa
+
+    temporary_path = f"{path}.tmp"
+    with pa.OSFile(temporary_path, "wb") as sink, pa.ipc.new_file(sink, batch.schema) as writer:
+        writer.write(batch)
+    os.replace(temporary_path, path)
+
+def read_arrow(path):
+    """
+    Lecture d'un fichier IPC Arrow par mappage mémoire : les tampons de la table pointent sur le fichier.
+
+    :param path: Chemin du fichier.
+    :return: pyarrow.Table.
+    """
+    import pyarrow as pa
+
+    return pa.ipc.open_file(pa.memory_map(str(path))).read_all()
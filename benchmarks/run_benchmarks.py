@@ -0,0 +1,301 @@
+"""
+Suite de benchmarks du framework sur des marchés synthétiques (MarketSimulator) de taille paramétrable :
+Chaque échelle N actifs x T jours x fréquence de rebalancement mesure le calcul de la composition de chaque
+stratégie de Strategies/, chaque schéma de pondération, calculate_returns, evaluate_trade, les métriques
+du Result, la construction du Calendar et load_data (CSV et Parquet).
+
+Le temps de démarrage (import du Backtester, puis import et petit backtest) est mesuré dans un interpréteur neuf
+et peut être borné (--startup-budget) : le script échoue si le budget est dépassé.
+
+Les résultats sont écrits en JSON et peuvent être comparés à une exécution de référence :
+
+    python benchmarks/run_benchmarks.py --scale 50x1260xmonthly --scale 500x5040xweekly --output bench.json
+    python benchmarks/run_benchmarks.py --scale 50x1260xmonthly --baseline bench.json --threshold 0.2
+    python benchmarks/run_benchmarks.py --only startup --startup-budget 2.0
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from backtesting_framework.Core.Backtester import Backtester  # noqa: E402
+from backtesting_framework.Core.Calendar import Calendar  # noqa: E402
+from backtesting_framework.Core.Result import Result  # noqa: E402
+from backtesting_framework.Core.WeightScheme import WEIGHT_SCHEMES  # noqa: E402
+from backtesting_framework.Strategies.BollingerBands import BollingerBands  # noqa: E402
+from backtesting_framework.Strategies.BuyAndHold import BuyAndHold  # noqa: E402
+from backtesting_framework.Strategies.KeltnerChannelStrategy import KeltnerChannelStrategy  # noqa: E402
+from backtesting_framework.Strategies.MeanReversion import MeanReversion  # noqa: E402
+from backtesting_framework.Strategies.MinVariance import MinVariance  # noqa: E402
+from backtesting_framework.Strategies.MovingAverage import MovingAverage  # noqa: E402
+from backtesting_framework.Strategies.PairsTrading import PairsTradingStrategy  # noqa: E402
+from backtesting_framework.Strategies.Quality import Quality  # noqa: E402
+from backtesting_framework.Strategies.RSI import RSI  # noqa: E402
+from backtesting_framework.Strategies.Size import Size  # noqa: E402
+from backtesting_framework.Strategies.Value import Value  # noqa: E402
+from backtesting_framework.Strategies.Volatility_Trend import VolatilityTrendStrategy  # noqa: E402
+from backtesting_framework.Utils import Indicators  # noqa: E402
+from backtesting_framework.Utils.MarketSimulator import MarketSimulator  # noqa: E402
+from backtesting_framework.Utils.Tools import load_data  # noqa: E402
+
+# Les tests de cointégration de PairsTrading sont quadratiques en nombre d'actifs : univers restreint
+PAIRS_MAX_ASSETS = 20
+
+# Scripts exécutés dans un interpréteur neuf pour mesurer le temps de démarrage
+STARTUP_SCRIPTS = {
+    "import": "from backtesting_framework.Core.Backtester import Backtester",
+    "import_and_run": (
+        "import numpy as np, pandas as pd\n"
+        "from backtesting_framework.Core.Backtester import Backtester\n"
+        "from backtesting_framework.Strategies.MovingAverage import MovingAverage\n"
+        "prices = pd.DataFrame(100 * np.cumprod(1 + np.random.default_rng(0).normal(0, 0.01, (250, 5)), axis=0),\n"
+        "                      index=pd.bdate_range('2020-01-01', periods=250), columns=list('ABCDE'))\n"
+        "Backtester(data_source=prices, verbose=False).run(MovingAverage(short_window=5, long_window=20))\n"
+    ),
+}
+
+
+def parse_scale(text: str) -> dict:
+    """
+    Lit une échelle au format NxTxfréquence (par exemple '100x2520xmonthly').
+
+    :param text: Échelle.
+    :return: Dictionnaire (n_assets, n_days, frequency).
+    :raises argparse.ArgumentTypeError: Si le format est invalide.
+    """
+    try:
+        n_assets, n_days, frequency = text.split("x")
+        return {"n_assets": int(n_assets), "n_days": int(n_days), "frequency": frequency}
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Échelle invalide : {text} (format attendu : NxTxfréquence).")
+
+
+def strategies(prices, simulator):
+    """
+    Stratégies de Strategies/ avec des paramètres usuels ; les stratégies factorielles sont ajustées (fit)
+    sur les capitalisations et les fondamentaux simulés.
+
+    :param prices: Panel des prix simulés.
+    :param simulator: Instance de MarketSimulator.
+    :return: Dictionnaire {nom: fonction construisant la stratégie}.
+    """
+    def factor(strategy_class, data):
+        def build():
+            strategy = strategy_class(window=30, assets_picked_long=5, assets_picked_short=5)
+            strategy.fit(data)
+            return strategy
+        return build
+
+    fundamentals = simulator.fundamentals(prices)
+
+    return {
+        "BollingerBands": lambda: BollingerBands(window=20, num_std_dev=2),
+        "BuyAndHold": BuyAndHold,
+        "KeltnerChannelStrategy": KeltnerChannelStrategy,
+        "MeanReversion": lambda: MeanReversion(window=20, zscore_threshold=1),
+        "MinVariance": MinVariance,
+        "MovingAverage": lambda: MovingAverage(short_window=20, long_window=50),
+        "PairsTrading": lambda: PairsTradingStrategy(data=prices.iloc[:, :PAIRS_MAX_ASSETS]),
+        "RSI": lambda: RSI(14, 30, 70),
+        "VolatilityTrendStrategy": VolatilityTrendStrategy,
+        "Size": factor(Size, simulator.market_caps(prices)),
+        "Value": factor(Value, {"PER": fundamentals["PER"], "PBR": fundamentals["PBR"]}),
+        "Quality": factor(Quality, {"ROE": fundamentals["ROE"], "ROA": fundamentals["ROA"]}),
+    }
+
+
+def measure(function, repeat: int) -> dict:
+    """
+    Mesure une fonction : le cache des indicateurs est vidé avant chaque exécution.
+
+    :param function: Fonction sans argument.
+    :param repeat: Nombre d'exécutions.
+    :return: Dictionnaire (median, min, repeat) des durées en secondes.
+    """
+    durations = []
+    for _ in range(repeat):
+        Indicators.clear_cache()
+        start = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - start)
+    return {"median": float(np.median(durations)), "min": float(np.min(durations)), "repeat": repeat}
+
+
+def measure_startup(repeat: int) -> dict:
+    """
+    Mesure le temps de démarrage : chaque script de STARTUP_SCRIPTS est exécuté dans un interpréteur neuf.
+
+    :param repeat: Nombre d'exécutions de chaque script.
+    :return: Dictionnaire {nom du script: mesures}.
+    """
+    environment = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [ROOT, os.environ.get("PYTHONPATH")]))}
+    results = {}
+    for name, script in STARTUP_SCRIPTS.items():
+        def run(script=script):
+            subprocess.run([sys.executable, "-c", script], check=True, cwd=ROOT, env=environment)
+        results[name] = measure(run, repeat)
+        print(f"  startup.{name:<37} {results[name]['median'] * 1000:10.2f} ms", flush=True)
+    return results
+
+
+def run_scale(scale: dict, repeat: int, seed: int, only=None) -> dict:
+    """
+    Exécute les benchmarks d'une échelle.
+
+    :param scale: Dictionnaire (n_assets, n_days, frequency).
+    :param repeat: Nombre d'exécutions de chaque benchmark.
+    :param seed: Graine du marché synthétique.
+    :param only: Préfixes des benchmarks à exécuter (optionnel).
+    :return: Dictionnaire {nom du benchmark: mesures}.
+    """
+    simulator = MarketSimulator(scale["n_assets"], scale["n_days"], seed=seed)
+    prices = simulator.prices()
+    market_caps = simulator.market_caps(prices)
+    results = {}
+
+    def bench(name, function):
+        if only and not any(name.startswith(prefix) for prefix in only):
+            return
+        results[name] = measure(function, repeat)
+        print(f"  {name:<45} {results[name]['median'] * 1000:10.2f} ms", flush=True)
+
+    def backtester(data=prices, **kwargs):
+        return Backtester(data_source=data, rebalancing_frequency=scale["frequency"], verbose=False, **kwargs)
+
+    # Composition de chaque stratégie (fit inclus pour les stratégies factorielles)
+    for name, build in strategies(prices, simulator).items():
+        data = prices.iloc[:, :PAIRS_MAX_ASSETS] if name == "PairsTrading" else prices
+        engine = backtester(data)
+        bench(f"strategy.{name}", lambda build=build, engine=engine: engine.calculate_composition_matrix(build()))
+
+    # Schémas de pondération, sur la composition d'une moyenne mobile
+    engine = backtester(market_cap_source=market_caps, weight_scheme="MarketCapWeight")
+    composition = engine.calculate_composition_matrix(MovingAverage(short_window=20, long_window=50))
+    for name, scheme in WEIGHT_SCHEMES.items():
+        bench(f"weights.{name}", lambda scheme=scheme: scheme().compute_weights(composition, engine))
+
+    # Rendements, trades et métriques
+    engine.weight_matrix = engine.calculate_weight_matrix(composition)
+    returns = engine.calculate_returns()
+    shifted_weights = engine.weight_matrix.shift(1).fillna(0)
+    bench("calculate_returns", engine.calculate_returns)
+    bench("evaluate_trade", lambda: engine.evaluate_trade(shifted_weights, {}))
+    bench("result_metrics", lambda: Result(returns[1], returns[3]))
+
+    # Calendrier et chargement des données
+    start_date, end_date = prices.index[0].strftime("%Y-%m-%d"), prices.index[-1].strftime("%Y-%m-%d")
+    bench("calendar", lambda: Calendar(scale["frequency"], start_date, end_date))
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path, parquet_path = os.path.join(directory, "prices.csv"), os.path.join(directory, "prices.parquet")
+        prices.to_csv(csv_path)
+        prices.to_parquet(parquet_path)
+        bench("load_data.csv", lambda: load_data(csv_path))
+        bench("load_data.parquet", lambda: load_data(parquet_path))
+    return results
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    """
+    Compare des résultats à une exécution de référence.
+
+    :param results: Résultats de run_benchmarks.
+    :param baseline: Résultats de référence.
+    :param threshold: Variation relative de la durée médiane au-delà de laquelle un écart est signalé.
+    :return: Liste de tuples (échelle, benchmark, durée de référence, durée, ratio) des écarts, ralentissements
+             puis accélérations.
+    """
+    changes = []
+    sections = {**results["scales"], "startup": results.get("startup", {})}
+    references = {**baseline.get("scales", {}), "startup": baseline.get("startup", {})}
+    for scale, benchmarks in sections.items():
+        reference = references.get(scale, {})
+        for name, timing in benchmarks.items():
+            if name in reference and reference[name]["median"] > 0:
+                ratio = timing["median"] / reference[name]["median"]
+                if abs(ratio - 1) > threshold:
+                    changes.append((scale, name, reference[name]["median"], timing["median"], ratio))
+    return sorted(changes, key=lambda change: -change[4])
+
+
+def run_benchmarks(scales: list, repeat: int = 3, seed: int = 0, only=None) -> dict:
+    """
+    Exécute les benchmarks pour chaque échelle.
+
+    :param scales: Liste d'échelles (voir parse_scale).
+    :param repeat: Nombre d'exécutions de chaque benchmark (par défaut : 3).
+    :param seed: Graine du marché synthétique (par défaut : 0).
+    :param only: Préfixes des benchmarks à exécuter (optionnel).
+    :return: Dictionnaire (metadata, startup, scales) sérialisable en JSON.
+    """
+    results = {
+        "metadata": {"date": datetime.now().isoformat(timespec="seconds"), "python": platform.python_version(),
+                     "platform": platform.platform(), "numpy": np.__version__, "repeat": repeat, "seed": seed},
+        "startup": {},
+        "scales": {},
+    }
+    if not only or any("startup".startswith(prefix) or prefix.startswith("startup") for prefix in only):
+        print("Démarrage")
+        results["startup"] = measure_startup(repeat)
+    for scale in scales:
+        if only and all(prefix.startswith("startup") for prefix in only):
+            break
+        label = f"{scale['n_assets']}x{scale['n_days']}x{scale['frequency']}"
+        print(f"Échelle {label}")
+        results["scales"][label] = run_scale(scale, repeat, seed, only)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks du framework de backtesting.")
+    parser.add_argument("--scale", type=parse_scale, action="append",
+                        help="Échelle NxTxfréquence (répétable, par défaut : 50x1260xmonthly).")
+    parser.add_argument("--repeat", type=int, default=3, help="Nombre d'exécutions de chaque benchmark.")
+    parser.add_argument("--seed", type=int, default=0, help="Graine du marché synthétique.")
+    parser.add_argument("--only", action="append", help="Préfixe des benchmarks à exécuter (répétable).")
+    parser.add_argument("--output", default="benchmark_results.json", help="Fichier JSON des résultats.")
+    parser.add_argument("--baseline", help="Fichier JSON de référence à comparer.")
+    parser.add_argument("--threshold", type=float, default=0.1,
+                        help="Variation relative signalée lors de la comparaison (par défaut : 0.1).")
+    parser.add_argument("--startup-budget", type=float,
+                        help="Durée médiane maximale (en secondes) de l'import suivi d'un petit backtest.")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.scale or [parse_scale("50x1260xmonthly")], args.repeat, args.seed, args.only)
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump(results, file, indent=2)
+    print(f"Résultats écrits dans {args.output}.")
+
+    status = 0
+    startup = results["startup"].get("import_and_run")
+    if args.startup_budget is not None and startup is not None:
+        exceeded = startup["median"] > args.startup_budget
+        print(f"\nDémarrage : {startup['median']:.2f} s (budget : {args.startup_budget:.2f} s)"
+              + (" : budget dépassé." if exceeded else "."))
+        status = 1 if exceeded else 0
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)
+        changes = compare(results, baseline, args.threshold)
+        print(f"\nComparaison avec {args.baseline} (seuil : {args.threshold:.0%})")
+        for scale, name, reference, median, ratio in changes:
+            print(f"  {scale:<20} {name:<45} {reference * 1000:10.2f} ms -> {median * 1000:10.2f} ms  x{ratio:.2f}")
+        if not changes:
+            print("  Aucun écart significatif.")
+        if any(change[4] > 1 for change in changes):
+            status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,13 @@
+import pickle
 import pytest
+import numpy as np
 import pandas as pd
 from backtesting_framework.Core.Backtester import Backtester
+from backtesting_framework.Core.SparseWeights import SparseWeights
 from backtesting_framework.Core.Strategy import Strategy
+from backtesting_framework.Strategies.MeanReversion import MeanReversion
+from backtesting_framework.Strategies.MovingAverage import MovingAverage
+from backtesting_framework.Utils.Tools import iter_pickle, load_pickle
 
 def test_backtester_empty_dataframe():
     # Teste que le Backtester lève une erreur avec un DataFrame vide.
@@ -137,3 +143,253 @@ def test_calculate_weight_matrix():
     valid_weights = non_nan_weights[non_nan_weights.sum(axis=1) > 0]
     assert not valid_weights.isnull().values.any()
     assert (valid_weights.sum(axis=1).round(6) == 1).all()
+
+class AlternatingStrategy(Strategy):
+    def get_position(self, historical_data, current_position):
+        # Alterne entre position longue et position courte pour générer de la rotation.
+        return 1 if len(historical_data) % 2 else -1
+
+def test_reprice_costs():
+    # Vérifie que la grille de coûts reproduit les rendements d'un run complet pour chaque couple de coûts.
+    sample_data = pd.DataFrame({
+        "Asset1": [100, 101, 102, 103, 102, 101, 100, 99, 98, 97],
+        "Asset2": [200, 202, 204, 206, 208, 210, 212, 214, 216, 218]
+    }, index=pd.date_range("2022-01-01", "2022-01-10"))
+    batch = None
+    for transaction_cost in (0.0, 0.01):
+        for slippage in (0.0, 0.005):
+            backtester = Backtester(data_source=sample_data, transaction_cost=transaction_cost, slippage=slippage,
+                                    rebalancing_frequency="daily", special_start=2)
+            result = backtester.run(strategy=AlternatingStrategy())
+            if batch is None:
+                batch = backtester.reprice_costs([0.0, 0.01], [0.0, 0.005])
+            pd.testing.assert_series_equal(batch[(transaction_cost, slippage)], result.portfolio_returns,
+                                           check_names=False)
+    assert batch.columns.names == ["transaction_cost", "slippage"]
+
+def test_drift_accounting():
+    # Vérifie la comptabilité avec dérive des positions contre une boucle date par date.
+    index = pd.bdate_range("2022-01-03", periods=60)
+    sample_data = pd.DataFrame({
+        "Asset1": [100 * 1.01 ** i for i in range(60)],
+        "Asset2": [100 * 0.995 ** i for i in range(60)]
+    }, index=index)
+    backtester = Backtester(data_source=sample_data, transaction_cost=0.01, rebalancing_frequency="monthly",
+                            accounting="drift")
+    backtester.weight_matrix = pd.DataFrame({"Asset1": 0.6, "Asset2": 0.4}, index=index)
+    _, portfolio_returns, _, _, _ = backtester.calculate_returns()
+
+    returns = sample_data.pct_change().fillna(0)
+    rebalancing = [date in backtester.calendar.rebalancing_dates for date in index]
+    weights = pd.Series(0.0, index=sample_data.columns)
+    expected = []
+    for i, date in enumerate(index):
+        target = pd.Series(0.0 if i == 0 else 1.0, index=sample_data.columns) * [0.6, 0.4]
+        turnover = 0.0
+        if i <= 1 or rebalancing[i - 1]:
+            turnover = (target - weights).abs().sum()
+            weights = target
+        gross = (weights * returns.loc[date]).sum()
+        weights = weights * (1 + returns.loc[date]) / (1 + gross)
+        expected.append(gross - turnover * 0.01)
+    pd.testing.assert_series_equal(portfolio_returns, pd.Series(expected, index=index), check_names=False)
+    _, weight_changes = backtester.calculate_holdings(backtester.weight_matrix.shift(1).fillna(0))
+    assert (weight_changes.abs().sum(axis=1) > 0).sum() == 1 + sum(rebalancing[:-1])
+
+def make_random_prices(periods=300, assets=6, seed=2):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(100 * np.cumprod(1 + rng.normal(0, 0.01, size=(periods, assets)), axis=0),
+                        index=pd.bdate_range("2020-01-01", periods=periods),
+                        columns=[f"Asset{i}" for i in range(assets)])
+
+def test_update_uses_vectorized_signals():
+    # Vérifie qu'update calcule les positions par get_signals, comme run, et qu'elles égalent la boucle get_position.
+    data = make_random_prices()
+    reference = Backtester(data_source=data, verbose=False).calculate_composition_matrix(
+        MovingAverage(short_window=5, long_window=20), vectorized=False)
+
+    def get_position(historical_data, current_position):
+        raise AssertionError("get_position ne doit pas être appelée")
+
+    strategy = MovingAverage(short_window=5, long_window=20)
+    backtester = Backtester(data_source=data.iloc[:200], verbose=False)
+    backtester.run(strategy)
+    strategy.get_position = get_position
+    backtester.update(data.iloc[200:250])
+    backtester.update(data.iloc[250:])
+    pd.testing.assert_frame_equal(backtester.state["composition_matrix"], reference, check_freq=False)
+
+def test_update_matches_full_run():
+    # Vérifie qu'un backtest avancé par update donne les mêmes résultats qu'un backtest complet.
+    data = make_random_prices()
+    for options in ({}, {"accounting": "drift", "weight_scheme": "InverseVolatilityWeight", "transaction_cost": 0.001},
+                    {"sparse_weights": True, "slippage": 0.001}):
+        full = Backtester(data_source=data, **options).run(MovingAverage(short_window=5, long_window=20))
+        backtester = Backtester(data_source=data.iloc[:200], **options)
+        backtester.run(MovingAverage(short_window=5, long_window=20))
+        backtester.update(data.iloc[200:201])
+        result = backtester.update(data.iloc[201:])
+        for series in ("portfolio_returns", "cumulative_returns"):
+            np.testing.assert_allclose(getattr(result, series).to_numpy(dtype="float64"),
+                                       getattr(full, series).to_numpy(dtype="float64"), atol=1e-12)
+        assert result.total_trades == full.total_trades
+        assert result.winning_trades == full.winning_trades
+        # Avec sparse_weights, la composition conservée pour update reste stockée par événements
+        sparse_weights = options.get("sparse_weights", False)
+        assert isinstance(backtester.state["composition_matrix"], SparseWeights) == sparse_weights
+
+        # Un historique tronqué donne les mêmes rendements sur les nouvelles dates
+        backtester = Backtester(data_source=data.iloc[:200], **options)
+        backtester.run(MovingAverage(short_window=5, long_window=20))
+        backtester.trim_history(120)
+        result = backtester.update(data.iloc[200:])
+        np.testing.assert_allclose(result.portfolio_returns.iloc[-100:].to_numpy(dtype="float64"),
+                                   full.portfolio_returns.iloc[-100:].to_numpy(dtype="float64"), atol=1e-12)
+
+def test_update_errors_and_state(tmp_path):
+    # Vérifie les erreurs de update et la sauvegarde puis le rechargement de l'état.
+    data = make_random_prices(periods=120)
+    backtester = Backtester(data_source=data.iloc[:100])
+    with pytest.raises(ValueError, match="Aucun backtest à mettre à jour"):
+        backtester.update(data.iloc[100:])
+    backtester.run(MovingAverage(short_window=5, long_window=20))
+    with pytest.raises(ValueError, match="postérieures à la dernière date"):
+        backtester.update(data.iloc[90:])
+
+    backtester.save_state(tmp_path / "state.pkl")
+    restored = Backtester.load_state(tmp_path / "state.pkl")
+    expected = backtester.update(data.iloc[100:])
+    pd.testing.assert_series_equal(restored.update(data.iloc[100:]).portfolio_returns, expected.portfolio_returns)
+
+class StatefulStrategy(Strategy):
+    # (période, nombre d'appels) auxquels une interruption est simulée (None : pas d'interruption).
+    fail_at = None
+
+    def __init__(self, period=3):
+        # La position dépend du nombre d'appels : l'état doit être restauré à l'identique lors d'une reprise.
+        super().__init__(multi_asset=True)
+        self.period = period
+        self.calls = 0
+
+    def get_position(self, historical_data, current_position):
+        self.calls += 1
+        if (self.period, self.calls) == StatefulStrategy.fail_at:
+            raise RuntimeError("Interruption simulée.")
+        return np.where(np.arange(historical_data.shape[1]) == self.calls % self.period, 1.0, 0.0)
+
+def test_run_checkpoint_resume(tmp_path):
+    # Vérifie qu'un backtest interrompu reprend au dernier point de sauvegarde avec des résultats identiques.
+    data = make_random_prices(periods=120, assets=3)
+    path = tmp_path / "run.ckpt"
+    expected = Backtester(data_source=data, rebalancing_frequency="daily").run(StatefulStrategy())
+
+    backtester = Backtester(data_source=data, rebalancing_frequency="daily")
+    StatefulStrategy.fail_at = (3, 75)
+    try:
+        with pytest.raises(RuntimeError):
+            backtester.run(StatefulStrategy(), checkpoint_path=path, checkpoint_every=20)
+    finally:
+        StatefulStrategy.fail_at = None
+    assert path.exists()
+    result = backtester.run(StatefulStrategy(), checkpoint_path=path, checkpoint_every=20)
+    pd.testing.assert_series_equal(result.portfolio_returns, expected.portfolio_returns)
+    assert not path.exists()
+
+    backtester.save_checkpoint(path, backtester.checkpoint_key(StatefulStrategy()), StatefulStrategy(), (0, 1, 0))
+    with pytest.raises(ValueError, match="ne correspond pas"):
+        Backtester(data_source=data.iloc[:100]).run(StatefulStrategy(), checkpoint_path=path)
+
+def test_run_sweep_resume(tmp_path):
+    # Vérifie que la reprise d'une grille ne recalcule pas les points terminés et donne les mêmes résultats.
+    data = make_random_prices(periods=60, assets=3)
+    path = tmp_path / "sweep.ckpt"
+    backtester = Backtester(data_source=data, rebalancing_frequency="daily")
+    expected = backtester.run_sweep(StatefulStrategy, {"period": [2, 3, 4]})
+
+    StatefulStrategy.fail_at = (3, 30)
+    try:
+        with pytest.raises(RuntimeError):
+            backtester.run_sweep(StatefulStrategy, {"period": [2, 3, 4]}, checkpoint_path=path)
+    finally:
+        StatefulStrategy.fail_at = None
+    assert [values for values, _ in list(iter_pickle(path))[1:]] == [(2,)]
+
+    # Un point de grille tronqué par l'interruption est supprimé du journal avant les ajouts de la reprise :
+    # les points terminés lors d'une reprise elle-même interrompue restent lisibles
+    with open(path, "ab") as file:
+        file.write(pickle.dumps(((3,), expected[(3,)]))[:-50])
+    StatefulStrategy.fail_at = (4, 30)
+    try:
+        with pytest.raises(RuntimeError):
+            backtester.run_sweep(StatefulStrategy, {"period": [2, 3, 4]}, checkpoint_path=path)
+    finally:
+        StatefulStrategy.fail_at = None
+    assert [values for values, _ in list(iter_pickle(path))[1:]] == [(2,), (3,)]
+    results = backtester.run_sweep(StatefulStrategy, {"period": [2, 3, 4]}, checkpoint_path=path)
+    for values in expected:
+        pd.testing.assert_series_equal(results[values].portfolio_returns, expected[values].portfolio_returns)
+    assert not path.exists()
+
+    # Une autre grille (mêmes noms de paramètres, autres valeurs) ne reprend pas les résultats d'une grille interrompue
+    StatefulStrategy.fail_at = (3, 30)
+    try:
+        with pytest.raises(RuntimeError):
+            backtester.run_sweep(StatefulStrategy, {"period": [2, 3, 4]}, checkpoint_path=path)
+    finally:
+        StatefulStrategy.fail_at = None
+    with pytest.raises(ValueError, match="ne correspond pas"):
+        backtester.run_sweep(StatefulStrategy, {"period": [2, 5]}, checkpoint_path=path)
+
+class InterruptedMeanReversion(MeanReversion):
+    # Nombre d'appels de get_position (tous actifs confondus) auquel une interruption est simulée.
+    fail_at = None
+
+    def get_position(self, historical_data, current_position):
+        self.calls = getattr(self, "calls", 0) + 1
+        if self.calls == InterruptedMeanReversion.fail_at:
+            raise RuntimeError("Interruption simulée.")
+        return super().get_position(historical_data, current_position)
+
+def test_mono_asset_checkpoint_resume_and_parameters(tmp_path):
+    # Vérifie la reprise mono-actif (colonnes terminées et colonne partielle) et le refus d'une reprise
+    # avec d'autres paramètres de stratégie.
+    data = make_random_prices(periods=150, assets=4)
+    path = tmp_path / "mono.ckpt"
+    backtester = Backtester(data_source=data, rebalancing_frequency="daily")
+    expected = backtester.calculate_composition_matrix(MeanReversion(window=10, zscore_threshold=1), vectorized=False)
+
+    InterruptedMeanReversion.fail_at = 2 * 149 + 70
+    try:
+        with pytest.raises(RuntimeError):
+            backtester.calculate_composition_matrix(InterruptedMeanReversion(window=10, zscore_threshold=1),
+                                                    checkpoint_path=str(path), checkpoint_every=25)
+    finally:
+        InterruptedMeanReversion.fail_at = None
+    assert load_pickle(path)["progress"][0] == 2
+
+    with pytest.raises(ValueError, match="ne correspond pas"):
+        backtester.calculate_composition_matrix(InterruptedMeanReversion(window=20, zscore_threshold=1),
+                                                checkpoint_path=str(path), checkpoint_every=25)
+    strategy = InterruptedMeanReversion(window=10, zscore_threshold=1)
+    resumed = backtester.calculate_composition_matrix(strategy, checkpoint_path=str(path), checkpoint_every=25)
+    pd.testing.assert_frame_equal(resumed, expected)
+    assert strategy.window == 10
+    assert not path.exists() and not (tmp_path / "mono.ckpt.blocks").exists()
+
+def test_weights_arrow_round_trip(tmp_path):
+    # Vérifie l'export et l'import Arrow des pondérations, au format large (dense) et long (creux).
+    data = make_random_prices(periods=120)
+    for sparse_weights in (False, True):
+        backtester = Backtester(data_source=data, sparse_weights=sparse_weights)
+        backtester.run(MovingAverage(short_window=5, long_window=20))
+        expected = backtester.weight_matrix
+        expected = expected.to_dense() if sparse_weights else expected.astype("float64")
+        batch = backtester.weights_to_arrow(tmp_path / "weights.arrow")
+        assert batch.schema.names[0] == "date"
+
+        imported = backtester.weights_from_arrow(str(tmp_path / "weights.arrow"))
+        imported = imported.to_dense() if sparse_weights else imported
+        pd.testing.assert_frame_equal(imported, expected, check_freq=False, check_names=False)
+
+    with pytest.raises(ValueError, match="Aucun backtest"):
+        Backtester(data_source=data).weights_to_arrow()
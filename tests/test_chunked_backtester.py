@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+import pytest
+from backtesting_framework.Core.Backtester import Backtester
+from backtesting_framework.Core.ChunkedBacktester import ChunkedBacktester
+from backtesting_framework.Strategies.MovingAverage import MovingAverage
+from backtesting_framework.Strategies.PairsTrading import PairsTradingStrategy
+from tests.test_pairs_trading import RecordingPairsTrading, make_pair_prices
+
+def make_prices(periods=400, assets=5, seed=3):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(100 * np.cumprod(1 + rng.normal(0, 0.01, size=(periods, assets)), axis=0),
+                        index=pd.bdate_range("2020-01-01", periods=periods),
+                        columns=[f"Asset{i}" for i in range(assets)])
+
+def test_chunked_parquet_matches_full_run(tmp_path):
+    # Vérifie qu'un backtest lu par blocs depuis un fichier Parquet donne les résultats du backtest complet.
+    data = make_prices()
+    data.index.name = "Date"
+    data.to_parquet(tmp_path / "prices.parquet")
+    full = Backtester(data_source=data, transaction_cost=0.001).run(MovingAverage(short_window=5, long_window=20))
+
+    chunked = ChunkedBacktester(str(tmp_path / "prices.parquet"), chunk_size=50, max_history=80,
+                                output_path=str(tmp_path / "returns.csv"), transaction_cost=0.001)
+    result = chunked.run(MovingAverage(short_window=5, long_window=20))
+    np.testing.assert_allclose(result.portfolio_returns.to_numpy(),
+                               full.portfolio_returns.to_numpy(dtype="float64"), atol=1e-12)
+    assert result.total_trades == full.total_trades
+    assert result.winning_trades == full.winning_trades
+    # Seul l'historique borné reste en mémoire
+    assert len(chunked.backtester.data) == 80
+    assert len(pd.read_csv(tmp_path / "returns.csv")) == len(data)
+
+def test_chunked_ledger_and_run_stats(tmp_path):
+    # Vérifie que le registre des trades écrit bloc par bloc (fichier ou mémoire) est celui du backtest complet
+    # et que l'instrumentation cumule les appels de tous les blocs.
+    data = make_prices()
+    full = Backtester(data_source=data, verbose=False).run(MovingAverage(short_window=5, long_window=20))
+    for ledger_path in (None, str(tmp_path / "trades.csv")):
+        chunked = ChunkedBacktester(data, chunk_size=50, max_history=80, ledger_path=ledger_path,
+                                    verbose=False)
+        result = chunked.run(MovingAverage(short_window=5, long_window=20))
+        pd.testing.assert_frame_equal(result.trade_ledger, full.trade_ledger, check_dtype=False)
+        assert len(result.trade_ledger) == result.total_trades
+        # Un calcul des signaux par bloc de 50 dates
+        assert result.run_stats.counters["MovingAverage.get_signals"] == len(data) // 50
+        assert set(result.run_stats.timings) >= set(full.run_stats.timings)
+
+def test_chunked_pairs_trading_matches_full_run():
+    # Vérifie qu'un backtest de PairsTrading par blocs re-sélectionne les paires aux mêmes dates que le backtest
+    # complet, et que ses rendements sont identiques lorsque l'historique conservé couvre toute la période.
+    data = make_pair_prices()
+    full_strategy = RecordingPairsTrading(reselection_window=60, reselection_frequency=10)
+    full = Backtester(data_source=data, rebalancing_frequency="weekly").run(full_strategy)
+
+    strategy = RecordingPairsTrading(reselection_window=60, reselection_frequency=10)
+    ChunkedBacktester(data, chunk_size=50, max_history=80, rebalancing_frequency="weekly").run(strategy)
+    assert strategy.selections == full_strategy.selections
+
+    result = ChunkedBacktester(data, chunk_size=50, max_history=len(data), rebalancing_frequency="weekly") \
+        .run(PairsTradingStrategy(reselection_window=60, reselection_frequency=10))
+    np.testing.assert_allclose(result.portfolio_returns.to_numpy(),
+                               full.portfolio_returns.to_numpy(dtype="float64"), atol=1e-12)
+    assert result.total_trades == full.total_trades
+
+def test_chunked_memmap_source(tmp_path):
+    # Vérifie la lecture d'un tableau mémoire-mappé et l'erreur sans index ni colonnes.
+    data = make_prices(periods=200)
+    np.save(tmp_path / "prices.npy", data.to_numpy())
+    chunked = ChunkedBacktester(str(tmp_path / "prices.npy"), chunk_size=60, index=data.index, columns=data.columns)
+    chunks = list(chunked.iter_chunks())
+    assert [len(chunk) for chunk in chunks] == [60, 60, 60, 20]
+    pd.testing.assert_frame_equal(pd.concat(chunks), data, check_freq=False)
+
+    with pytest.raises(ValueError, match="index et columns sont requis"):
+        list(ChunkedBacktester(str(tmp_path / "prices.npy")).iter_chunks())
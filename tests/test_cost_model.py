@@ -0,0 +1,52 @@
+import numpy as np
+import pandas as pd
+from backtesting_framework.Core.Backtester import Backtester
+from backtesting_framework.Core.CostModel import (
+    CompositeCost, FlatCost, PerAssetBpsCost, SpreadCost, SquareRootImpact
+)
+from backtesting_framework.Core.Strategy import Strategy
+
+class AlternatingStrategy(Strategy):
+    def get_position(self, historical_data, current_position):
+        # Alterne entre position longue et position courte pour générer de la rotation.
+        return 1 if len(historical_data) % 2 else -1
+
+def make_data():
+    return pd.DataFrame({
+        "Asset1": [100, 101, 102, 103, 102, 101, 100, 99, 98, 97],
+        "Asset2": [200, 202, 204, 206, 208, 210, 212, 214, 216, 218]
+    }, index=pd.date_range("2022-01-01", "2022-01-10"), dtype="float64")
+
+def make_weight_changes():
+    index = pd.date_range("2022-01-01", periods=3)
+    return pd.DataFrame({"Asset1": [np.nan, 0.5, -0.2], "Asset2": [np.nan, -0.5, 0.0]}, index=index)
+
+def test_flat_cost_matches_transaction_cost():
+    # Vérifie qu'un coût fixe via le modèle de coûts équivaut au paramètre transaction_cost.
+    reference = Backtester(data_source=make_data(), transaction_cost=0.01, rebalancing_frequency="daily")
+    modelled = Backtester(data_source=make_data(), cost_model=FlatCost(0.01), rebalancing_frequency="daily")
+    expected = reference.run(AlternatingStrategy()).portfolio_returns
+    pd.testing.assert_series_equal(modelled.run(AlternatingStrategy()).portfolio_returns, expected)
+
+def test_per_asset_and_spread_costs():
+    # Vérifie les coûts par actif en points de base et les coûts de demi-spread.
+    weight_changes = make_weight_changes()
+    costs = PerAssetBpsCost({"Asset1": 10}, default_bps=20).compute_costs(weight_changes, None)
+    np.testing.assert_allclose(costs, [0.0, 0.5 * 0.001 + 0.5 * 0.002, 0.2 * 0.001])
+
+    spreads = pd.DataFrame(0.02, index=weight_changes.index, columns=weight_changes.columns)
+    costs = SpreadCost(spreads).compute_costs(weight_changes, None)
+    np.testing.assert_allclose(costs, [0.0, 0.01, 0.002])
+
+def test_square_root_impact():
+    # Vérifie la formule d'impact en racine carrée et la somme des modèles.
+    weight_changes = make_weight_changes()
+    adv = pd.Series({"Asset1": 1e6, "Asset2": 4e6})
+    volatility = pd.Series({"Asset1": 0.02, "Asset2": 0.01})
+    impact = SquareRootImpact(adv, portfolio_value=1e6, volatility=volatility, coefficient=0.5)
+    costs = impact.compute_costs(weight_changes, None)
+    expected = 0.5 * (0.5 * 0.02 * np.sqrt(0.5) + 0.5 * 0.01 * np.sqrt(0.5 / 4))
+    np.testing.assert_allclose(costs, [0.0, expected, 0.5 * 0.2 * 0.02 * np.sqrt(0.2)])
+
+    total = CompositeCost(impact, FlatCost(0.001)).compute_costs(weight_changes, None)
+    np.testing.assert_allclose(total, costs + [0.0, 0.001, 0.0002])
@@ -0,0 +1,43 @@
+import numpy as np
+import pandas as pd
+import pytest
+from backtesting_framework.Core.Backtester import Backtester
+from backtesting_framework.Core.DataCleaner import DataCleaner
+
+def make_prices():
+    return pd.DataFrame({
+        "Listed": [np.nan, np.nan, 100, 101, np.nan, np.nan, np.nan, 104, 105, 106],
+        "Delisted": [50, 51, 52, 53, 54, 55, np.nan, np.nan, np.nan, np.nan],
+        "Stale": [10, 11, 11, 11, 11, 11, 12, 13, 14, 15]
+    }, index=pd.date_range("2022-01-03", periods=10, freq="B"), dtype="float64")
+
+def test_clean_forward_fill_limit_and_listing():
+    # Vérifie que les prix sont prolongés dans la limite fixée, sans remplir avant cotation ni après radiation.
+    prices = make_prices()
+    cleaned, valid_mask = DataCleaner(ffill_limit=2).clean(prices)
+    assert cleaned["Listed"].iloc[:2].isna().all()
+    assert cleaned["Listed"].iloc[4:6].tolist() == [101, 101]
+    assert np.isnan(cleaned["Listed"].iloc[6])
+    assert cleaned["Delisted"].iloc[6:].isna().all()
+    pd.testing.assert_frame_equal(valid_mask, cleaned.notna())
+    assert prices["Listed"].isna().sum() == 5  # Données d'origine non modifiées
+
+def test_detect_stale_prices():
+    # Vérifie que les prix identiques au-delà de la limite sont invalidés.
+    cleaned, valid_mask = DataCleaner(ffill_limit=0, stale_limit=3).clean(make_prices())
+    assert valid_mask["Stale"].tolist() == [True, True, True, True, False, False, True, True, True, True]
+
+def test_invalid_cleaner_parameters():
+    # Vérifie que des paramètres négatifs lèvent une erreur.
+    with pytest.raises(ValueError, match="ffill_limit doit être positif ou nul."):
+        DataCleaner(ffill_limit=-1)
+    with pytest.raises(ValueError, match="stale_limit doit être supérieur ou égal à 1."):
+        DataCleaner(stale_limit=0)
+
+def test_backtester_applies_cleaner_once():
+    # Vérifie que le Backtester nettoie les données à l'initialisation et expose le masque de validité.
+    prices = make_prices()
+    backtester = Backtester(data_source=prices, rebalancing_frequency="daily",
+                            data_cleaner=DataCleaner(ffill_limit=5))
+    assert backtester.data["Listed"].iloc[4:7].notna().all()
+    pd.testing.assert_frame_equal(backtester.valid_mask, backtester.data.notna())
@@ -0,0 +1,108 @@
+import os
+import numpy as np
+import pandas as pd
+import pytest
+from backtesting_framework.Strategies.BollingerBands import BollingerBands
+from backtesting_framework.Strategies.KeltnerChannelStrategy import KeltnerChannelStrategy
+from backtesting_framework.Strategies.MovingAverage import MovingAverage
+from backtesting_framework.Strategies.Quality import Quality
+from backtesting_framework.Strategies.RSI import RSI
+from backtesting_framework.Strategies.Size import Size
+from backtesting_framework.Strategies.Value import Value
+from backtesting_framework.Strategies.Volatility_Trend import VolatilityTrendStrategy
+from backtesting_framework.Utils.Differential import assert_equivalent, compare_paths, perturb_panel, run_differential
+from backtesting_framework.Utils.MarketSimulator import MarketSimulator
+from backtesting_framework.Utils.Tools import load_data
+
+PRICES_PATH = os.path.join(os.path.dirname(__file__), os.pardir, "datasets", "S&P500_PX_LAST_REDUCED.csv")
+
+class ShiftedMovingAverage(MovingAverage):
+    def get_signals(self, data):
+        # Signaux vectorisés décalés d'une date : divergence volontaire avec get_position.
+        return super().get_signals(data).shift(1)
+
+def fitted_size(prices):
+    strategy = Size(window=10, assets_picked_long=3, assets_picked_short=3)
+    strategy.fit(prices * 1e6)
+    return strategy
+
+def fitted_value(prices):
+    # Métriques arrondies : nombreux ex aequo dans les classements.
+    strategy = Value(window=5, assets_picked_long=3, assets_picked_short=3)
+    strategy.fit({"PER": (prices / 10).round(), "PBR": (prices / 20).round()})
+    return strategy
+
+def fitted_quality(prices):
+    strategy = Quality(window=5, assets_picked_long=3, assets_picked_short=3)
+    strategy.fit({"ROE": prices.pct_change(20, fill_method=None).round(2),
+                  "ROA": prices.pct_change(5, fill_method=None).round(2)})
+    return strategy
+
+def test_perturb_panel():
+    # Vérifie l'ajout de valeurs manquantes, de radiations et le retrait de jours fériés.
+    prices = MarketSimulator(n_assets=30, n_days=400, seed=0).prices()
+    perturbed = perturb_panel(prices, np.random.default_rng(0), nan_rate=0.02, delisting_rate=0.2, holiday_rate=0.02)
+    assert len(perturbed) < len(prices) and perturbed.index[0] == prices.index[0]
+    assert perturbed.isna().to_numpy().mean() > 0.02
+    assert perturbed.iloc[-5:].isna().all().any()
+    pd.testing.assert_frame_equal(perturbed.dropna(how="any", axis=1), prices.loc[perturbed.index,
+                                  perturbed.dropna(how="any", axis=1).columns])
+
+    rounded = perturb_panel(prices, np.random.default_rng(0), nan_rate=0.0, delisting_rate=0.0, holiday_rate=0.0,
+                            decimals=2)
+    pd.testing.assert_frame_equal(rounded, prices.round(2))
+
+def test_fast_paths_match_reference():
+    # Vérifie que les chemins vectorisés de toutes les stratégies concordent avec la boucle get_position
+    # sur des panels cotés au centime, et qu'une divergence est détectée.
+    report = run_differential({
+        "MovingAverage": lambda prices: MovingAverage(short_window=5, long_window=20),
+        "ExponentialMovingAverage": lambda prices: MovingAverage(short_window=5, long_window=20, exponential_mode=True),
+        "RSI": lambda prices: RSI(14, 30, 70),
+        "BollingerBands": lambda prices: BollingerBands(window=20, num_std_dev=2),
+        "KeltnerChannel": lambda prices: KeltnerChannelStrategy(),
+        "VolatilityTrend": lambda prices: VolatilityTrendStrategy(),
+        "Size": fitted_size,
+        "Value": fitted_value,
+        "Quality": fitted_quality,
+    }, n_trials=2, n_assets=8, n_days=200, transaction_cost=0.001)
+    assert len(report) == 18
+    assert_equivalent(report)
+    assert (report["speedup"] > 0).all()
+
+    report = run_differential({"Shifted": lambda prices: ShiftedMovingAverage(short_window=5, long_window=20)},
+                              n_trials=1, n_assets=5, n_days=200)
+    with pytest.raises(AssertionError, match="divergent"):
+        assert_equivalent(report)
+
+def test_fast_paths_match_reference_at_ties():
+    # Vérifie l'égalité exacte des deux chemins sur un long panel coté au dixième, où les indicateurs
+    # atteignent souvent exactement les seuils des stratégies.
+    report = run_differential({
+        "MovingAverage": lambda prices: MovingAverage(short_window=10, long_window=30),
+        "VolatilityTrend": lambda prices: VolatilityTrendStrategy(),
+        "KeltnerChannel": lambda prices: KeltnerChannelStrategy(),
+        "BollingerBands": lambda prices: BollingerBands(window=20, num_std_dev=2),
+    }, n_trials=1, n_assets=20, n_days=1500, decimals=1, atol=0.0)
+    assert_equivalent(report)
+
+def test_fast_paths_match_reference_on_bundled_data():
+    # Vérifie l'égalité exacte des deux chemins sur des prix réels cotés au centime (égalités avec les seuils),
+    # sur les actifs où des sommes cumulées courantes inversaient des positions.
+    prices = load_data(PRICES_PATH)
+    prices = prices[[column for column in prices.columns
+                     if column.split()[0] in ("AAL", "ADSK", "AES", "AMGN", "AMP", "AMT", "AMZN")]]
+    strategies = {
+        "MovingAverage": lambda prices: MovingAverage(short_window=10, long_window=30),
+        "VolatilityTrend": lambda prices: VolatilityTrendStrategy(),
+        "KeltnerChannel": lambda prices: KeltnerChannelStrategy(),
+        "BollingerBands": lambda prices: BollingerBands(window=20, num_std_dev=2),
+    }
+    for frequency in ("daily", "weekly"):
+        for name, strategy_factory in strategies.items():
+            comparison = compare_paths(strategy_factory, prices, atol=0.0, rebalancing_frequency=frequency)
+            assert comparison["match"], (name, frequency, comparison)
+    # Le RSI de référence est lent : vérification hebdomadaire sur trois actifs
+    comparison = compare_paths(lambda prices: RSI(14, 30, 70), prices.iloc[:, :3], atol=0.0,
+                               rebalancing_frequency="weekly")
+    assert comparison["match"], ("RSI", comparison)
@@ -0,0 +1,41 @@
+import numpy as np
+import pandas as pd
+import pytest
+from backtesting_framework.Utils.Downsampling import downsample, lttb, min_max
+
+def make_series(periods=10000, seed=0):
+    values = np.cumsum(np.random.default_rng(seed).normal(size=periods))
+    return pd.Series(values, index=pd.date_range("2024-01-01", periods=periods, freq="min"))
+
+def test_lttb_keeps_shape_and_endpoints():
+    # Vérifie le budget de points, l'ordre, les extrémités et la fidélité de la série réduite par LTTB.
+    series = make_series()
+    reduced = lttb(series, 500)
+    assert len(reduced) == 500
+    assert reduced.index.is_monotonic_increasing
+    assert reduced.index[0] == series.index[0] and reduced.index[-1] == series.index[-1]
+    # Chaque point retenu appartient à la série d'origine
+    pd.testing.assert_series_equal(reduced, series.loc[reduced.index])
+    # L'interpolation linéaire de la série réduite reste proche de la série complète
+    interpolated = np.interp(series.index.asi8, reduced.index.asi8, reduced.to_numpy())
+    assert np.abs(interpolated - series.to_numpy()).max() < 0.1 * (series.max() - series.min())
+
+    short = series.iloc[:100]
+    assert lttb(short, 500).equals(short)
+    with pytest.raises(ValueError):
+        lttb(series, 2)
+
+def test_min_max_keeps_extremes():
+    # Vérifie que le sous-échantillonnage min/max conserve les extrêmes et ignore les valeurs manquantes.
+    series = make_series(seed=1)
+    series.iloc[[10, 5000]] = np.nan
+    reduced = min_max(series, 400)
+    assert len(reduced) <= 400
+    assert reduced.max() == series.max() and reduced.min() == series.min()
+    assert not reduced.isna().any()
+    assert reduced.index.is_monotonic_increasing
+
+    assert downsample(series, None) is series
+    assert len(downsample(series, 300, method="minmax")) <= 300
+    with pytest.raises(ValueError):
+        downsample(series, 300, method="mean")
@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+import pytest
+from backtesting_framework.Core.Backtester import Backtester
+from backtesting_framework.Core.FactorEngine import FactorEngine
+from backtesting_framework.Strategies.Value import Value
+
+def make_metric(seed, columns=8, periods=40):
+    rng = np.random.default_rng(seed)
+    values = rng.integers(1, 6, size=(periods, columns)).astype(float)
+    values[5:15, 2] = np.nan
+    return pd.DataFrame(values, index=pd.date_range("2022-01-03", periods=periods, freq="B"),
+                        columns=[f"Asset{i}" for i in range(columns)])
+
+def reference_composition(scores, long_count, short_count):
+    # Règle de sélection historique : rang "min" du score comparé au nombre d'actifs valides.
+    ranks = scores.rank(axis=1, method="min", ascending=True)
+    totals = ranks.notna().sum(axis=1)
+    is_long = ranks.gt(totals - long_count, axis=0)
+    is_short = ranks.le(short_count) & ~is_long
+    return pd.DataFrame(np.where(is_long, 1.0, np.where(is_short, -1.0, 0.0)),
+                        index=scores.index, columns=scores.columns)
+
+@pytest.mark.parametrize("long_count,short_count", [(2, 2), (0, 3), (10, 1), (3, 10)])
+def test_select_positions_matches_rank_rule(long_count, short_count):
+    # Vérifie que la sélection par partition reproduit la sélection par rangs, y compris avec égalités et NaN.
+    engine = FactorEngine({"A": (1, 1.0), "B": (-1, 2.0)}, window=3,
+                          assets_picked_long=long_count, assets_picked_short=short_count)
+    composition = engine.fit({"A": make_metric(0), "B": make_metric(1)})
+    expected = reference_composition(engine.scores, long_count, short_count)
+    pd.testing.assert_frame_equal(composition, expected)
+
+def test_factor_engine_missing_metric():
+    # Vérifie qu'une métrique manquante lève une erreur.
+    engine = FactorEngine({"PER": (-1, 1.0)})
+    with pytest.raises(KeyError, match="Métriques manquantes"):
+        engine.fit({"PBR": make_metric(0)})
+
+def test_factor_engine_invalid_direction():
+    # Vérifie qu'une direction différente de 1 ou -1 lève une erreur.
+    with pytest.raises(ValueError, match="La direction de la métrique 'PER' doit valoir 1 ou -1."):
+        FactorEngine({"PER": (0, 1.0)})
+
+def test_factor_strategy_vectorized_matches_loop():
+    # Vérifie que le calcul vectorisé de la composition est identique à la boucle date par date.
+    per, pbr = make_metric(2), make_metric(3)
+    prices = per * 0 + 100
+    backtester = Backtester(data_source=prices, rebalancing_frequency="weekly", special_start=5)
+    strategy = Value(window=3, assets_picked_long=2, assets_picked_short=2)
+    strategy.fit({"PER": per, "PBR": pbr})
+    pd.testing.assert_frame_equal(
+        backtester.calculate_composition_matrix(strategy),
+        backtester.calculate_composition_matrix(strategy, vectorized=False)
+    )
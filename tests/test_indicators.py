@@ -0,0 +1,83 @@
+import numpy as np
+import pandas as pd
+import pytest
+from backtesting_framework.Utils import Indicators
+
+def make_prices():
+    rng = np.random.default_rng(0)
+    prices = pd.DataFrame(100 + rng.normal(0, 1, size=(60, 3)).cumsum(axis=0),
+                          index=pd.date_range("2022-01-03", periods=60, freq="B"),
+                          columns=["Asset1", "Asset2", "Asset3"])
+    prices.iloc[10:13, 1] = np.nan
+    return prices
+
+def test_sma_and_std_match_pandas_rolling():
+    # Vérifie que la SMA et l'écart-type glissant correspondent aux calculs pandas, NaN compris.
+    prices = make_prices()
+    pd.testing.assert_frame_equal(Indicators.sma(prices, 5), prices.rolling(5).mean())
+    pd.testing.assert_frame_equal(Indicators.rolling_std(prices, 5), prices.rolling(5).std())
+    pd.testing.assert_frame_equal(Indicators.rolling_std(prices, 5, ddof=0), prices.rolling(5).std(ddof=0))
+
+def test_atr_matches_pandas_rolling():
+    # Vérifie que l'ATR correspond à la moyenne glissante des variations absolues.
+    prices = make_prices()
+    pd.testing.assert_frame_equal(Indicators.atr(prices, 7), prices.diff().abs().rolling(7).mean())
+
+def test_ema_matches_recursive_computation():
+    # Vérifie que l'EMA vectorisée reproduit le calcul récursif sur la fenêtre.
+    prices = make_prices()["Asset1"]
+    window = 6
+    alpha = 2 / (window + 1)
+    ema = prices.iloc[-window]
+    for price in prices.iloc[-window + 1:]:
+        ema = alpha * price + (1 - alpha) * ema
+    result = Indicators.ema(prices, window)
+    assert isinstance(result, pd.Series)
+    assert result.iloc[-1] == ema
+    assert result.iloc[:window - 1].isna().all()
+
+def test_indicator_cache_shares_results():
+    # Vérifie qu'un même indicateur sur des données identiques n'est calculé qu'une fois.
+    Indicators.clear_cache()
+    prices = make_prices()
+    first = Indicators.sma(prices, 20)
+    assert Indicators.sma(prices.copy(), window=20) is first
+    assert Indicators.sma(prices, 10) is not first
+    with pytest.raises(ValueError):
+        first.to_numpy()[0, 0] = 1.0
+
+    # Un panel modifié en place est recalculé
+    prices.iloc[-1] = prices.iloc[-1] * 2
+    updated = Indicators.sma(prices, 20)
+    assert updated is not first
+    pd.testing.assert_frame_equal(updated, prices.rolling(20).mean())
+
+def reference_rsi(prices, period):
+    # Calcul de référence du RSI de Wilder, date par date.
+    delta = pd.Series(prices).diff(1).dropna()
+    gains = delta.where(delta > 0, 0.0)
+    losses = delta.where(delta < 0, 0.0).abs()
+    if len(gains) < period:
+        return np.nan
+    avg_gain = gains.rolling(window=period, min_periods=period).mean().iloc[period - 1]
+    avg_loss = losses.rolling(window=period, min_periods=period).mean().iloc[period - 1]
+    for i in range(period, len(gains)):
+        avg_gain = (avg_gain * (period - 1) + gains.iloc[i]) / period
+        avg_loss = (avg_loss * (period - 1) + losses.iloc[i]) / period
+    if avg_loss == 0:
+        return 100.0
+    return 100 - (100 / (1 + avg_gain / avg_loss))
+
+def test_rsi_matches_reference_computation():
+    # Vérifie que le RSI calculé sur tout le panel est identique au calcul date par date.
+    prices = make_prices()
+    prices.iloc[:8, 2] = np.nan
+    rsi = Indicators.rsi(prices, 14)
+    for column in prices.columns:
+        for t in range(len(prices)):
+            history = prices[column].iloc[:t + 1]
+            if history.isna().all():
+                assert np.isnan(rsi[column].iloc[t])
+                continue
+            expected = reference_rsi(history.ffill().bfill().to_numpy(), 14)
+            np.testing.assert_equal(rsi[column].iloc[t], expected)
@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+from backtesting_framework.Utils.MarketSimulator import MarketSimulator
+from backtesting_framework.Utils.Tools import load_data
+
+def test_prices_are_reproducible():
+    # Vérifie que les prix simulés dépendent uniquement de la graine et ont la taille demandée.
+    prices = MarketSimulator(n_assets=8, n_days=250, seed=3).prices()
+    assert prices.shape == (250, 8)
+    assert (prices > 0).all().all()
+    assert prices.equals(MarketSimulator(n_assets=8, n_days=250, seed=3).prices())
+    assert not prices.equals(MarketSimulator(n_assets=8, n_days=250, seed=4).prices())
+    np.testing.assert_allclose(prices.iloc[0], 100.0)
+
+    # Volatilité annuelle réalisée dans les bornes demandées (aux erreurs d'estimation près)
+    volatility = np.log(prices).diff().std() * np.sqrt(252)
+    assert volatility.between(0.10, 0.50).all()
+
+    with pytest.raises(ValueError):
+        MarketSimulator(n_assets=0)
+
+def test_market_caps_and_fundamentals():
+    # Vérifie la cohérence des capitalisations et des métriques fondamentales avec les prix.
+    simulator = MarketSimulator(n_assets=5, n_days=300, seed=1)
+    prices = simulator.prices()
+    market_caps = simulator.market_caps(prices)
+    shares = market_caps / prices
+    np.testing.assert_allclose(shares.iloc[-1], shares.iloc[0])
+
+    fundamentals = simulator.fundamentals(prices)
+    assert set(fundamentals) == {"PER", "PBR", "ROE", "ROA"}
+    # PER x ROE = PBR lorsque les bénéfices sont positifs
+    per, pbr, roe = fundamentals["PER"], fundamentals["PBR"], fundamentals["ROE"]
+    positive = roe > 0
+    np.testing.assert_allclose((per * roe)[positive].stack(), pbr[positive].stack())
+    assert (fundamentals["ROA"].abs() < roe.abs()).all().all()
+
+def test_chunked_generation_matches_full_panel():
+    # Vérifie que la génération par blocs ne dépend pas de la taille des blocs, extensions comprises.
+    simulator = MarketSimulator(n_assets=6, n_days=400, seed=2, correlation=0.5, regime_switching=True,
+                                jump_intensity=3)
+    prices = simulator.prices()
+    fundamentals = simulator.fundamentals(prices)
+    chunks = list(simulator.iter_panels(chunk_size=37))
+    assert [len(chunk["PX_LAST"]) for chunk in chunks] == [37] * 10 + [30]
+    pd.testing.assert_frame_equal(pd.concat(chunk["PX_LAST"] for chunk in chunks), prices)
+    pd.testing.assert_frame_equal(pd.concat(chunk["MARKET_CAP"] for chunk in chunks),
+                                  simulator.market_caps(prices))
+    for name, panel in fundamentals.items():
+        pd.testing.assert_frame_equal(pd.concat(chunk[name] for chunk in chunks), panel)
+
+    # Facteur de marché : corrélation moyenne des rendements proche de celle demandée
+    returns = np.log(MarketSimulator(n_assets=20, n_days=1000, correlation=0.6).prices()).diff().dropna()
+    correlations = returns.corr().to_numpy()[np.triu_indices(20, 1)]
+    assert abs(correlations.mean() - 0.6) < 0.1
+    # Sauts : queues de distribution épaisses
+    returns = np.log(MarketSimulator(n_assets=10, n_days=2000, jump_intensity=5).prices()).diff().dropna()
+    assert (returns.kurt() > 3).all()
+
+    with pytest.raises(ValueError):
+        MarketSimulator(correlation=1.5)
+    with pytest.raises(ValueError):
+        MarketSimulator(jump_intensity=-1)
+
+def test_parquet_and_memmap_writers(tmp_path):
+    # Vérifie l'écriture par blocs en Parquet (lisible par load_data) et en tableaux mémoire-mappés.
+    simulator = MarketSimulator(n_assets=4, n_days=260, seed=5, regime_switching=True)
+    prices = simulator.prices()
+    fundamentals = simulator.fundamentals(prices)
+
+    paths = simulator.to_parquet(str(tmp_path / "parquet"), chunk_size=100)
+    assert set(paths) == {"PX_LAST", "MARKET_CAP", "PER", "PBR", "ROE", "ROA"}
+    assert pq.ParquetFile(paths["PX_LAST"]).num_row_groups == 3
+    loaded = load_data(paths["PX_LAST"])
+    np.testing.assert_allclose(loaded.to_numpy(), prices.to_numpy())
+    assert loaded.index.equals(prices.index)
+
+    paths = simulator.to_memmap(str(tmp_path / "memmap"), chunk_size=100, fundamentals=False)
+    assert set(paths) == {"PX_LAST", "MARKET_CAP"}
+    np.testing.assert_allclose(np.load(paths["PX_LAST"], mmap_mode="r"), prices.to_numpy())
+    np.testing.assert_array_equal(np.load(tmp_path / "memmap" / "columns.npy"), prices.columns)
+    assert "ROE" in simulator.to_memmap(str(tmp_path / "memmap"), chunk_size=100)
+    np.testing.assert_allclose(np.load(tmp_path / "memmap" / "ROE.npy"), fundamentals["ROE"].to_numpy())
@@ -0,0 +1,106 @@
+import numpy as np
+import pandas as pd
+from backtesting_framework.Core.Backtester import Backtester
+from backtesting_framework.Strategies import PairsTrading
+from backtesting_framework.Strategies.PairsTrading import PairsTradingStrategy
+
+def make_pair_prices(periods=300, seed=7):
+    # Asset0 et Asset1 sont co-intégrés ; Asset2 et Asset3 sont des marches aléatoires indépendantes.
+    rng = np.random.default_rng(seed)
+    walks = 100 + np.cumsum(rng.normal(0, 1, size=(periods, 3)), axis=0)
+    prices = np.column_stack([walks[:, 0], 1.5 * walks[:, 0] + rng.normal(0, 0.5, periods), walks[:, 1], walks[:, 2]])
+    return pd.DataFrame(prices, index=pd.bdate_range("2020-01-01", periods=periods),
+                        columns=[f"Asset{i}" for i in range(4)])
+
+def test_incremental_window_statistics_match_full_recompute():
+    # Vérifie que les statistiques de la fenêtre glissante mises à jour par blocs égalent un calcul complet.
+    values = make_pair_prices().to_numpy()
+    values[[5, 40, 41, 120], [0, 2, 2, 3]] = np.nan
+    strategy = PairsTradingStrategy(reselection_window=60)
+    for end in list(range(10, 200, 7)) + [260, 261, 300]:
+        start = max(0, end - strategy.reselection_window)
+        strategy._update_window_statistics(values, start, end)
+        expected = PairsTradingStrategy._block_statistics(values[start:end])
+        np.testing.assert_array_equal(strategy._counts, expected[0])
+        np.testing.assert_allclose(strategy._sums, expected[1], rtol=1e-12)
+        np.testing.assert_allclose(strategy._cross, expected[2], rtol=1e-12)
+
+def test_pair_selection_uses_past_data_only():
+    # Vérifie que les paires retenues à une date ne dépendent pas des prix postérieurs à cette date.
+    data = make_pair_prices()
+    altered = data.copy()
+    altered.iloc[150:] = altered.iloc[150:].to_numpy()[:, [3, 2, 1, 0]]
+
+    strategies = [PairsTradingStrategy(reselection_window=60, reselection_frequency=5) for _ in range(2)]
+    for end in range(60, 151):
+        for strategy, prices in zip(strategies, (data, altered)):
+            strategy.get_position(prices.iloc[:end], None)
+        assert strategies[0].pairs == strategies[1].pairs
+    assert ("Asset0", "Asset1") in strategies[0].pairs
+
+    compositions = [Backtester(data_source=prices, rebalancing_frequency="weekly", verbose=False)
+                    .calculate_composition_matrix(PairsTradingStrategy(reselection_window=60))
+                    for prices in (data, altered)]
+    pd.testing.assert_frame_equal(compositions[0].iloc[:150], compositions[1].iloc[:150])
+
+def test_hysteresis_keeps_selected_pair(monkeypatch):
+    # Vérifie qu'une paire retenue avec une p-value nettement significative n'est pas re-testée tant que son
+    # coefficient de couverture est stable, et qu'elle l'est hors de la bande ou au-delà de la tolérance.
+    data = make_pair_prices()
+
+    def rejecting_coint(x, y):
+        return 0.0, 0.9, None
+
+    for boundary_band, beta_tolerance, kept in (((0.5, 2.0), 0.5, True), ((0.0, 2.0), 0.5, False),
+                                                ((0.5, 2.0), 0.0, False)):
+        monkeypatch.undo()
+        strategy = PairsTradingStrategy(reselection_window=100, boundary_band=boundary_band,
+                                        beta_tolerance=beta_tolerance)
+        assert strategy.update_pairs(data.iloc[:100]) == [("Asset0", "Asset1")]
+        assert strategy._pvalue_matrix[0, 1] < strategy.significant_level * 0.5
+
+        # Toute paire re-testée est désormais rejetée
+        monkeypatch.setattr(PairsTrading, "coint", rejecting_coint)
+        pairs = strategy.update_pairs(data.iloc[:110])
+        assert (("Asset0", "Asset1") in pairs) == kept
+        assert strategy._tested_at[0, 1] == (100 if kept else 110)
+
+class RecordingPairsTrading(PairsTradingStrategy):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.selections = []
+
+    def update_pairs(self, historical_data):
+        # Enregistre la date et le résultat de chaque re-sélection.
+        pairs = super().update_pairs(historical_data)
+        self.selections.append((historical_data.index[-1], pairs))
+        return pairs
+
+def test_reused_instance_reselects_from_start():
+    # Vérifie qu'une instance réutilisée pour un nouveau backtest reprend la sélection depuis le début,
+    # sans conserver les paires sélectionnées à la fin du backtest précédent.
+    data = make_pair_prices()
+    backtester = Backtester(data_source=data, rebalancing_frequency="weekly", verbose=False)
+    strategy = RecordingPairsTrading(reselection_window=60)
+    first = backtester.calculate_composition_matrix(strategy)
+    first_selections = list(strategy.selections)
+    strategy.selections = []
+    second = backtester.calculate_composition_matrix(strategy)
+    pd.testing.assert_frame_equal(first, second)
+    assert strategy.selections == first_selections
+
+def test_reselection_continues_after_trim_history():
+    # Vérifie que les re-sélections d'un backtest tronqué par trim_history puis avancé par update
+    # ont lieu aux mêmes dates et retiennent les mêmes paires que le backtest complet.
+    data = make_pair_prices()
+    full = RecordingPairsTrading(reselection_window=60, reselection_frequency=10)
+    Backtester(data_source=data, rebalancing_frequency="weekly", verbose=False).run(full)
+
+    strategy = RecordingPairsTrading(reselection_window=60, reselection_frequency=10)
+    backtester = Backtester(data_source=data.iloc[:150], rebalancing_frequency="weekly", verbose=False)
+    backtester.run(strategy)
+    for start in (150, 200, 250):
+        backtester.trim_history(80)
+        backtester.update(data.iloc[start:start + 50])
+    assert strategy.selections == full.selections
+    assert len([date for date, _ in strategy.selections if date >= data.index[150]]) > 5
@@ -0,0 +1,34 @@
+import json
+import os
+import pstats
+from backtesting_framework.Core.Backtester import Backtester
+from backtesting_framework.Core.Profiler import Profiler
+from backtesting_framework.Strategies.MeanReversion import MeanReversion
+from tests.test_backtester import make_random_prices
+
+def test_profiled_run_writes_artifacts(tmp_path):
+    # Vérifie que run(profile=...) écrit un profil .prof lisible et un résumé JSON des étapes et fonctions coûteuses.
+    backtester = Backtester(data_source=make_random_prices(periods=120), verbose=False)
+    result = backtester.run(MeanReversion(window=20, zscore_threshold=1), profile=str(tmp_path))
+    profile_path, summary_path = backtester.profile_paths
+    assert profile_path == os.path.join(str(tmp_path), "MeanReversion.prof")
+    assert pstats.Stats(profile_path).total_calls > 0
+
+    with open(summary_path, encoding="utf-8") as file:
+        summary = json.load(file)
+    assert set(summary["peak_memory"]) >= {"composition", "weights", "returns", "metrics"}
+    assert summary["timings"] == result.run_stats.timings
+    assert any(row["function"].startswith(f"Strategies{os.sep}MeanReversion.py")
+               for row in summary["hot_functions"])
+    assert backtester.run_stats.hooks == []
+
+def test_profile_setting(monkeypatch, tmp_path):
+    # Vérifie l'activation du profilage par le paramètre profile et par la variable d'environnement.
+    monkeypatch.delenv(Profiler.ENV_VARIABLE, raising=False)
+    assert Profiler.from_setting() is None
+    assert Profiler.from_setting(True).output_dir == Profiler.DEFAULT_DIRECTORY
+    monkeypatch.setenv(Profiler.ENV_VARIABLE, str(tmp_path))
+    assert Profiler.from_setting().output_dir == str(tmp_path)
+    assert Profiler.from_setting(False) is None
+    monkeypatch.setenv(Profiler.ENV_VARIABLE, "1")
+    assert Profiler.from_setting().output_dir == Profiler.DEFAULT_DIRECTORY
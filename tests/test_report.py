@@ -0,0 +1,55 @@
+import matplotlib
+import numpy as np
+import pandas as pd
+import pytest
+from backtesting_framework.Core.Report import ReportBuilder
+from backtesting_framework.Core.Result import Result
+
+def make_result(seed, plot_library="matplotlib"):
+    returns = pd.Series(np.random.default_rng(seed).normal(0.0005, 0.01, 300),
+                        index=pd.bdate_range("2020-01-01", periods=300))
+    return Result(returns, (1 + returns).cumprod(), trade_stats=(10, 6), plot_library=plot_library)
+
+def test_parallel_png_reports(tmp_path):
+    # Vérifie la génération en parallèle des graphiques, des rapports autonomes et de la page d'index.
+    results = {"Moving Average": make_result(0), "RSI": make_result(1, plot_library="seaborn")}
+    builder = ReportBuilder(str(tmp_path), max_workers=2)
+    index = builder.build(results)
+
+    for directory in ["Moving_Average", "RSI"]:
+        for chart in ["cumulative_returns", "monthly_returns_heatmap", "returns_distribution"]:
+            assert (tmp_path / directory / f"{chart}.png").stat().st_size > 0
+    report = (tmp_path / "Moving_Average" / "report.html").read_text(encoding="utf-8")
+    assert report.count("data:image/png;base64,") == 3
+    assert "Sharpe Ratio" in report
+    index_page = open(index, encoding="utf-8").read()
+    assert 'href="Moving_Average/report.html"' in index_page and 'href="RSI/report.html"' in index_page
+    assert set(builder.report_paths) == set(results)
+
+def test_svg_and_html_charts(tmp_path):
+    # Vérifie les graphiques SVG, le HTML statique de plotly et les formats non supportés.
+    ReportBuilder(str(tmp_path / "svg"), image_format="svg", max_workers=1).build({"A": make_result(2)})
+    assert "data:image/svg+xml;base64," in (tmp_path / "svg" / "A" / "report.html").read_text(encoding="utf-8")
+
+    ReportBuilder(str(tmp_path / "html"), max_workers=2).build({"B": make_result(3, plot_library="plotly"),
+                                                                "D": make_result(7, plot_library="plotly")})
+    fragment = (tmp_path / "html" / "B" / "cumulative_returns.div").read_text(encoding="utf-8")
+    assert "Plotly.newPlot" in fragment and "<html" not in fragment
+    report = (tmp_path / "html" / "B" / "report.html").read_text(encoding="utf-8")
+    assert report.count("Plotly.newPlot") == 3
+    # plotly.js est intégré une seule fois : le rapport s'affiche sans accès réseau
+    from plotly.offline import get_plotlyjs
+    assert report.count(get_plotlyjs()) == 1 and 'src="https://cdn.plot.ly' not in report
+    assert len(report) < 1.5 * len(get_plotlyjs())
+
+    # Rendu dans le processus courant : ni le backend de matplotlib ni les Result ne sont modifiés
+    backend = matplotlib.get_backend()
+    result = make_result(6)
+    ReportBuilder(str(tmp_path / "inline"), plot_library="seaborn", max_workers=1).build({"C": result})
+    assert matplotlib.get_backend() == backend
+    assert result.plot_library == "matplotlib"
+
+    with pytest.raises(ValueError):
+        ReportBuilder(str(tmp_path), image_format="gif")
+    with pytest.raises(ValueError, match="même nom"):
+        ReportBuilder(str(tmp_path), max_workers=1).build({"A B": make_result(4), "A_B": make_result(5)})
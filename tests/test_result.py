@@ -1,3 +1,6 @@
+import os
+import subprocess
+import sys
 import pandas as pd
 import pytest
 from backtesting_framework.Core.Result import Result
@@ -75,3 +78,79 @@ def test_trade_statistics():
     assert result.total_trades == 10
     assert result.winning_trades == 6
     assert result.win_rate == pytest.approx(0.6)
+
+def test_result_save_and_load(tmp_path):
+    # Vérifie que la sauvegarde Arrow restitue les rendements, les métriques et le registre des trades.
+    portfolio_returns = pd.Series([0.01, -0.02, float("nan"), 0.03, -0.01],
+                                  index=pd.date_range("2023-01-01", periods=5))
+    cumulative_returns = (1 + portfolio_returns.fillna(0)).cumprod() - 1
+    ledger = pd.DataFrame({"date": portfolio_returns.index[:2], "asset": ["A", "B"], "winning": [True, False]})
+    result = Result(portfolio_returns, cumulative_returns, risk_free_rate=0.01, trade_stats=(2, 1),
+                    trade_ledger=ledger)
+    result.save(tmp_path / "result")
+
+    loaded = Result.load(tmp_path / "result")
+    pd.testing.assert_series_equal(loaded.portfolio_returns, result.portfolio_returns, check_freq=False)
+    pd.testing.assert_series_equal(loaded.cumulative_returns, result.cumulative_returns, check_freq=False)
+    pd.testing.assert_frame_equal(loaded.trade_ledger, ledger)
+    assert loaded.sharpe_ratio == result.sharpe_ratio
+    assert (loaded.total_trades, loaded.win_rate, loaded.risk_free_rate) == (2, 0.5, 0.01)
+    assert loaded.calculate_var() == result.calculate_var()
+
+    # Un résultat rechargé (tampons mappés sur les fichiers) peut être sauvegardé dans son propre répertoire
+    loaded.save(tmp_path / "result")
+    reloaded = Result.load(tmp_path / "result")
+    pd.testing.assert_series_equal(reloaded.portfolio_returns, result.portfolio_returns, check_freq=False)
+    pd.testing.assert_frame_equal(reloaded.trade_ledger, ledger)
+    assert sorted(os.listdir(tmp_path / "result")) == ["returns.arrow", "trade_ledger.arrow"]
+
+    with pytest.raises(ValueError, match="Aucun résultat sauvegardé"):
+        Result.load(tmp_path / "missing")
+
+def test_result_from_arrow():
+    # Vérifie la reconstruction d'un résultat à partir de son export Arrow, registre des trades compris.
+    portfolio_returns = pd.Series([0.01, -0.02, 0.03, -0.01], index=pd.date_range("2023-01-01", periods=4))
+    cumulative_returns = (1 + portfolio_returns).cumprod() - 1
+    ledger = pd.DataFrame({"date": portfolio_returns.index[:3], "asset": ["A", "B", "A"],
+                           "winning": [True, False, True]})
+    result = Result(portfolio_returns, cumulative_returns, trade_ledger=ledger)
+
+    rebuilt = Result.from_arrow(result.to_arrow(), result.ledger_to_arrow())
+    pd.testing.assert_series_equal(rebuilt.portfolio_returns, portfolio_returns, check_freq=False, check_names=False)
+    assert (rebuilt.total_trades, rebuilt.winning_trades) == (3, 2)
+    assert rebuilt.sharpe_ratio == pytest.approx(result.sharpe_ratio)
+
+def test_moments_and_lazy_plotting_imports():
+    # Vérifie l'asymétrie et l'aplatissement face à scipy, et que l'import du Backtester ne charge pas
+    # les bibliothèques graphiques, scipy.stats ni workalendar.
+    from scipy.stats import kurtosis, skew
+    portfolio_returns = pd.Series([0.01, -0.02, 0.03, -0.01, 0.02, 0.05, -0.04],
+                                  index=pd.date_range("2023-01-01", periods=7))
+    result = Result(portfolio_returns, (1 + portfolio_returns).cumprod())
+    assert result.skewness == pytest.approx(skew(portfolio_returns.to_numpy()))
+    assert result.kurtosis == pytest.approx(kurtosis(portfolio_returns.to_numpy()))
+
+    script = ("import sys\n"
+              "from backtesting_framework.Core.Backtester import Backtester\n"
+              "heavy = ['matplotlib', 'seaborn', 'plotly', 'scipy.stats', 'workalendar']\n"
+              "print(','.join(module for module in heavy if module in sys.modules))\n")
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    output = subprocess.run([sys.executable, "-c", script], cwd=root, capture_output=True, text=True, check=True)
+    assert output.stdout.strip() == ""
+
+def test_plots_are_downsampled(tmp_path):
+    # Vérifie le sous-échantillonnage des séries tracées et l'alignement des séries comparées.
+    index = pd.date_range("2023-01-01", periods=2000, freq="min")
+    portfolio_returns = pd.Series(0.0001, index=index)
+    result = Result(portfolio_returns, (1 + portfolio_returns).cumprod(), max_points=100)
+    assert len(result.plot_points(result.cumulative_returns)) == 100
+    assert len(Result(portfolio_returns, (1 + portfolio_returns).cumprod(), max_points=None)
+               .plot_points(result.cumulative_returns)) == 2000
+
+    other = Result(portfolio_returns.iloc[500:], (1 + portfolio_returns.iloc[500:]).cumprod())
+    comparison = result.compare([other], ["A", "B"], output_path=str(tmp_path / "compare.png"))
+    assert list(comparison["Strategy"]) == ["A", "B"]
+    assert (tmp_path / "compare.png").exists()
+
+    with pytest.raises(ValueError):
+        Result(portfolio_returns, (1 + portfolio_returns).cumprod(), downsampling="mean")
@@ -0,0 +1,80 @@
+import os
+import numpy as np
+import pandas as pd
+import pytest
+from backtesting_framework.Core.Backtester import Backtester
+from backtesting_framework.Core.ResultCache import ResultCache
+from backtesting_framework.Core.WeightScheme import EqualRiskContribution
+from backtesting_framework.Strategies.MovingAverage import MovingAverage
+
+def make_prices(periods=300, assets=6, seed=4):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(100 * np.cumprod(1 + rng.normal(0, 0.01, size=(periods, assets)), axis=0),
+                        index=pd.bdate_range("2020-01-01", periods=periods),
+                        columns=[f"Asset{i}" for i in range(assets)])
+
+def test_cache_hit_restores_run(tmp_path):
+    # Vérifie qu'un backtest identique est lu dans le cache sans recalcul, avec les mêmes résultats.
+    extended = make_prices(periods=320)
+    data = extended.iloc[:300]
+    options = dict(transaction_cost=0.001, special_start=10, result_cache=str(tmp_path))
+    expected = Backtester(data_source=data, **options).run(MovingAverage(short_window=5, long_window=20),
+                                                           is_VT=True, target_vol=0.1)
+    assert expected.total_trades == len(expected.trade_ledger) > 0
+    assert expected.winning_trades == expected.trade_ledger["winning"].sum()
+
+    backtester = Backtester(data_source=data, **options)
+    backtester.calculate_composition_matrix = lambda *args, **kwargs: pytest.fail("Le cache n'a pas été utilisé.")
+    result = backtester.run(MovingAverage(short_window=5, long_window=20), is_VT=True, target_vol=0.1)
+    np.testing.assert_array_equal(result.portfolio_returns, expected.portfolio_returns)
+    assert (result.total_trades, result.winning_trades) == (expected.total_trades, expected.winning_trades)
+    pd.testing.assert_frame_equal(result.trade_ledger, expected.trade_ledger)
+
+    # L'état restauré permet d'avancer le backtest par update
+    full = Backtester(data_source=extended, transaction_cost=0.001, special_start=10)
+    full_result = full.run(MovingAverage(short_window=5, long_window=20), is_VT=True, target_vol=0.1)
+    assert backtester.update(extended.iloc[300:]).total_trades == full_result.total_trades
+
+def test_cache_key_and_eviction(tmp_path):
+    # Vérifie que la clé dépend de la configuration et que les entrées les moins récemment utilisées sont supprimées.
+    data = make_prices()
+    cache = ResultCache(str(tmp_path))
+    backtester = Backtester(data_source=data, result_cache=cache)
+    strategy = MovingAverage(short_window=5, long_window=20)
+    key = cache.key(backtester, strategy, False, None)
+    assert key == cache.key(Backtester(data_source=data), MovingAverage(short_window=5, long_window=20), False, None)
+    assert key != cache.key(backtester, MovingAverage(short_window=5, long_window=30), False, None)
+    assert key != cache.key(Backtester(data_source=data, transaction_cost=0.01), strategy, False, None)
+    assert key != cache.key(backtester, strategy, True, 0.1)
+
+    backtester.run(strategy)
+    entry_size = os.path.getsize(cache.path(key))
+    cache.max_bytes = 2 * entry_size + entry_size // 2
+    keys = [key]
+    for long_window in (30, 40):
+        backtester.run(MovingAverage(short_window=5, long_window=long_window))
+        keys.append(cache.key(backtester, MovingAverage(short_window=5, long_window=long_window), False, None))
+        if long_window == 30:
+            # La première entrée, plus ancienne, redevient la plus récemment utilisée après une lecture
+            os.utime(cache.path(keys[0]), ns=(0, 0))
+            os.utime(cache.path(keys[1]), ns=(10 ** 9, 10 ** 9))
+            assert cache.get(keys[0]) is not None
+    assert [os.path.exists(cache.path(key)) for key in keys] == [True, False, True]
+
+def test_cache_key_ignores_runtime_state(tmp_path):
+    # Vérifie que l'état modifié par run (itérations du schéma de pondération) ne change pas la clé d'un backtest relancé.
+    data = make_prices()
+    cache = ResultCache(str(tmp_path))
+    weighting = EqualRiskContribution(window=20)
+    strategy = MovingAverage(short_window=5, long_window=20)
+    backtester = Backtester(data_source=data, weight_scheme=weighting, result_cache=cache)
+    key = cache.key(backtester, strategy, False, None)
+    expected = backtester.run(strategy)
+    assert weighting.iterations > 0
+    assert cache.key(backtester, strategy, False, None) == key
+    assert key != cache.key(Backtester(data_source=data, weight_scheme=EqualRiskContribution(window=30)),
+                            strategy, False, None)
+
+    backtester.calculate_composition_matrix = lambda *args, **kwargs: pytest.fail("Le cache n'a pas été utilisé.")
+    result = backtester.run(strategy)
+    np.testing.assert_array_equal(result.portfolio_returns, expected.portfolio_returns)
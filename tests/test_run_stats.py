@@ -0,0 +1,44 @@
+import pickle
+import time
+import pytest
+from backtesting_framework.Core.Backtester import Backtester
+from backtesting_framework.Core.RunStats import RunStats
+from backtesting_framework.Strategies.MeanReversion import MeanReversion
+from tests.test_backtester import make_random_prices
+
+def test_stages_are_exclusive_and_hooks_called():
+    # Vérifie que la durée d'une étape exclut ses étapes imbriquées et que les fonctions d'écoute sont appelées.
+    events = []
+    stats = RunStats(hooks=[lambda event, name, value: events.append((event, name))])
+    with stats.stage("outer"):
+        with stats.stage("inner"):
+            time.sleep(0.02)
+    assert stats.timings["outer"] < stats.timings["inner"]
+    assert events == [("stage_start", "outer"), ("stage_start", "inner"), ("stage_end", "inner"),
+                      ("stage_end", "outer")]
+
+    square = stats.timed("square", lambda x: x * x)
+    assert [square(x) for x in range(5)] == [0, 1, 4, 9, 16]
+    assert stats.counters["square"] == 5
+    assert stats.histogram("square").sum() == 5
+    summary = stats.summary()
+    assert summary.loc["square", "count"] == 5
+    assert summary.loc[["outer", "inner"], "share"].sum() == pytest.approx(1.0)
+
+    # Les fonctions d'écoute ne sont pas sauvegardées
+    assert pickle.loads(pickle.dumps(stats)).hooks == []
+
+def test_backtester_run_stats_silent(capsys):
+    # Vérifie les étapes et le comptage des appels de get_position d'un backtest en mode silencieux.
+    calls = []
+    backtester = Backtester(data_source=make_random_prices(periods=120), verbose=False,
+                            hooks=[lambda event, name, value: calls.append(name) if event == "call" else None])
+    result = backtester.run(MeanReversion(window=20, zscore_threshold=1))
+    assert capsys.readouterr().out == ""
+
+    stats = result.run_stats
+    for stage in ("data_load", "calendar", "composition", "weights", "returns", "trade_evaluation", "metrics"):
+        assert stats.timings[stage] >= 0
+    rebalancing_count = sum(date in backtester.calendar.rebalancing_dates for date in backtester.data.index[1:])
+    assert stats.counters["MeanReversion.get_position"] == rebalancing_count * backtester.data.shape[1]
+    assert calls.count("MeanReversion.get_position") == stats.counters["MeanReversion.get_position"]
@@ -0,0 +1,86 @@
+import tracemalloc
+import numpy as np
+import pandas as pd
+from backtesting_framework.Core.Backtester import Backtester
+from backtesting_framework.Core.SparseWeights import SparseWeights
+from backtesting_framework.Strategies.MovingAverage import MovingAverage
+from backtesting_framework.Strategies.Size import Size
+from backtesting_framework.Utils.MarketSimulator import MarketSimulator
+
+def make_weights():
+    index = pd.bdate_range("2022-01-03", periods=8)
+    return pd.DataFrame([[0, 0, 0], [.5, .5, 0], [.5, .5, 0], [0, .3, .7], [0, .3, .7], [0, .3, .7],
+                         [1, 0, 0], [1, 0, 0]], index=index, columns=["A", "B", "C"], dtype="float64")
+
+def test_round_trip_and_events():
+    # Vérifie que seules les dates de changement sont stockées et que la matrice dense est reconstruite à l'identique.
+    weights = make_weights()
+    sparse_weights = SparseWeights.from_dense(weights)
+    assert sparse_weights.event_rows.tolist() == [1, 3, 6]
+    pd.testing.assert_frame_equal(sparse_weights.to_dense(), weights, check_freq=False)
+
+    from_events = SparseWeights.from_events(weights.index[[1, 1, 3, 3, 6]], ["A", "B", "B", "C", "A"],
+                                            [.5, .5, .3, .7, 1.0], weights.index, weights.columns)
+    pd.testing.assert_frame_equal(from_events.to_dense(), weights, check_freq=False)
+
+def test_shift_slice_and_turnover():
+    # Vérifie le décalage, la restriction aux dernières dates et la rotation contre leurs équivalents denses.
+    weights = make_weights()
+    sparse_weights = SparseWeights.from_dense(weights)
+    pd.testing.assert_frame_equal(sparse_weights.shift(1).to_dense(), weights.shift(1).fillna(0), check_freq=False)
+    for start in (0, 3, 4):
+        pd.testing.assert_frame_equal(sparse_weights.slice(start).to_dense(), weights.iloc[start:], check_freq=False)
+    pd.testing.assert_series_equal(sparse_weights.turnover(), weights.diff().abs().sum(axis=1), check_freq=False)
+
+    returns = pd.DataFrame(np.random.default_rng(0).normal(size=weights.shape), index=weights.index,
+                           columns=weights.columns)
+    np.testing.assert_allclose(sparse_weights.portfolio_returns(returns), (weights * returns).sum(axis=1))
+
+def test_memory_footprint():
+    # Vérifie qu'un backtest de 20 ans sur 3 000 actifs, rebalancé chaque mois sur 10 actifs, tient en quelques Ko.
+    index = pd.bdate_range("2000-01-03", periods=5040)
+    columns = pd.Index([f"Asset{i}" for i in range(3000)])
+    rng = np.random.default_rng(0)
+    event_dates = index[::21].repeat(10)
+    assets = columns[np.concatenate([rng.choice(3000, 10, replace=False) for _ in range(len(index[::21]))])]
+    sparse_weights = SparseWeights.from_events(event_dates, assets, np.full(len(assets), 0.1), index, columns)
+    assert sparse_weights.nbytes < 100_000
+    assert sparse_weights.shape == (5040, 3000)
+
+def test_backtester_sparse_matches_dense():
+    # Vérifie que le stockage creux donne les mêmes rendements et statistiques de trades que le stockage dense.
+    rng = np.random.default_rng(1)
+    data = pd.DataFrame(100 * np.cumprod(1 + rng.normal(0, 0.01, size=(400, 10)), axis=0),
+                        index=pd.bdate_range("2020-01-01", periods=400), columns=[f"Asset{i}" for i in range(10)])
+    results = []
+    for sparse_weights in (False, True):
+        backtester = Backtester(data_source=data, transaction_cost=0.001, special_start=5,
+                                sparse_weights=sparse_weights)
+        results.append(backtester.run(MovingAverage(short_window=5, long_window=20)))
+    assert isinstance(backtester.weight_matrix, SparseWeights)
+    np.testing.assert_allclose(results[1].portfolio_returns, results[0].portfolio_returns, atol=1e-15)
+    assert results[0].total_trades > 0
+    assert results[1].total_trades == results[0].total_trades
+    assert results[1].winning_trades == results[0].winning_trades
+
+def test_backtester_sparse_memory_peak():
+    # Vérifie qu'un backtest creux (10 positions parmi 300 actifs, rebalancement mensuel) ne construit pas
+    # de matrices denses de composition, de pondérations ou de rendements : son pic de mémoire reste de l'ordre
+    # des signaux de la stratégie, et les résultats sont ceux du stockage dense.
+    data = MarketSimulator(n_assets=300, n_days=500, seed=0).prices()
+    strategy = Size(window=20, assets_picked_long=5, assets_picked_short=5)
+    strategy.fit(data * 1e6)
+    results, peaks = [], []
+    for sparse_weights in (False, True):
+        backtester = Backtester(data_source=data, rebalancing_frequency="monthly", sparse_weights=sparse_weights,
+                                verbose=False)
+        backtester.asset_returns
+        tracemalloc.start()
+        try:
+            results.append(backtester.run(strategy))
+            peaks.append(tracemalloc.get_traced_memory()[1])
+        finally:
+            tracemalloc.stop()
+    np.testing.assert_array_equal(results[1].portfolio_returns, results[0].portfolio_returns)
+    assert results[1].total_trades == results[0].total_trades
+    assert peaks[1] < 4 * data.to_numpy().nbytes < peaks[0]
@@ -1,7 +1,10 @@
 import pytest
 import pandas as pd
 import os
-from backtesting_framework.Utils.Tools import load_data
+import numpy as np
+from backtesting_framework.Utils.Tools import (append_pickle, data_fingerprint, from_record_batch, iter_pickle,
+                                              load_data, load_panel, object_fingerprint, read_arrow, to_record_batch,
+                                              truncate_pickle, write_arrow)
 
 def test_load_data_dataframe():
     # Vérifie que la fonction load_data retourne le même DataFrame lorsqu'elle reçoit un DataFrame en entrée.
@@ -70,3 +73,90 @@ def test_load_data_invalid_source():
     # Vérifie que la fonction load_data lève une erreur lorsqu'elle reçoit une source non valide.
     with pytest.raises(ValueError, match="Le format de données n'est pas supporté"):
         load_data(12345)  # Entrée invalide (ni fichier ni DataFrame)
+
+def test_load_panel_does_not_mutate_source():
+    # Vérifie que load_panel convertit les valeurs Bloomberg en NaN sans modifier le DataFrame d'origine.
+    sample_dataframe = pd.DataFrame(
+        {
+            "A": [1.0, "#N/A N/A", 3.0],
+            "B": [4.0, 5.0, 6.0]
+        },
+        index=pd.date_range("2022-01-01", periods=3)
+    )
+    result = load_panel(sample_dataframe, dtype="float32")
+    assert (result.dtypes == "float32").all()
+    assert pd.isna(result.iloc[1, 0])
+    assert sample_dataframe.iloc[1, 0] == "#N/A N/A"
+
+def test_load_panel_returns_numeric_dataframe_without_copy():
+    # Vérifie qu'un DataFrame déjà au bon type est retourné sans copie.
+    sample_dataframe = pd.DataFrame({"A": [1.0, 2.0], "B": [3.0, 4.0]},
+                                    index=pd.date_range("2022-01-01", periods=2))
+    assert load_panel(sample_dataframe) is sample_dataframe
+
+def test_load_panel_csv_parses_bloomberg_na():
+    # Vérifie que les valeurs Bloomberg sont interprétées comme NaN dès la lecture du CSV.
+    csv_path = "sample_panel.csv"
+    with open(csv_path, "w") as f:
+        f.write("Dates,A,B\n2022-01-03,1.5,#N/A N/A\n2022-01-04,2.5,3.0\n")
+
+    try:
+        result = load_panel(csv_path)
+        assert (result.dtypes == "float64").all()
+        assert pd.isna(result.loc["2022-01-03", "B"])
+    finally:
+        os.remove(csv_path)  # Nettoyage du fichier temporaire
+
+def test_data_fingerprint():
+    # Vérifie que l'empreinte dépend du contenu et non de l'objet.
+    sample_dataframe = pd.DataFrame({"A": [1.0, 2.0], "B": [3.0, 4.0]},
+                                    index=pd.date_range("2022-01-01", periods=2))
+    modified = sample_dataframe.copy()
+    modified.iloc[0, 0] = 5.0
+    assert data_fingerprint(sample_dataframe) == data_fingerprint(sample_dataframe.copy())
+    assert data_fingerprint(sample_dataframe) != data_fingerprint(modified)
+
+def test_object_fingerprint():
+    # Vérifie que l'empreinte d'un objet dépend de sa classe et de ses attributs, hors attributs exclus.
+    class Parameters:
+        def __init__(self, window, panel):
+            self.window = window
+            self.panel = panel
+
+    panel = pd.DataFrame({"A": [1.0, 2.0]})
+    assert object_fingerprint(Parameters(5, panel)) == object_fingerprint(Parameters(5, panel.copy()))
+    assert object_fingerprint(Parameters(5, panel)) != object_fingerprint(Parameters(6, panel))
+    assert object_fingerprint(Parameters(5, panel), exclude=("panel",)) == \
+        object_fingerprint(Parameters(5, panel * 2), exclude=("panel",))
+
+def test_record_batch_zero_copy(tmp_path):
+    # Vérifie que la conversion Arrow aller-retour partage la mémoire des colonnes numériques.
+    frame = pd.DataFrame({"A": np.arange(4.0), "B": np.ones(4)}, index=pd.date_range("2022-01-01", periods=4))
+    batch = to_record_batch(frame)
+    assert batch.schema.names == ["date", "A", "B"]
+    assert np.shares_memory(batch.column("A").to_numpy(), frame["A"].to_numpy())
+
+    restored = from_record_batch(batch)
+    assert np.shares_memory(restored["B"].to_numpy(), batch.column("B").to_numpy())
+    pd.testing.assert_frame_equal(restored, frame.rename_axis("date"), check_freq=False)
+
+    write_arrow(batch, tmp_path / "frame.arrow")
+    pd.testing.assert_frame_equal(from_record_batch(read_arrow(tmp_path / "frame.arrow")),
+                                  frame.rename_axis("date"), check_freq=False)
+
+def test_truncate_pickle_after_interrupted_append(tmp_path):
+    # Vérifie qu'un enregistrement tronqué par une interruption est supprimé, et que les enregistrements
+    # ajoutés ensuite restent lisibles.
+    path = str(tmp_path / "journal.pkl")
+    assert truncate_pickle(path) == 0
+    for record in range(3):
+        append_pickle((record, np.arange(1000)), path)
+    size = os.path.getsize(path)
+    os.truncate(path, size - 100)
+    assert [record for record, _ in iter_pickle(path)] == [0, 1]
+
+    assert truncate_pickle(path) == 2
+    append_pickle((3, np.arange(1000)), path)
+    assert [record for record, _ in iter_pickle(path)] == [0, 1, 3]
+    assert truncate_pickle(path) == 3
+    assert os.path.getsize(path) == size
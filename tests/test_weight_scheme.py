@@ -0,0 +1,79 @@
+import numpy as np
+import pandas as pd
+import pytest
+from backtesting_framework.Core.Backtester import Backtester
+from backtesting_framework.Core.WeightScheme import (
+    CappedMarketCapWeight, EqualRiskContribution, EqualWeight, InverseVolatilityWeight, get_weight_scheme
+)
+
+def make_backtester(weight_scheme, periods=120, market_caps=None):
+    rng = np.random.default_rng(0)
+    volatilities = np.array([0.005, 0.01, 0.02, 0.04])
+    returns = rng.normal(0, volatilities, size=(periods, len(volatilities)))
+    prices = pd.DataFrame(100 * np.cumprod(1 + returns, axis=0), columns=["A", "B", "C", "D"],
+                          index=pd.bdate_range("2022-01-03", periods=periods))
+    return Backtester(data_source=prices, weight_scheme=weight_scheme, rebalancing_frequency="monthly",
+                      market_cap_source=market_caps(prices) if market_caps else None)
+
+def make_composition(backtester, row=(1.0, 1.0, -1.0, 1.0)):
+    return pd.DataFrame([row] * len(backtester.data), index=backtester.data.index,
+                        columns=backtester.data.columns)
+
+def test_get_weight_scheme():
+    # Vérifie la résolution des schémas par leur nom ou par instance, et l'erreur sur un nom inconnu.
+    assert isinstance(get_weight_scheme("EqualWeight"), EqualWeight)
+    scheme = InverseVolatilityWeight(window=20)
+    assert get_weight_scheme(scheme) is scheme
+    with pytest.raises(ValueError, match="Schéma de pondération inconnu : Unknown"):
+        get_weight_scheme("Unknown")
+
+def test_asset_returns_cached():
+    # Vérifie que les rendements des actifs ne sont calculés qu'une seule fois.
+    backtester = make_backtester("EqualWeight")
+    assert backtester.asset_returns is backtester.asset_returns
+
+def test_capped_market_cap_weight():
+    # Vérifie que le plafond est respecté et que l'excédent est redistribué.
+    weights = CappedMarketCapWeight.cap_weights(np.array([[0.7, 0.2, 0.1], [0.5, 0.5, 0.0]]), cap=0.4)
+    np.testing.assert_allclose(weights, [[0.4, 0.4, 0.2], [0.4, 0.4, 0.0]])
+
+    backtester = make_backtester(CappedMarketCapWeight(cap=0.3),
+                                 market_caps=lambda prices: prices * [10.0, 1.0, 1.0, 1.0])
+    weights = backtester.calculate_weight_matrix(make_composition(backtester))
+    assert (weights.abs() <= 0.3 + 1e-12).all().all()
+    np.testing.assert_allclose(weights.abs().sum(axis=1), 1.0)
+
+def test_inverse_volatility_weight():
+    # Vérifie que les poids sont proportionnels à l'inverse de la volatilité et figés entre deux rebalancements.
+    backtester = make_backtester(InverseVolatilityWeight(window=20))
+    composition = make_composition(backtester)
+    weights = backtester.calculate_weight_matrix(composition)
+
+    date = sorted(backtester.calendar.rebalancing_dates)[2]
+    volatility = backtester.asset_returns.loc[:date].iloc[-20:].std()
+    expected = np.sign(composition.loc[date]) * (1 / volatility) / (1 / volatility).sum()
+    np.testing.assert_allclose(weights.loc[date], expected)
+    assert weights.loc[date:].iloc[1].equals(weights.loc[date])
+
+def test_equal_risk_contribution():
+    # Vérifie que les contributions au risque sont égales et que le démarrage à chaud réduit les itérations.
+    scheme = EqualRiskContribution(window=40)
+    backtester = make_backtester(scheme)
+    composition = make_composition(backtester)
+    weights = backtester.calculate_weight_matrix(composition)
+
+    date = sorted(backtester.calendar.rebalancing_dates)[3]
+    position = backtester.data.index.get_loc(date)
+    signed_returns = backtester.asset_returns.iloc[position - 39:position + 1] * composition.loc[date]
+    covariance = np.cov(signed_returns.to_numpy(), rowvar=False)
+    w = weights.loc[date].abs().to_numpy()
+    contributions = w * (covariance @ w)
+    np.testing.assert_allclose(contributions, contributions.mean(), rtol=1e-6)
+    np.testing.assert_allclose(weights.abs().sum(axis=1).iloc[40:], 1.0)
+
+    cold = EqualRiskContribution(window=40)
+    solution = cold.solve(covariance, np.full(4, 0.25), np.ones(4))
+    warm = EqualRiskContribution(window=40)
+    warm.solve(covariance, np.full(4, 0.25), solution)
+    np.testing.assert_allclose(solution, w, rtol=1e-6)
+    assert warm.iterations < cold.iterations